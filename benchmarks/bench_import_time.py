@@ -0,0 +1,87 @@
+"""bench_import_time.py
+
+Import-time regression benchmark for the dataanalysistoolkit package.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter,
+reports the cumulative import time of the package and the slowest modules it
+imported, and fails if the package pulls in a heavy dependency eagerly or
+takes longer than a time budget to import.
+
+Usage:
+    python benchmarks/bench_import_time.py [--module NAME] [--max-ms MS]
+        [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "matplotlib",
+    "seaborn",
+    "sklearn",
+    "scipy",
+    "sqlalchemy",
+    "requests",
+    "nltk",
+)
+
+
+def measure(module):
+    """
+    Import `module` in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        dict: Maps each imported module name to its cumulative import time in
+        microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ),
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="dataanalysistoolkit")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail if the import takes longer than this.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda timings: timings[args.module])
+    total_ms = best[args.module] / 1000
+
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.repeat})")
+    print(f"slowest {args.top} modules (cumulative):")
+    for name, micros in sorted(best.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+    failures = []
+    eager = sorted(name for name in best if name.split(".")[0] in HEAVY_MODULES)
+    if eager:
+        failures.append("heavy modules imported eagerly: " + ", ".join(
+            sorted({name.split(".")[0] for name in eager})))
+    if args.max_ms is not None and total_ms > args.max_ms:
+        failures.append(f"import took {total_ms:.1f} ms, budget is {args.max_ms} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""bench_toolkit_construction.py
+
+Benchmark the cost of constructing a DataAnalysisToolkit.
+
+Helpers such as the visualizer and report generator are created on first
+access. This script compares constructing the toolkit on its own, as a
+statistics-only batch job does, with constructing it and then touching every
+helper, which is what the constructor used to do eagerly.
+
+Usage:
+    python benchmarks/bench_toolkit_construction.py [path_to_csv] [repeat]
+"""
+
+import os
+import sys
+import timeit
+
+from dataanalysistoolkit import DataAnalysisToolkit
+
+DEFAULT_CSV = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "data", "gen_test.csv"
+)
+
+
+def construct_lazy(filename):
+    """Construct the toolkit without touching any helper."""
+    return DataAnalysisToolkit(filename)
+
+
+def construct_eager(filename):
+    """Construct the toolkit and build every helper, as before."""
+    toolkit = DataAnalysisToolkit(filename)
+    _ = (
+        toolkit.visualizer,
+        toolkit.imputer,
+        toolkit.preprocessor,
+        toolkit.feature_engineer,
+        toolkit.report_generator,
+    )
+    return toolkit
+
+
+def main():
+    filename = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    # Warm up imports and the OS file cache so both runs measure the same work.
+    construct_eager(filename)
+
+    lazy = min(timeit.repeat(lambda: construct_lazy(filename), number=1, repeat=repeat))
+    eager = min(timeit.repeat(lambda: construct_eager(filename), number=1, repeat=repeat))
+
+    print(f"file:  {filename}")
+    print(f"lazy:  {lazy * 1000:8.3f} ms")
+    print(f"eager: {eager * 1000:8.3f} ms")
+    print(f"saved: {(eager - lazy) * 1000:8.3f} ms per construction "
+          f"({eager / lazy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,13 +30,26 @@ __email__ = 'thaddeus@vcwtech.com'
 import logging
 import sys
 
-# Convenience imports for users
-from .data_analysis_toolkit import DataAnalysisToolkit
-from .model import FeatureEngineer, ModelEvaluator
-from .preprocessor import DataPreprocessor, DataImputer, DataFormatter
-from .generators import ReportGenerator, CSVDataGenerator
-from .integrators import DataIntegrator
-from .visualizer import DataVisualizer
+from ._lazy import attach
+
+# Convenience imports for users. They are resolved on first access so that
+# importing the package does not pull in matplotlib, scikit-learn and friends.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "DataAnalysisToolkit": ".data_analysis_toolkit",
+        "PartitionedDataAnalysisToolkit": ".partitioned_toolkit",
+        "DataImputer": ".preprocessor",
+        "DataFormatter": ".preprocessor",
+        "DataPreprocessor": ".preprocessor",
+        "DataVisualizer": ".visualizer",
+        "FeatureEngineer": ".model",
+        "ModelEvaluator": ".model",
+        "ReportGenerator": ".generators",
+        "CSVDataGenerator": ".generators",
+        "DataIntegrator": ".integrators",
+    },
+)
 
 # Dependency checks
 required_packages = {
@@ -105,11 +118,11 @@ missing_packages = []
 if missing_packages:
     sys.exit("Missing required packages: " + ', '.join(missing_packages))
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Libraries should not configure logging; leave that to the application.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-logger.info("Initializing DataAnalysisToolkit package")
+logger.debug("Initializing DataAnalysisToolkit package")
 
 # Initialization code that runs on package import, if any
 def _init_package():
@@ -117,17 +130,3 @@ def _init_package():
     logger.debug("Package initialized successfully")
 
 _init_package()
-
-# Ensure that this module only exposes the intended public interface
-__all__ = [
-    "DataAnalysisToolkit",
-    "DataImputer",
-    "DataFormatter",
-    "DataPreprocessor",
-    "DataVisualizer",
-    "FeatureEngineer",
-    "ModelEvaluator",
-    "ReportGenerator",
-    "CSVDataGenerator",
-    "DataIntegrator",
-]
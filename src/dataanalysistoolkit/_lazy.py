@@ -0,0 +1,49 @@
+"""_lazy.py
+
+Helpers for deferring submodule imports until an attribute is first used.
+
+Several submodules pull in heavy dependencies (matplotlib, seaborn,
+scikit-learn, SQLAlchemy, nltk) at import time. Package `__init__` modules use
+`attach` to expose their public names through a module-level `__getattr__`
+(PEP 562), so `import dataanalysistoolkit` stays cheap and each dependency is
+only imported when the class that needs it is first accessed.
+
+Example usage:
+
+    # In a package __init__.py
+    __getattr__, __dir__, __all__ = attach(
+        __name__, {"DataVisualizer": ".data_visualizer"}
+    )
+"""
+
+import importlib
+
+
+def attach(package_name, attributes):
+    """
+    Build `__getattr__`, `__dir__` and `__all__` for a lazily loaded package.
+
+    Args:
+        package_name (str): The `__name__` of the package being set up.
+        attributes (dict): Maps each public attribute name to the module,
+          relative to the package, that defines it.
+
+    Returns:
+        tuple: The `__getattr__` and `__dir__` functions and the `__all__`
+        list to assign in the package namespace.
+    """
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(attributes[name], package_name)
+        value = getattr(module, name)
+        # Cache on the package so later lookups bypass __getattr__ entirely.
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(attributes))
+
+    return __getattr__, __dir__, list(attributes)
@@ -23,9 +23,22 @@ Example usage:
     outliers = analyzer.detect_outliers('column_name')
     print(outliers)
 
+    # Calculate the same statistics for every numeric column in one batch.
+    all_statistics = analyzer.calculate_budget_statistics()
+
+    # Flag outliers in every numeric column at once with a robust z-score.
+    outlier_mask = analyzer.detect_outliers(method='mad')
+
     # Handle missing values in a column.
     analyzer.handle_missing_values('column_name', strategy='fill', fill_value=0)
 
+    # Handle missing values in many columns in one pass.
+    analyzer.handle_missing_values({'id': DROP, 'price': 0, 'city': 'unknown'})
+
+    # Shrink int64, float64 and object columns to smaller types.
+    report = analyzer.optimize_memory()
+    print(report['bytes_saved'].sum())
+
     # Drop duplicate rows in the DataFrame.
     analyzer.drop_duplicates()
 
@@ -41,6 +54,20 @@ Example usage:
     # Export the data to a CSV file.
     analyzer.export_data('new_file.csv')
 
+    # Parse a large file once and read the cached columnar copy afterwards.
+    cache = DataCache('path_to_cache_dir')
+    analyzer = DataAnalysisToolkit('path_to_your_file.csv', cache=cache)
+
+    # Stream a file that does not fit in memory in bounded-size chunks.
+    streamer = DataAnalysisToolkit('path_to_large_file.csv', chunksize=100_000)
+    summary = streamer.get_summary_statistics()
+    p50, p95, p99 = streamer.approximate_quantiles('column_name')
+    profile = streamer.profile_data(top_k=5)
+    outliers = streamer.detect_outliers('column_name')
+    streamer.export_data('copy_of_large_file.csv')
+    streamer.drop_duplicates(subset=['id'], output='deduplicated.csv')
+    streamer.export_data('large_file.parquet', compression='zstd')
+
 Returns:
     None: This class is used for its side effects of loading, cleaning,
     transforming, and analyzing data, and potentially plotting results.
@@ -52,17 +79,40 @@ Raises:
     values.
 """
 
+import enum
+import os
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.stats import trim_mean, zscore
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+from pandas.core.dtypes.cast import find_common_type
 
-# Importing modules from the project's subdirectories
-from .generators import ReportGenerator
-from .model import FeatureEngineer, ModelEvaluator
-from .preprocessor import DataPreprocessor, DataImputer, DataFormatter
-from .visualizer import DataVisualizer
+# matplotlib, scipy, scikit-learn and the helper subpackages are imported
+# inside the methods that need them, so that loading this module, and running
+# statistics-only workloads, does not pay for them.
+# pylint: disable=import-outside-toplevel
+
+from .statistical_analysis.descriptive import budget_statistics
+from .statistical_analysis.outliers import DEFAULT_THRESHOLDS, detect_outliers
+from .statistical_analysis.profiler import DatasetProfiler
+from .statistical_analysis.quantile_sketch import KLLSketch
+
+PLOT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), ".conf", "plot_config.json")
+
+
+class _MissingValueAction(enum.Enum):
+    """
+    Actions of handle_missing_values that are not fill values.
+    """
+    DROP = "drop"
+
+    def __repr__(self):
+        return self.name
+
+
+# Marks a column whose rows with missing values are dropped in a
+# handle_missing_values mapping. Unlike the string 'drop', it cannot be
+# mistaken for a fill value.
+DROP = _MissingValueAction.DROP
 
 
 class DataAnalysisToolkit:
@@ -72,22 +122,66 @@ class DataAnalysisToolkit:
     engineering features, splitting data, and exporting data.
     """
 
-    def __init__(self, filename):
+    DROP = DROP
+
+    def __init__(self, filename, chunksize=None, cache=None, executor=None,
+                 optimize=False):
         """
-        __init__ _summary_
+        Initialize the toolkit with the path to a CSV file.
+
+        Helper objects such as the visualizer, imputer and report generator
+        are created on first access rather than here, so code that only
+        computes statistics never pays for the subsystems it does not use.
 
-        _extended_summary_
+        When `chunksize` is given the file is not loaded into memory. Instead
+        the toolkit runs in streaming mode and the statistics, outlier
+        detection and export methods read the file in chunks of at most
+        `chunksize` rows, so peak memory is set by the chunk size rather than
+        the file size. The exceptions are `calculate_budget_statistics` and
+        the 'iqr', 'mad' and 'isolation' outlier methods, which need order
+        statistics and so hold the requested columns, by default the numeric
+        ones, in memory. Methods that modify or split the data, such as
+        `handle_missing_values`, `encode_categorical_features`, `split_data`
+        and `optimize_memory`, need the whole file in memory and raise a
+        ValueError in streaming mode.
 
         Args:
-            filename (_type_): _description_
+            filename (str): The path to the CSV file.
+            chunksize (int, optional): Number of rows per chunk in streaming
+              mode. Default is None, which loads the whole file.
+            cache (DataCache, optional): On-disk cache of parsed files. When
+              given, the CSV is parsed once and later loads read the cached
+              columnar copy instead. Ignored in streaming mode.
+            executor (ColumnExecutor, optional): Pool that runs column-wise
+              work, such as outlier detection, budget statistics and
+              categorical encoding, in parallel across columns. Default is
+              None, which runs it serially.
+            optimize (bool, optional): Shrink the column types right after
+              loading; see `optimize_memory`. Ignored in streaming mode.
+              Default is False.
         """
-        self.data = self.load_data(filename)
-        self.visualizer = DataVisualizer(self.data, config_path='.conf/plot_config.json')
-        self.imputer = DataImputer(self.data)
-        self.preprocessor = DataPreprocessor(self.data)
-        self.feature_engineer = FeatureEngineer(self.data)
-        self.evaluator = ModelEvaluator(self.data, X_test, y_test)
-        self.report_generator = ReportGenerator(self.data)
+        self.filename = filename
+        self.chunksize = chunksize
+        self.executor = executor
+        self._reset_helpers()
+        self.invalidate_metadata()
+        self._evaluator = None
+        self._categorical_encoder = None
+        self.memory_report = None
+        self._data = None
+        if self.streaming:
+            self._check_source()
+            return
+        self.data = self.load_data(filename, cache=cache)
+        if optimize:
+            self.optimize_memory()
+
+    def _check_source(self):
+        """
+        Raise a ValueError if the file to stream does not exist.
+        """
+        if not os.path.isfile(self.filename):
+            raise ValueError(f"No such file or directory: '{self.filename}'")
 
     @property
     def data(self):
@@ -96,76 +190,534 @@ class DataAnalysisToolkit:
     @data.setter
     def data(self, new_data):
         self._data = new_data
+        # Helpers hold a reference to the old frame; rebuild them on demand.
+        self._reset_helpers()
+        self.invalidate_metadata()
+
+    def invalidate_metadata(self):
+        """
+        Discard the cached column metadata.
+
+        `dtypes`, `missing_values`, `numerical_columns` and
+        `categorical_columns` are computed once and cached until the data
+        changes. The toolkit's own mutators invalidate the cache; call this
+        after modifying `data` in place by other means.
+        """
+        self._metadata = {}
+
+    def _cached_metadata(self, key, compute):
+        """
+        Return the cached metadata entry `key`, computing it on a miss.
+        """
+        if key not in self._metadata:
+            self._metadata[key] = compute()
+        return self._metadata[key]
+
+    def _reset_helpers(self):
+        """
+        Drop the cached helper objects so they are rebuilt on next access.
+        """
+        self._visualizer = None
+        self._imputer = None
+        self._preprocessor = None
+        self._feature_engineer = None
+        self._report_generator = None
+
+    @property
+    def visualizer(self):
+        """
+        DataVisualizer: Plotting helper, created on first access.
+
+        Creating it loads the plot configuration and changes global matplotlib
+        state, so it is deferred until a plot is actually requested.
+        """
+        if self._visualizer is None:
+            from .visualizer import DataVisualizer
+            self._visualizer = DataVisualizer(self.data, config_path=PLOT_CONFIG_PATH)
+        return self._visualizer
+
+    @property
+    def imputer(self):
+        """DataImputer: Imputation helper, created on first access."""
+        if self._imputer is None:
+            from .preprocessor import DataImputer
+            self._imputer = DataImputer(self.data)
+        return self._imputer
+
+    @property
+    def preprocessor(self):
+        """DataPreprocessor: Preprocessing helper, created on first access."""
+        if self._preprocessor is None:
+            from .preprocessor import DataPreprocessor
+            self._preprocessor = DataPreprocessor(self.data)
+        return self._preprocessor
+
+    @property
+    def feature_engineer(self):
+        """FeatureEngineer: Feature engineering helper, created on first access."""
+        if self._feature_engineer is None:
+            from .model import FeatureEngineer
+            self._feature_engineer = FeatureEngineer(self.data)
+        return self._feature_engineer
+
+    @property
+    def report_generator(self):
+        """ReportGenerator: Report helper, created on first access."""
+        if self._report_generator is None:
+            from .generators import ReportGenerator
+            self._report_generator = ReportGenerator(self.data)
+        return self._report_generator
+
+    @property
+    def evaluator(self):
+        """
+        ModelEvaluator: The evaluator created by the last call to
+        `evaluate_model`, or None if no model has been evaluated yet.
+        """
+        return self._evaluator
+
+    def evaluate_model(self, model, X_test, y_test):
+        """
+        Create a ModelEvaluator for a trained model and keep it as
+        `self.evaluator`.
+
+        Args:
+            model (estimator): The trained model to evaluate.
+            X_test (array-like): The test features.
+            y_test (array-like): The true labels for the test data.
+
+        Returns:
+            ModelEvaluator: The evaluator for `model`.
+        """
+        from .model import ModelEvaluator
+        self._evaluator = ModelEvaluator(model, X_test, y_test)
+        return self._evaluator
+
+    @property
+    def categorical_encoder(self):
+        """
+        CategoricalEncoder: The vocabularies used by
+        `encode_categorical_features`, created on first access. Unlike the
+        other helpers it is kept when the data is replaced, so that new data
+        is encoded with the same codes.
+        """
+        if self._categorical_encoder is None:
+            from .preprocessor import CategoricalEncoder
+            self._categorical_encoder = CategoricalEncoder()
+        return self._categorical_encoder
+
+    @property
+    def streaming(self):
+        """bool: True if the data is read from disk in chunks."""
+        return self.chunksize is not None
 
     @property
     def shape(self):
+        if self.streaming:
+            return self._scan()["shape"]
         return self._data.shape
 
     @property
     def column_names(self):
-        return self._data.columns.tolist()
+        return self._header().tolist()
 
     @property
     def dtypes(self):
-        return self._data.dtypes
+        if self.streaming:
+            return self._scan()["dtypes"]
+        return self._cached_metadata("dtypes", lambda: self._data.dtypes)
 
     @property
     def missing_values(self):
-        return self._data.isnull().sum()
+        if self.streaming:
+            return self._scan()["missing_values"]
+        return self._cached_metadata("missing_values", lambda: self._data.isnull().sum())
 
     @property
     def numerical_columns(self):
-        return self._data.select_dtypes(include=["int64", "float64"]).columns.tolist()
+        return list(self._cached_metadata(
+            "numerical_columns",
+            # Every numeric width, so compact codes and downcast columns count.
+            lambda: self._schema().select_dtypes(include="number").columns.tolist(),
+        ))
 
     @property
     def categorical_columns(self):
-        return self._data.select_dtypes(include=["object"]).columns.tolist()
+        return list(self._cached_metadata(
+            "categorical_columns",
+            lambda: self._schema().select_dtypes(
+                include=["object", "category", "string"]
+            ).columns.tolist(),
+        ))
+
+    def _schema(self):
+        """
+        Return an empty DataFrame with the columns and types of the data.
+        """
+        if not self.streaming:
+            return self._data.iloc[:0]
+        return pd.DataFrame(
+            {col: pd.Series(dtype=dtype) for col, dtype in self.dtypes.items()},
+            columns=self.dtypes.index,
+        )
+
+    def _scan(self):
+        """
+        In streaming mode, read the file once for its shape, the type of
+        every column and the number of missing values, and cache them.
+
+        A column's type is the common type of its types in every chunk, e.g.
+        a column that parses as int64 in one chunk and float64 in another is
+        float64.
+        """
+        def compute():
+            rows, missing, dtypes = 0, None, {}
+            for chunk in self.iter_chunks():
+                rows += len(chunk)
+                counts = chunk.isnull().sum()
+                missing = counts if missing is None else missing + counts
+                for col, dtype in chunk.dtypes.items():
+                    dtypes[col] = dtype if col not in dtypes else find_common_type(
+                        [dtypes[col], dtype]
+                    )
+            columns = self._header()
+            return {
+                "shape": (rows, len(columns)),
+                "dtypes": pd.Series(
+                    [dtypes.get(col, np.dtype(object)) for col in columns],
+                    index=columns, dtype=object,
+                ),
+                "missing_values": (
+                    pd.Series(0, index=columns, dtype=np.int64) if missing is None
+                    else missing.reindex(columns)
+                ),
+            }
+        return self._cached_metadata("scan", compute)
+
+    def _header(self):
+        """
+        Return the column names of the data without reading its rows.
+        """
+        if not self.streaming:
+            return self._data.columns
+        return pd.read_csv(self.filename, nrows=0).columns
+
+    def _require_in_memory(self, operation):
+        """
+        Raise a ValueError if the toolkit is in streaming mode.
+        """
+        if self.streaming:
+            raise ValueError(
+                f"{operation} needs the data in memory; create the toolkit "
+                "without a chunksize to use it."
+            )
+
+    def optimize_memory(self, category_max_ratio=0.5, arrow_strings=True):
+        """
+        Shrink the column types of the data.
+
+        Integers are downcast to the smallest type that holds them, floats
+        to float32 where no value changes, low-cardinality strings become
+        `category` and other strings Arrow-backed strings when pyarrow is
+        installed. The report is also kept as `memory_report`.
+
+        Args:
+            category_max_ratio (float, optional): Maximum ratio of distinct to
+            non-missing values for a string column to become `category`.
+            Default is 0.5.
+            arrow_strings (bool, optional): Use Arrow-backed strings for the
+            other string columns. Default is True.
+
+        Returns:
+            DataFrame: The dtype and memory of each column before and after,
+            with the bytes saved.
+
+        Raises:
+            ValueError: In streaming mode.
+        """
+        self._require_in_memory("optimize_memory")
+        from .preprocessor import optimize_memory
+        self.data, self.memory_report = optimize_memory(
+            self._data, category_max_ratio=category_max_ratio, arrow_strings=arrow_strings
+        )
+        return self.memory_report
 
     @staticmethod
-    def load_data(filename):
+    def load_data(filename, chunksize=None, usecols=None, cache=None):
         """
         Load data from a CSV file into a DataFrame.
 
         Args:
             filename (str): The path to the CSV file.
+            chunksize (int, optional): If given, return an iterator that
+              yields DataFrames of at most this many rows instead of reading
+              the whole file. Default is None.
+            usecols (list of str, optional): Only read these columns.
+            cache (DataCache, optional): Cache to read the parsed file from,
+              or to store it in after parsing. Only used when the whole file
+              is loaded.
 
         Returns:
-            DataFrame: The loaded data.
+            DataFrame or TextFileReader: The loaded data, or a chunk iterator
+            when `chunksize` is given.
         """
         try:
-            df = pd.read_csv(filename)
+            if cache is not None and chunksize is None and usecols is None:
+                return cache.load(filename)
+            df = pd.read_csv(filename, chunksize=chunksize, usecols=usecols)
         except FileNotFoundError as exc:
             raise ValueError(f"No such file or directory: '{filename}'") from exc
         return df
 
-    def get_summary_statistics(self):
+    def iter_chunks(self, usecols=None):
+        """
+        Iterate over the data in chunks.
+
+        In streaming mode the CSV file is read lazily, one chunk at a time. In
+        memory, the whole DataFrame is yielded as a single chunk.
+
+        Args:
+            usecols (list of str, optional): Only read these columns.
+
+        Yields:
+            DataFrame: The next chunk of the data.
+        """
+        if not self.streaming:
+            yield self._data if usecols is None else self._data[usecols]
+            return
+        with self.load_data(
+            self.filename, chunksize=self.chunksize, usecols=usecols
+        ) as reader:
+            yield from reader
+
+    def _check_column(self, column_name):
+        """
+        Raise a ValueError if `column_name` is not a column of the data.
+        """
+        if column_name not in self._header():
+            raise ValueError(f"'{column_name}' not found in the dataframe.")
+
+    def _get_column(self, column_name):
+        """
+        Return a single column as a Series.
+
+        In streaming mode only the requested column is read from disk, chunk
+        by chunk, and concatenated, so memory use is bounded by the size of
+        that one column rather than of the file.
+        """
+        self._check_column(column_name)
+        if not self.streaming:
+            return self.data[column_name]
+        return pd.concat(
+            (chunk[column_name] for chunk in self.iter_chunks(usecols=[column_name])),
+            ignore_index=True,
+        )
+
+    def _streaming_moments(self, usecols=None):
+        """
+        Compute count, mean, sum of squared deviations, min and max for every
+        numeric column in one pass over the chunks.
+
+        Per-chunk results are combined with Chan's parallel update, so the
+        result matches a single pass over the full data.
+        """
+        moments = None
+        for chunk in self.iter_chunks(usecols=usecols):
+            moments = _merge_moments(moments, _chunk_moments(chunk))
+        return moments
+
+    def get_summary_statistics(self, sketch_k=200):
         """
         Get summary statistics for the DataFrame.
 
+        In streaming mode the count, mean, std, min and max of every numeric
+        column are accumulated chunk by chunk, and the quartiles are estimated
+        in bounded memory with a KLL quantile sketch.
+
+        Args:
+            sketch_k (int, optional): Accuracy parameter of the quantile
+            sketches used in streaming mode. Default is 200.
+
         Returns:
             DataFrame: A DataFrame with the summary statistics.
         """
-        return self.data.describe()
+        if not self.streaming:
+            return self.data.describe()
+        moments = None
+        sketches = {}
+        for chunk in self.iter_chunks():
+            moments = _merge_moments(moments, _chunk_moments(chunk))
+            for column in chunk.select_dtypes(include="number").columns:
+                sketch = sketches.setdefault(column, KLLSketch(k=sketch_k))
+                sketch.update_batch(chunk[column])
+        if moments is None:
+            return pd.DataFrame()
+        count = moments["count"]
+        quartiles = pd.DataFrame(
+            {column: sketch.quantiles([0.25, 0.5, 0.75]) or [np.nan] * 3
+             for column, sketch in sketches.items()},
+            index=["25%", "50%", "75%"],
+        ).T
+        summary = pd.DataFrame(
+            {
+                "count": count,
+                "mean": moments["mean"].where(count > 0),
+                "std": np.sqrt(moments["m2"] / (count - 1)).where(count > 1),
+                "min": moments["min"],
+                "25%": quartiles["25%"],
+                "50%": quartiles["50%"],
+                "75%": quartiles["75%"],
+                "max": moments["max"],
+            }
+        )
+        return summary.T
+
+    def approximate_quantiles(self, column_name, qs=(0.5, 0.95, 0.99), k=200):
+        """
+        Estimate quantiles of one or more columns in bounded memory.
+
+        Values are fed chunk by chunk into a KLL quantile sketch, so this
+        works on files far larger than memory in streaming mode.
+
+        Args:
+            column_name (str or list of str): The column, or columns, to
+            summarize.
+            qs (iterable of float, optional): Quantiles to estimate, each in
+            [0, 1]. Default is (0.5, 0.95, 0.99).
+            k (int, optional): Accuracy parameter of the sketch. Default is
+            200.
+
+        Returns:
+            Series or DataFrame: The estimated quantiles indexed by `qs`, with
+            one column per requested column when a list is given.
+        """
+        single = isinstance(column_name, str)
+        columns = [column_name] if single else list(column_name)
+        for column in columns:
+            self._check_column(column)
+        sketches = {column: KLLSketch(k=k) for column in columns}
+        for chunk in self.iter_chunks(usecols=columns):
+            for column, sketch in sketches.items():
+                sketch.update_batch(chunk[column])
+        qs = list(qs)
+        result = pd.DataFrame(
+            {column: sketch.quantiles(qs) or [np.nan] * len(qs)
+             for column, sketch in sketches.items()},
+            index=qs,
+        )
+        return result[column_name] if single else result
+
+    def profile_data(self, top_k=10, hll_precision=14):
+        """
+        Profile every column in a single pass over the data.
+
+        Null counts, min, max, mean and standard deviation are exact; the
+        number of distinct values is estimated with HyperLogLog and the most
+        frequent values are found with Space-Saving, both in bounded memory.
+        This replaces separate calls to `get_summary_statistics`,
+        `missing_values`, `dtypes` and `value_counts`, each of which scans the
+        data. To combine the profiles of several datasets, use
+        DatasetProfiler directly and merge the profilers.
+
+        Args:
+            top_k (int, optional): Frequent values to report per column.
+            Default is 10.
+            hll_precision (int, optional): HyperLogLog precision; the relative
+            error of the distinct counts is about 1.04 / sqrt(2**p). Default
+            is 14.
+
+        Returns:
+            DataFrame: One row per column; see DatasetProfiler.profile.
+        """
+        profiler = DatasetProfiler(top_k=top_k, hll_precision=hll_precision)
+        for chunk in self.iter_chunks():
+            profiler.update(chunk)
+        return profiler.profile()
 
-    def detect_outliers(self, column_name, method="zscore", threshold=3):
+    def detect_outliers(self, column_name=None, method="zscore", threshold=None,
+                        **kwargs):
         """
-        Detect outliers in a DataFrame using the specified method.
+        Detect outliers in one or more columns using the specified method.
+
+        All requested columns are scored together in one vectorized pass.
+        Missing values are ignored when computing the statistics and are
+        never flagged as outliers.
 
         Args:
-            column_name (str): The column to check for outliers.
-            method (str, optional): The method to use for outlier detection.
-            Default is 'zscore'.
+            column_name (str or list of str, optional): The column, or
+            columns, to check for outliers. Default is every numeric column.
+            method (str, optional): The method to use for outlier detection:
+            'zscore', 'iqr', 'mad' (robust z-score) or 'isolation'
+            (IsolationForest). Default is 'zscore'.
             threshold (float, optional): The threshold to use for outlier
-            detection. Default is 3.
+            detection. Default is 3 for 'zscore', 1.5 for 'iqr' and 3.5 for
+            'mad'.
+            **kwargs: Passed to IsolationForest when method is 'isolation'.
 
         Returns:
-            Series: A boolean Series where True indicates an outlier.
+            Series or DataFrame: A boolean Series where True indicates an
+            outlier when `column_name` is a single column, otherwise a boolean
+            DataFrame with one column per checked column.
+
+        Raises:
+            ValueError: If the method is unknown, a column is missing or, in
+              streaming mode with 'zscore', a column is not numeric.
+
+        Note:
+            In streaming mode 'zscore' reads the file in chunks, twice. The
+            other methods load the checked columns, and only those, into
+            memory.
         """
-        if method == "zscore":
-            z_scores = zscore(self.data[column_name])
-            return abs(z_scores) > threshold
-        else:
+        if method not in DEFAULT_THRESHOLDS:
             raise ValueError(f"Unknown method: '{method}'")
+        single = isinstance(column_name, str)
+        columns = [column_name] if single else column_name
+        if columns is None:
+            columns = self.numerical_columns
+
+        if not self.streaming:
+            mask = self._detect_outliers(self.data, columns, method, threshold, **kwargs)
+        elif method == "zscore":
+            # Streaming: one pass for the means and standard deviations, then
+            # a second pass that scores each chunk against them.
+            numerical = set(self.numerical_columns)
+            for column in columns:
+                self._check_column(column)
+                if column not in numerical:
+                    raise ValueError(f"'{column}' is not a numeric column.")
+            if threshold is None:
+                threshold = DEFAULT_THRESHOLDS[method]
+            moments = self._streaming_moments(usecols=columns).loc[columns]
+            mean = moments["mean"]
+            std = np.sqrt(moments["m2"] / moments["count"])
+            mask = pd.concat(
+                (chunk[columns] - mean).abs() / std > threshold
+                for chunk in self.iter_chunks(usecols=columns)
+            )
+        else:
+            # The other methods need order statistics of the full columns, so
+            # the requested columns, and only those, are read into memory.
+            for column in columns:
+                self._check_column(column)
+            frame = pd.concat(self.iter_chunks(usecols=columns), ignore_index=True)
+            mask = self._detect_outliers(frame, columns, method, threshold, **kwargs)
+        return mask[column_name] if single else mask
+
+    def _detect_outliers(self, frame, columns, method, threshold, **kwargs):
+        """
+        Score the columns of an in-memory frame, in parallel across batches
+        of columns if an executor is set.
+        """
+        if self.executor is None:
+            return detect_outliers(frame, columns, method=method, threshold=threshold, **kwargs)
+        if columns is None:
+            columns = frame.select_dtypes(include="number").columns.tolist()
+        return pd.concat(
+            self.executor.map_columns(
+                detect_outliers, frame, columns, method=method, threshold=threshold, **kwargs
+            ),
+            axis=1,
+        )
 
     def plot_data(self, column_name, plot_type="histogram"):
         """
@@ -180,7 +732,8 @@ class DataAnalysisToolkit:
             None
         """
         if plot_type == "histogram":
-            self.data[column_name].plot(kind="hist")
+            import matplotlib.pyplot as plt
+            self._get_column(column_name).plot(kind="hist")
             plt.title(f"Histogram of {column_name}")
             plt.xlabel(column_name)
             plt.ylabel("Frequency")
@@ -188,30 +741,42 @@ class DataAnalysisToolkit:
         else:
             raise ValueError(f"Unknown plot type: '{plot_type}'")
 
-    def calculate_budget_statistics(self, column_name, proportiontocut=0.2):
+    def calculate_budget_statistics(self, column_name=None, proportiontocut=0.2):
         """
         Calculate and return the mean, median, mode, and trimmed mean of a
         specified column from a CSV file.
 
+        Given a list of columns, or None for every numeric column, all four
+        statistics are computed together for every column in one batch: each
+        column is partitioned once for both the median and the trimmed mean.
+        Missing values are skipped in batch mode.
+
+        The median, mode and trimmed mean are exact and need whole columns, so
+        in streaming mode the analyzed columns, and only those, are loaded
+        into memory.
+
         Args:
-            column_name (str): The name of the column to analyze.
+            column_name (str or list of str, optional): The name of the
+            column, or columns, to analyze. Default is every numeric column.
             proportiontocut (float, optional): The proportion of values to
             remove from each end of the data before calculating the trimmed
             mean. Default is 0.2.
 
         Returns:
-            dict: A dictionary mapping the names of the measures to their
-            calculated values.
+            dict or DataFrame: For a single column, a dictionary mapping the
+            names of the measures to their calculated values. Otherwise a
+            DataFrame with one row per column and one column per measure.
         """
-        if column_name not in self.data.columns:
-            raise ValueError(f"'{column_name}' not found in the dataframe.")
+        if not isinstance(column_name, str):
+            return self._batch_budget_statistics(column_name, proportiontocut)
 
-        mean_value = self.data[column_name].mean()
-        median_value = self.data[column_name].median()
-        mode_value = self.data[column_name].mode()[0]
-        trmean_value = trim_mean(
-            self.data[column_name], proportiontocut=proportiontocut
-        )
+        column = self._get_column(column_name)
+
+        mean_value = column.mean()
+        median_value = column.median()
+        mode_value = column.mode()[0]
+        from scipy.stats import trim_mean
+        trmean_value = trim_mean(column, proportiontocut=proportiontocut)
 
         return {
             "mean": mean_value,
@@ -220,13 +785,43 @@ class DataAnalysisToolkit:
             "trimmed_mean": trmean_value,
         }
 
+    def _batch_budget_statistics(self, columns, proportiontocut):
+        """
+        Compute budget statistics for several columns at once.
+        """
+        if columns is None:
+            columns = self.numerical_columns
+        for column in columns:
+            self._check_column(column)
+        if self.streaming:
+            # Only the requested columns are materialized.
+            frame = pd.concat(self.iter_chunks(usecols=columns), ignore_index=True)
+        else:
+            frame = self.data
+        if self.executor is None:
+            return budget_statistics(frame, columns, proportiontocut=proportiontocut)
+        return pd.concat(self.executor.map_columns(
+            budget_statistics, frame, columns, proportiontocut=proportiontocut
+        ))
+
     def handle_missing_values(self, column_name, strategy="drop", fill_value=None):
         """
-        Handle missing values in a specified column of the DataFrame.
+        Handle missing values in one or more columns of the DataFrame.
+
+        All columns are handled in a single pass: the rows to drop are found
+        with one combined null mask over every dropped column, and every fill
+        is applied by a single `fillna` with a per-column mapping.
 
         Args:
-            column_name (str): The name of the column to handle missing values.
-            strategy (str, optional): The strategy to handle missing values.
+            column_name (str, list of str or dict): The column to handle, a
+                list of columns that all use `strategy`, or a mapping from
+                column name to its own strategy: the `DROP` marker, also
+                available as `DataAnalysisToolkit.DROP`, to drop the rows
+                with missing values, or the value to fill that column's
+                missing values with. Any other value, including the string
+                'drop', is a fill value.
+            strategy (str, optional): The strategy to handle missing values
+                when `column_name` is a str or a list.
                 'drop' to drop the rows with missing values,
                 'fill' to fill missing values with 'fill_value'.
                 Default is 'drop'.
@@ -235,22 +830,57 @@ class DataAnalysisToolkit:
 
         Returns:
             None
+
+        Raises:
+            ValueError: In streaming mode, or if the arguments are invalid.
+
+        Example:
+            analyzer.handle_missing_values({'id': DROP, 'price': 0, 'city': 'unknown'})
         """
-        if strategy == "drop":
-            self._data.dropna(subset=[column_name], inplace=True)
-        elif strategy == "fill":
-            if fill_value is None:
-                raise ValueError("fill_value must be provided when strategy is 'fill'.")
-            self._data[column_name].fillna(fill_value, inplace=True)
+        self._require_in_memory("handle_missing_values")
+        drop_columns, fills = self._missing_value_plan(column_name, strategy, fill_value)
+        self.data = _apply_missing_value_plan(self._data, drop_columns, fills)
+
+    def _missing_value_plan(self, column_name, strategy, fill_value):
+        """
+        Validate the arguments of `handle_missing_values` and return the
+        columns to drop on and the mapping of columns to fill values.
+        """
+        if isinstance(column_name, dict):
+            plan = column_name
         else:
-            raise ValueError(
-                f"Unknown strategy: '{strategy}'. Available strategies are 'drop' and 'fill'."
-            )
+            if strategy not in ("drop", "fill"):
+                raise ValueError(
+                    f"Unknown strategy: '{strategy}'. Available strategies are 'drop' and 'fill'."
+                )
+            if strategy == "fill" and fill_value is None:
+                raise ValueError("fill_value must be provided when strategy is 'fill'.")
+            columns = [column_name] if isinstance(column_name, str) else column_name
+            plan = dict.fromkeys(columns, DROP if strategy == "drop" else fill_value)
 
-    def drop_duplicates(self, subset=None, keep="first"):
+        drop_columns = [col for col, value in plan.items() if value is DROP]
+        fills = {col: value for col, value in plan.items() if value is not DROP}
+        for col in plan:
+            self._check_column(col)
+        if any(value is None for value in fills.values()):
+            raise ValueError("A fill value must be provided for every column to fill.")
+        return drop_columns, fills
+
+    def drop_duplicates(self, subset=None, keep="first", method="pandas", output=None,
+                        max_memory_hashes=10_000_000):
         """
         Drop duplicate rows in the DataFrame.
 
+        With `method='hash'` rows are compared by 64-bit hashes of the
+        `subset` columns, computed with vectorized hashing, and only rows
+        with a repeated hash are compared exactly. This is much faster than
+        pandas' row comparison for wide rows of strings.
+
+        In streaming mode the deduplicated rows of the file are written to
+        `output` chunk by chunk, remembering the hashes of the rows already
+        seen in a hash set that spills to disk past `max_memory_hashes`
+        entries. See StreamingDeduplicator.
+
         Args:
             subset (list-like, optional): Only consider certain columns for
             identifying duplicates. By default all of the columns are used.
@@ -258,16 +888,59 @@ class DataAnalysisToolkit:
             duplicates (if any) to keep. 'first' : Drop duplicates except for
             the first occurrence. 'last' : Drop duplicates except for the last
             occurrence. False : Drop all duplicates.
+            method ({'pandas', 'hash'}, default 'pandas'): How rows are
+            compared in memory.
+            output (str, optional): In streaming mode, the file to write the
+            deduplicated data to; its format is inferred from the extension.
+            Required in streaming mode.
+            max_memory_hashes (int, optional): In streaming mode, the number of
+            row hashes held in memory before spilling to disk.
 
         Returns:
             None
         """
+        if method not in ("pandas", "hash"):
+            raise ValueError(
+                f"Unknown method: '{method}'. Available methods are 'pandas' and 'hash'."
+            )
+        if self.streaming:
+            if output is None:
+                raise ValueError("output must be provided in streaming mode.")
+            if keep != "first":
+                raise ValueError("Only keep='first' is supported in streaming mode.")
+            from .interfaces import DataExporter
+            from .preprocessor import StreamingDeduplicator
+            with StreamingDeduplicator(subset, max_memory_hashes) as dedup:
+                DataExporter.for_path(output).write(
+                    dedup.iter_unique(self.iter_chunks()), output
+                )
+            return
+
+        if method == "hash":
+            from .preprocessor import duplicated_rows
+            duplicated = duplicated_rows(self._data, subset=subset, keep=keep)
+            if duplicated.any():
+                self.data = self._data[~duplicated]
+            return
         self._data.drop_duplicates(subset=subset, keep=keep, inplace=True)
+        self.invalidate_metadata()
 
-    def split_data(self, target_column, test_size=0.2, random_state=None):
+    def split_data(self, target_column, test_size=0.2, random_state=None,
+                   stratify=False, hash_column=None, return_indices=False):
         """
         Split the data into training and testing sets.
 
+        The split is computed on row positions rather than on the data, and
+        each output is then taken from the DataFrame with a single `iloc`, so
+        the frame is never copied whole before being split. For the same
+        `random_state` the rows are the same, and in the same order, as
+        calling `train_test_split` on the features and target.
+
+        With `hash_column` the split is deterministic by key instead of
+        random: each row goes to the test set if the hash of its key falls
+        below `test_size`. Rows sharing a key always land on the same side,
+        and a key keeps its side when rows are added or reordered.
+
         Args:
             target_column (str): The name of the target (dependent) column.
             test_size (float, optional): The proportion of the dataset to
@@ -275,37 +948,193 @@ class DataAnalysisToolkit:
             random_state (int, optional): Controls the shuffling applied to the
               data before applying the split. Pass an int for reproducible
               output across multiple function calls.
+            stratify (bool, optional): Keep the class proportions of the
+              target column in both sets. Default is False.
+            hash_column (str, optional): Split deterministically by the hash
+              of this column. Default is None.
+            return_indices (bool, optional): Return the row positions of the
+              two sets instead of the data, so that the features can be
+              materialized later, e.g. with `data.iloc[train_idx]`, or not at
+              all. Default is False.
 
         Returns:
             tuple: A tuple containing the training and testing data (X_train,
-            X_test, y_train, y_test).
+            X_test, y_train, y_test), or (train_idx, test_idx) arrays of row
+            positions if `return_indices` is True.
+
+        Raises:
+            ValueError: In streaming mode, if a column is not found, or if
+            both `stratify` and `hash_column` are given.
         """
-        X = self._data.drop(target_column, axis=1)
-        y = self._data[target_column]
-        return train_test_split(
-            X, y, test_size=test_size, random_state=random_state
+        self._require_in_memory("split_data")
+        self._check_column(target_column)
+        if hash_column is not None:
+            if stratify:
+                raise ValueError("stratify and hash_column cannot be combined.")
+            self._check_column(hash_column)
+            train_idx, test_idx = _hash_split(self._data[hash_column], test_size)
+        else:
+            from sklearn.model_selection import train_test_split
+            train_idx, test_idx = train_test_split(
+                np.arange(len(self._data)),
+                test_size=test_size,
+                random_state=random_state,
+                stratify=self._data[target_column] if stratify else None,
+            )
+        if return_indices:
+            return train_idx, test_idx
+
+        target = self._data.columns.get_loc(target_column)
+        features = np.delete(np.arange(self._data.shape[1]), target)
+        return (
+            self._data.iloc[train_idx, features],
+            self._data.iloc[test_idx, features],
+            self._data.iloc[train_idx, target],
+            self._data.iloc[test_idx, target],
         )
 
-    def encode_categorical_features(self):
+    def encode_categorical_features(self, columns=None, encoder=None):
         """
-        Encode categorical features in the DataFrame.
+        Encode categorical features in the DataFrame as integer codes.
+
+        Categories are mapped through `categorical_encoder`, which keeps each
+        column's vocabulary. Codes use the smallest integer type that fits
+        and missing values become -1. Categories seen for the first time are
+        appended to the vocabulary, so encoding a later batch, or calling this
+        again after loading new data, gives every known category the same
+        code as before.
+
+        Args:
+            columns (list of str, optional): Columns to encode. Defaults to
+              every categorical column.
+            encoder (CategoricalEncoder, optional): An encoder with saved
+              vocabularies to reuse. It replaces `categorical_encoder`.
 
         Returns:
-            None
+            CategoricalEncoder: The encoder holding the vocabularies.
+
+        Raises:
+            ValueError: In streaming mode.
         """
-        le = LabelEncoder()
-        for col in self.categorical_columns:
-            self._data[col] = le.fit_transform(self._data[col])
+        self._require_in_memory("encode_categorical_features")
+        if encoder is not None:
+            self._categorical_encoder = encoder
+        if columns is None:
+            columns = self.categorical_columns
+        self.data = self.categorical_encoder.transform(
+            self._data, columns, executor=self.executor
+        )
+        return self.categorical_encoder
 
-    def export_data(self, filename, index=False):
+    def export_data(self, filename, index=False, file_format=None, compression=None,
+                    partition_cols=None, workers=None):
         """
-        Export the data to a CSV file.
+        Export the data to a CSV, Parquet or Feather file.
+
+        The output is written to a temporary file and renamed into place, so
+        readers never see a partial export. Compressed CSV blocks are
+        formatted and compressed by a thread pool. In streaming mode the data
+        is copied one chunk at a time. See DataExporter for details.
 
         Args:
-            filename (str): The name of the file to export the data.
+            filename (str, path-like or file object): The name of the file
+              to export the data, or of the output directory when
+              `partition_cols` is given. A file object, such as an
+              `io.StringIO`, is written in place as uncompressed CSV.
             index (bool, optional): Write row names (index). Default is False.
+            file_format (str, optional): 'csv', 'parquet' or 'feather'.
+              Default is None, which infers the format, and the CSV
+              compression, from the extension of `filename`, e.g. '.parquet'
+              or '.csv.gz', and falls back to plain CSV.
+            compression (str, optional): Codec, such as 'gzip' for CSV or
+              'zstd' for Parquet. Default is the format's default.
+            partition_cols (list of str, optional): Write one file per
+              distinct value of these columns into a directory tree.
+            workers (int, optional): Number of compression threads. Default
+              is the number of CPUs.
 
         Returns:
             None
         """
-        self._data.to_csv(filename, index=index)
+        from .interfaces import DataExporter
+        options = {
+            "compression": compression,
+            "partition_cols": partition_cols,
+            "index": index,
+            "workers": workers,
+        }
+        if file_format is None:
+            exporter = DataExporter.for_path(filename, **options)
+        else:
+            exporter = DataExporter(file_format=file_format, **options)
+        exporter.write(self.iter_chunks(), filename)
+
+
+def _apply_missing_value_plan(data, drop_columns, fills):
+    """
+    Drop the rows with a missing value in any of `drop_columns`, using one
+    combined mask, then apply every fill with a single `fillna`.
+    """
+    if drop_columns:
+        keep = data[drop_columns].notna().all(axis=1)
+        if not keep.all():
+            data = data[keep]
+    if fills:
+        data = data.fillna(fills)
+    return data
+
+
+def _hash_split(keys, test_size):
+    """
+    Return the positions of the train and test rows of a deterministic split
+    on the 64-bit hash of `keys`.
+    """
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    # The top 53 bits of the hash, as a uniform float in [0, 1).
+    fractions = (hashes >> np.uint64(11)) * 2.0 ** -53
+    in_test = fractions < test_size
+    return np.flatnonzero(~in_test), np.flatnonzero(in_test)
+
+
+def _chunk_moments(frame):
+    """
+    Return the count, mean, sum of squared deviations (m2), min and max of
+    every numeric column in `frame`, one row per column.
+    """
+    numeric = frame.select_dtypes(include="number")
+    mean = numeric.mean()
+    return pd.DataFrame(
+        {
+            "count": numeric.count(),
+            "mean": mean,
+            "m2": ((numeric - mean) ** 2).sum(),
+            "min": numeric.min(),
+            "max": numeric.max(),
+        }
+    )
+
+
+def _merge_moments(left, right):
+    """
+    Combine two results of `_chunk_moments` using Chan's parallel formula.
+    """
+    if left is None:
+        return right
+    left, right = left.align(right, join="outer")
+    n_a = left["count"].fillna(0)
+    n_b = right["count"].fillna(0)
+    mean_a = left["mean"].fillna(0)
+    mean_b = right["mean"].fillna(0)
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    safe_n = n.where(n > 0, 1)
+    return pd.DataFrame(
+        {
+            "count": n,
+            "mean": mean_a + delta * n_b / safe_n,
+            "m2": left["m2"].fillna(0) + right["m2"].fillna(0)
+            + delta ** 2 * n_a * n_b / safe_n,
+            "min": np.fmin(left["min"], right["min"]),
+            "max": np.fmax(left["max"], right["max"]),
+        }
+    )
@@ -1,5 +1,13 @@
 # generators/__init__.py
 
-from .csv_data_generator import CSVDataGenerator
-from .generate_data import gen_data
-from .report_generator import ReportGenerator
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "CSVDataGenerator": ".csv_data_generator",
+        "gen_data": ".generate_data",
+        "ReportGenerator": ".report_generator",
+    },
+)
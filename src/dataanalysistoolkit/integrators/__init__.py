@@ -1,2 +1,5 @@
 # integrators/__init__.py
+from .concatenated_view import ConcatenatedView
 from .data_integrator import DataIntegrator
+from .partitioning import HashPartitioner
+from .source_loader import DataSource, load_sources
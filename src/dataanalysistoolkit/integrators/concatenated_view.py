@@ -0,0 +1,330 @@
+"""
+concatenated_view.py
+
+This module provides ConcatenatedView, a lazy concatenation of DataFrames.
+`pd.concat` builds the result while every input is still alive, so it needs
+about twice the memory of the data, and it falls back to object columns
+whenever the inputs disagree on a column's type. The view instead settles
+on one type per column up front and then copies the inputs one at a time:
+
+- Integer and float columns take the smallest type that holds every input,
+  e.g. int32 and int64 give int64 and int64 and float32 give float64.
+  Integer columns missing from some inputs become float64, as with
+  `pd.concat`.
+- Category columns, and string columns combined with category columns,
+  become a category column whose categories are the union of the inputs'.
+- Nullable extension types take the common type pandas chooses, e.g. Int64
+  and int64 give Int64, Int64 and float64 give Float64 and boolean and bool
+  give boolean.
+- Other mismatched columns become object columns.
+
+Inputs without rows do not take part in the unification unless every input
+with the column is empty, so an empty frame with object columns does not
+turn a datetime column into an object column.
+
+The view can be iterated chunk by chunk, written straight to a file, or
+materialized once into preallocated columns. With `release=True` the view
+drops each input as soon as it has been copied, so peak memory stays close
+to the size of the result.
+
+Example usage:
+
+    view = ConcatenatedView([df1, df2, df3], release=True)
+    del df1, df2, df3          # the view now holds the only references
+    combined = view.to_frame()
+
+    # or stream it to disk without building the result at all
+    ConcatenatedView(frames).write('combined.parquet')
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.core.dtypes.cast import find_common_type
+
+
+class ConcatenatedView:
+    """
+    Lazy, schema-unified concatenation of DataFrames.
+
+    Attributes:
+        release (bool): Whether inputs are dropped once they are consumed,
+          which makes the view single-use.
+        dtypes (Series): The unified type of every column.
+    """
+
+    def __init__(self, frames, release=False):
+        """
+        Initialize the view and unify the column types of `frames`.
+
+        Args:
+            frames (iterable of DataFrame): The DataFrames to concatenate, in
+              order.
+            release (bool, optional): Drop each input once it has been
+              consumed. Defaults to False.
+        """
+        self._frames = list(frames)
+        self.release = release
+        self._lengths = [len(df) for df in self._frames]
+        self.dtypes = _unify_schema(self._frames)
+        self._consumed = False
+
+    def __repr__(self) -> str:
+        return (
+            f"ConcatenatedView(frames={len(self._frames)}, rows={len(self)}, "
+            f"columns={len(self.dtypes)}, release={self.release})"
+        )
+
+    def __len__(self):
+        return sum(self._lengths)
+
+    @property
+    def columns(self):
+        """Index: The columns of the concatenation, in order of appearance."""
+        return self.dtypes.index
+
+    def iter_chunks(self, chunksize=None):
+        """
+        Iterate over the concatenation, one input or one chunk at a time.
+        Chunks are numbered consecutively, so their indexes do not overlap.
+
+        Args:
+            chunksize (int, optional): Split inputs into chunks of at most
+              this many rows. Defaults to None, one chunk per input.
+
+        Yields:
+            DataFrame: The next chunk, with the unified columns and types,
+            i.e. `dtypes`. An input without rows gives one empty chunk.
+
+        Raises:
+            ValueError: If the view has released its inputs already.
+        """
+        offset = 0
+        for frame in self._consume():
+            conformed = pd.DataFrame(
+                {col: _conform(frame, col, dtype) for col, dtype in self.dtypes.items()},
+                columns=self.columns,
+            )
+            del frame
+            step = chunksize or max(len(conformed), 1)
+            for start in range(0, max(len(conformed), 1), step):
+                chunk = conformed.iloc[start:start + step]
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+
+    def to_frame(self):
+        """
+        Materialize the concatenation.
+
+        Every column is allocated once at its final size and the inputs are
+        copied into it one after another.
+
+        Returns:
+            DataFrame: The concatenation, with a RangeIndex.
+        """
+        size = len(self)
+        columns = {col: _Column(dtype, size) for col, dtype in self.dtypes.items()}
+        offset = 0
+        for frame in self._consume():
+            for col, column in columns.items():
+                column.fill(offset, frame[col] if col in frame.columns else None, len(frame))
+            offset += len(frame)
+            del frame
+        return pd.DataFrame(
+            {col: column.result() for col, column in columns.items()},
+            index=pd.RangeIndex(size),
+            columns=self.columns,
+            copy=False,
+        )
+
+    def write(self, filename, chunksize=None, **kwargs):
+        """
+        Write the concatenation to a file without materializing it.
+
+        Args:
+            filename (str): The output path; its extension selects the
+              format, e.g. '.csv', '.csv.gz', '.parquet' or '.feather'.
+            chunksize (int, optional): Rows converted at a time.
+            **kwargs: Other DataExporter arguments.
+
+        Returns:
+            str: `filename`.
+        """
+        from ..interfaces import DataExporter  # pylint: disable=import-outside-toplevel
+        return DataExporter.for_path(filename, **kwargs).write(
+            self.iter_chunks(chunksize), filename
+        )
+
+    def _consume(self):
+        """
+        Yield the inputs in order, releasing each one if `release` is set.
+        """
+        if self._consumed:
+            raise ValueError("The view has already released its inputs.")
+        if self.release:
+            self._consumed = True
+        for i in range(len(self._frames)):
+            frame = self._frames[i]
+            if self.release:
+                self._frames[i] = None
+            yield frame
+
+
+class _Column:
+    """
+    A column of the result, allocated once and filled input by input.
+    """
+
+    def __init__(self, dtype, size):
+        self.dtype = dtype
+        self._pieces = None
+        if isinstance(dtype, pd.CategoricalDtype):
+            self._values = np.full(size, -1, dtype=_code_type(len(dtype.categories)))
+        elif isinstance(dtype, np.dtype):
+            self._values = np.empty(size, dtype=dtype)
+        else:
+            # Other extension types are concatenated from their pieces.
+            self._values = None
+            self._pieces = []
+
+    def fill(self, offset, values, length):
+        """
+        Copy one input's values, or missing values if it lacks the column.
+        """
+        if length == 0:
+            return
+        if self._pieces is not None:
+            self._pieces.append(_conform_values(values, length, self.dtype))
+            return
+        target = self._values[offset:offset + length]
+        if isinstance(self.dtype, pd.CategoricalDtype):
+            if values is not None:
+                target[:] = pd.Categorical(values, dtype=self.dtype).codes
+        elif values is None:
+            target[:] = _missing_value(self.dtype)
+        else:
+            target[:] = values.to_numpy(dtype=self.dtype)
+
+    def result(self):
+        """
+        Return the filled column.
+        """
+        if self._pieces is not None:
+            if not self._pieces:
+                return pd.array([], dtype=self.dtype)
+            return pd.concat(self._pieces, ignore_index=True).array
+        if isinstance(self.dtype, pd.CategoricalDtype):
+            return pd.Categorical.from_codes(self._values, dtype=self.dtype)
+        # A Series keeps object columns of e.g. Timestamps from being
+        # inferred as datetime columns by the DataFrame constructor.
+        return pd.Series(self._values, dtype=self.dtype, copy=False)
+
+
+def _unify_schema(frames):
+    """
+    Return the unified type of every column, in order of appearance.
+    """
+    columns = {}
+    for df in frames:
+        for col in df.columns:
+            columns.setdefault(col, None)
+    for col in columns:
+        having = [df for df in frames if col in df.columns]
+        missing = len(having) < len(frames) and any(
+            len(df) for df in frames if col not in df.columns
+        )
+        if any(len(df) for df in having):
+            having = [df for df in having if len(df)]
+        columns[col] = _unify_dtype(col, [df[col].dtype for df in having], missing, having)
+    return pd.Series(columns, dtype=object)
+
+
+def _unify_dtype(col, dtypes, missing, frames):
+    """
+    Return a type that holds every input's values of one column.
+    """
+    categorical = [dtype for dtype in dtypes if isinstance(dtype, pd.CategoricalDtype)]
+    if categorical and all(
+        isinstance(dtype, pd.CategoricalDtype) or _is_string_dtype(dtype) for dtype in dtypes
+    ):
+        if len(categorical) == len(dtypes) and all(dtype == dtypes[0] for dtype in dtypes):
+            return dtypes[0]
+        values = [
+            df[col].cat.categories if isinstance(df[col].dtype, pd.CategoricalDtype)
+            else pd.Index(df[col].dropna().unique())
+            for df in frames if col in df.columns
+        ]
+        categories = values[0].append(values[1:]).unique()
+        return pd.CategoricalDtype(categories)
+
+    if all(dtype == dtypes[0] for dtype in dtypes):
+        dtype = dtypes[0]
+    elif all(isinstance(dtype, np.dtype) and dtype.kind in "biufmM" for dtype in dtypes):
+        try:
+            dtype = np.result_type(*dtypes)
+        except TypeError:
+            # E.g. datetimes and numbers.
+            dtype = np.dtype(object)
+    else:
+        # Mixes of nullable extension types and NumPy types; anything
+        # without a common type gives object.
+        try:
+            dtype = find_common_type(dtypes)
+        except (TypeError, ValueError):
+            dtype = np.dtype(object)
+    if missing and isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            dtype = np.dtype(np.float64)
+        elif dtype.kind == "b":
+            dtype = np.dtype(object)
+    return dtype
+
+
+def _conform(frame, col, dtype):
+    """
+    Return one column of `frame` converted to `dtype`.
+    """
+    values = frame[col] if col in frame.columns else None
+    return _conform_values(values, len(frame), dtype).set_axis(frame.index)
+
+
+def _conform_values(values, length, dtype):
+    """
+    Convert `values` to `dtype`, or make `length` missing values if None.
+    """
+    if length == 0:
+        # Empty inputs may hold types that do not convert, e.g. datetimes.
+        return pd.Series([], dtype=dtype)
+    if values is None:
+        if isinstance(dtype, np.dtype):
+            return pd.Series(np.full(length, _missing_value(dtype), dtype=dtype))
+        return pd.Series(pd.array([None] * length, dtype=dtype))
+    if values.dtype == dtype:
+        return values.reset_index(drop=True)
+    return values.astype(dtype).reset_index(drop=True)
+
+
+def _missing_value(dtype):
+    """
+    Return the missing value of a NumPy dtype.
+    """
+    if dtype.kind in "mM":
+        return np.datetime64("NaT") if dtype.kind == "M" else np.timedelta64("NaT")
+    return np.nan
+
+
+def _is_string_dtype(dtype):
+    """
+    Return True for object and pandas string columns.
+    """
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+def _code_type(n_categories):
+    """
+    Return the smallest signed integer type for category codes.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
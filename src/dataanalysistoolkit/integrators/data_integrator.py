@@ -11,12 +11,27 @@ The module can be used to handle complex data integration needs in data
 science and analytics projects, enabling seamless combination of data
 from different formats and sources.
 
+Inner joins of several DataFrames on the same key are planned before they
+run. The key columns of every frame are encoded once as integer codes shared
+across the frames, rows whose key is missing from any frame are dropped up
+front, and the frames are joined in the order that keeps the intermediate
+results smallest, using exact per-key row counts. The joins themselves only
+carry the codes and row positions; every frame's columns are gathered once at
+the end, so a wide frame is never copied into intermediate results. The
+output has the rows and columns of merging the frames left to right, ordered
+by position in the first frame, then in the second, and so on. Frames whose
+key types differ are merged left to right by pandas.
+
 Example usage:
 
     integrator = DataIntegrator()
     integrator.add_data(df1)
     integrator.add_data(df2)
     combined_data = integrator.join_on_multiple_columns(['column1', 'column2'])
+    # or, for frames too large to join on one core or in memory
+    integrator.merge_partitioned('id', memory_budget=8 * 1024**3, output='joined.parquet')
+    # or, for frames too large to concatenate in memory
+    integrator.concatenated_view(release=True).write('combined.parquet')
     # or
     time_series_data = integrator.integrate_time_series('date', method='nearest')
     # or
@@ -24,9 +39,27 @@ Example usage:
     integrated_data = integrator.integrate_from_different_sources(
         source_data, 'concat'
     )
+    # or load the sources concurrently
+    source_data = {
+        'sql': DataSource(sql_connector, 'SELECT * FROM sales'),
+        'excel': DataSource(excel_connector, sheet_name='targets'),
+        'api': DataSource(api_connector, 'rates', record_path='data', timeout=10),
+    }
+    integrated_data = integrator.integrate_from_different_sources(
+        source_data, 'merge', on='region', timeout=60
+    )
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
+from pandas.core.dtypes.cast import find_common_type
+
+from .concatenated_view import ConcatenatedView
+from .partitioning import HashPartitioner, _load_pieces
+from .source_loader import load_sources
 
 
 class DataIntegrator:
@@ -39,6 +72,8 @@ class DataIntegrator:
 
     Attributes:
         data_frames (list): A list to store the added DataFrames.
+        source_errors (dict): Maps the sources that failed to load in the last
+          `integrate_from_different_sources` call to their exceptions.
     """
 
     def __init__(self):
@@ -46,6 +81,7 @@ class DataIntegrator:
         Initialize the DataIntegrator with an empty list of DataFrames.
         """
         self.data_frames = []
+        self.source_errors = {}
 
     def add_data(self, data_frame):
         """
@@ -56,33 +92,122 @@ class DataIntegrator:
         """
         self.data_frames.append(data_frame)
 
-    def concatenate_data(self):
+    def concatenate_data(self, release=False):
         """
         Concatenate all added DataFrames into a single DataFrame.
 
+        Column types are unified before copying, and the result is allocated
+        once; see ConcatenatedView.
+
+        Args:
+            release (bool, optional): Hand the added DataFrames over to the
+              concatenation and drop each one as soon as it is copied, so peak
+              memory stays close to the size of the result. The integrator is
+              left empty. Defaults to False.
+
         Returns:
             pd.DataFrame: The concatenated DataFrame.
         """
-        return pd.concat(self.data_frames, ignore_index=True)
+        return self.concatenated_view(release).to_frame()
 
-    def merge_data(self, on, how="inner"):
+    def concatenated_view(self, release=False):
+        """
+        Return a lazy concatenation of all added DataFrames that can be
+        iterated in chunks, written to a file or materialized once.
+
+        Args:
+            release (bool, optional): Hand the added DataFrames over to the
+              view, which drops each one once it is consumed. The integrator
+              is left empty. Defaults to False.
+
+        Returns:
+            ConcatenatedView: The view.
+        """
+        view = ConcatenatedView(self.data_frames, release=release)
+        if release:
+            self.data_frames = []
+        return view
+
+    def merge_data(self, on, how="inner", optimize=True):
         """
         Merge all added DataFrames into a single DataFrame based on a key column.
 
+        Inner joins are planned: the frames are joined in the order that keeps
+        intermediate results smallest, on integer key codes shared across the
+        frames. A planned join has the rows and columns of merging the frames
+        left to right, with its rows ordered by their position in the first
+        frame, then in the second, and so on; `pd.merge` does not promise an
+        order for duplicate keys. Other join types, frames whose non-key
+        columns share names and frames whose key types differ are merged left
+        to right in the order they were added.
+
         Args:
-            on (str): Column name to merge on.
+            on (str or list of str): Column name, or names, to merge on.
             how (str, optional): Type of merge to be performed.
               Defaults to 'inner'.
+            optimize (bool, optional): Plan inner joins. Defaults to True.
 
         Returns:
             pd.DataFrame: The merged DataFrame.
         """
-        merged_df = self.data_frames[0]
-        for df in self.data_frames[1:]:
-            merged_df = pd.merge(merged_df, df, on=on, how=how)
-        return merged_df
+        return _merge_frames(self.data_frames, on, how, optimize)
 
-    def join_on_multiple_columns(self, columns, how="inner"):
+    def merge_partitioned(self, on, how="inner", n_partitions=None, max_workers=None,
+                          memory_budget=None, spill_dir=None, output=None,
+                          optimize=True):
+        """
+        Merge all added DataFrames by hash-partitioning them on the key.
+
+        Every frame is split into `n_partitions` buckets by a hash of its
+        key, so rows that can match share a bucket. The buckets are merged
+        independently on a process pool and the results are concatenated.
+        Buckets are spilled to disk once they exceed `memory_budget`, and
+        with `output` every merged bucket is written out as soon as it is
+        ready instead of being held in memory.
+
+        Rows are grouped by bucket, so their order differs from `merge_data`.
+
+        Args:
+            on (str or list of str): Column name, or names, to merge on.
+            how (str, optional): Type of merge to be performed.
+              Defaults to 'inner'.
+            n_partitions (int, optional): Number of buckets. Defaults to four
+              per worker.
+            max_workers (int, optional): Number of worker processes. Defaults
+              to the number of CPUs; 1 merges the buckets in this process.
+            memory_budget (int, optional): Bytes of partitioned input to hold
+              in memory before spilling. Defaults to None, which never spills.
+            spill_dir (str, optional): Parent directory for spilled buckets.
+              Defaults to the system temporary directory.
+            output (str, optional): Write the result to this file, in the
+              format given by its extension, instead of returning it.
+            optimize (bool, optional): Plan inner joins within each bucket as
+              `merge_data` does. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The merged DataFrame, or None if `output` is given.
+        """
+        keys = [on] if isinstance(on, str) else list(on)
+        max_workers = max_workers or os.cpu_count() or 1
+        n_partitions = n_partitions or 4 * max_workers
+        with HashPartitioner(keys, n_partitions, memory_budget, spill_dir) as partitioner:
+            for i, df in enumerate(self.data_frames):
+                partitioner.add(i, df)
+            tasks = [
+                ([partitioner.pieces(source, i) for source in partitioner.sources],
+                 [partitioner.schema(source) for source in partitioner.sources])
+                for i in range(n_partitions)
+            ]
+            args = (keys, how, optimize)
+            if max_workers == 1:
+                results = (_merge_partition(pieces, schemas, *args) for pieces, schemas in tasks)
+                return _collect(results, output)
+            with ProcessPoolExecutor(max_workers) as pool:
+                futures = [pool.submit(_merge_partition, pieces, schemas, *args)
+                           for pieces, schemas in tasks]
+                return _collect(_drain(futures), output)
+
+    def join_on_multiple_columns(self, columns, how="inner", optimize=True):
         """
         Join all added DataFrames on multiple columns.
 
@@ -90,51 +215,467 @@ class DataIntegrator:
             columns (list of str): List of column names to join on.
             how (str, optional): Type of join to be performed.
               Defaults to 'inner'.
+            optimize (bool, optional): Plan inner joins as `merge_data` does.
+              Defaults to True.
 
         Returns:
             pd.DataFrame: The joined DataFrame.
         """
-        joined_df = self.data_frames[0]
-        for df in self.data_frames[1:]:
-            joined_df = pd.merge(joined_df, df, on=columns, how=how)
-        return joined_df
+        return self.merge_data(list(columns), how=how, optimize=optimize)
 
-    def integrate_time_series(self, time_column, method="nearest"):
+    def integrate_time_series(self, time_column, method="nearest", by=None, tolerance=None):
         """
         Integrate time series data from added DataFrames based on a time column.
 
+        Each row of the first DataFrame is matched with the closest row of
+        every other DataFrame, as `pd.merge_asof` does, but in a single pass:
+        each input is sorted once (or not at all if it is already sorted) and
+        matched with a vectorized binary search. Inputs do not need to be
+        sorted, and the rows of the first DataFrame keep their order.
+
         Args:
             time_column (str): The name of the time column for integration.
-            method (str, optional): Method of time series integration
-              (e.g., 'nearest', 'pad'). Defaults to 'nearest'.
+            method (str, optional): 'backward' matches the last earlier or
+              equal time, 'forward' the first later or equal time and
+              'nearest' the closest of the two, preferring the earlier one on
+              ties. Defaults to 'nearest'.
+            by (str or list of str, optional): Only match rows with equal
+              values in these columns, e.g. a sensor id.
+            tolerance (optional): Largest time difference to match, e.g. '5ms'
+              or a Timedelta for datetime columns, or a number. Rows without a
+              match get missing values.
 
         Returns:
             pd.DataFrame: The integrated DataFrame with time series data.
+
+        Raises:
+            ValueError: If `method` is not supported or a time is missing.
         """
-        integrated_df = self.data_frames[0]
-        for df in self.data_frames[1:]:
-            integrated_df = pd.merge_asof(
-                integrated_df, df, on=time_column, direction=method
+        if method not in _ASOF_DIRECTIONS:
+            raise ValueError(
+                f"Unknown method: '{method}'. Available methods are {list(_ASOF_DIRECTIONS)}."
             )
-        return integrated_df
+        by = [] if by is None else [by] if isinstance(by, str) else list(by)
+        if isinstance(tolerance, str):
+            tolerance = pd.Timedelta(tolerance)
+        if not _can_reorder(self.data_frames, [time_column] + by):
+            # Overlapping column names get suffixes that depend on the order
+            # of the merges, so keep merging pairwise.
+            first = self.data_frames[0].reset_index(drop=True)
+            order = first.sort_values(time_column, kind="stable").index.to_numpy()
+            integrated_df = first.iloc[order]
+            for df in self.data_frames[1:]:
+                integrated_df = pd.merge_asof(
+                    integrated_df, df.sort_values(time_column, kind="stable"),
+                    on=time_column, by=by or None, direction=method, tolerance=tolerance,
+                )
+            # merge_asof keeps the rows of its left input; undo the sort.
+            return integrated_df.iloc[np.argsort(order)].reset_index(drop=True)
+        return _asof_join(self.data_frames, time_column, by, method, tolerance)
 
-    def integrate_from_different_sources(self, source_data, integration_method="concat"):
+    def integrate_from_different_sources(self, source_data, integration_method="concat",
+                                         on=None, max_workers=None, timeout=None,
+                                         on_error="raise"):
         """
         Integrate data from different sources (like SQL, Excel, APIs).
 
+        Sources that are not loaded yet are loaded concurrently on a thread
+        pool, so the total time approaches that of the slowest source. Inner
+        merges start as soon as the first two sources have arrived and take
+        in each further source as it completes; the rows of such a merge are
+        in no particular order. Concatenation keeps the order of
+        `source_data`.
+
         Args:
             source_data (dict): A dictionary where keys are source names and
-              values are DataFrames.
+              values are DataFrames, DataSource descriptors or callables that
+              return a DataFrame.
             integration_method (str, optional): The method of integration
               ('concat', 'merge'). Defaults to 'concat'.
+            on (str or list of str, optional): The column(s) to merge on.
+              Defaults to the value of a 'common_column' entry of
+              `source_data`.
+            max_workers (int, optional): Number of loader threads. Defaults to
+              one per source.
+            timeout (float, optional): Seconds to wait for each source without
+              a timeout of its own. Defaults to None, which waits
+              indefinitely.
+            on_error (str, optional): 'raise' to raise the first loading error
+              or timeout, or 'skip' to integrate the remaining sources. Errors
+              are recorded in `source_errors` either way. Defaults to 'raise'.
 
         Returns:
             pd.DataFrame: The integrated DataFrame from different sources.
+
+        Raises:
+            ValueError: If `integration_method` or `on_error` is not
+            supported, or a merge has no key.
         """
-        self.data_frames = list(source_data.values())
+        if integration_method not in ("concat", "merge"):
+            raise ValueError(
+                f"Unknown integration method: '{integration_method}'. "
+                "Available methods are ['concat', 'merge']."
+            )
+        if on_error not in ("raise", "skip"):
+            raise ValueError(f"on_error must be 'raise' or 'skip', not '{on_error}'.")
+        source_data = dict(source_data)
+        if isinstance(source_data.get("common_column"), (str, list)):
+            common_column = source_data.pop("common_column")
+            on = common_column if on is None else on
+        if integration_method == "merge" and on is None:
+            raise ValueError("A merge needs the column(s) to merge on.")
+
+        self.source_errors = {}
+        loaded = {}
+        merged = _IncrementalMerge(on) if integration_method == "merge" else None
+        for name, result in load_sources(source_data, max_workers, timeout):
+            if isinstance(result, Exception):
+                self.source_errors[name] = result
+                if on_error == "raise":
+                    raise result
+                continue
+            loaded[name] = result
+            if merged is not None:
+                merged.add(result)
+
+        self.data_frames = [loaded[name] for name in source_data if name in loaded]
         if integration_method == "concat":
             return self.concatenate_data()
-        if integration_method == "merge":
-            # Assuming all data frames have a common column for merging
-            common_column = source_data.get("common_column")
-            return self.merge_data(on=common_column)
+        return merged.result(self.data_frames)
+
+
+class _IncrementalMerge:
+    """
+    Inner-join DataFrames in the order they arrive.
+
+    Arrival order only changes the row order of an inner join, unless the
+    frames share non-key columns, whose suffixes depend on the order; then
+    the frames are merged left to right once they have all arrived.
+    """
+
+    def __init__(self, on):
+        self.keys = [on] if isinstance(on, str) else list(on)
+        self.merged = None
+        self.columns = set()
+        self.deferred = False
+
+    def add(self, df):
+        """
+        Merge the next DataFrame to arrive.
+        """
+        columns = set(df.columns) - set(self.keys)
+        if self.deferred or columns & self.columns or df.columns.has_duplicates:
+            self.deferred = True
+            return
+        self.columns |= columns
+        self.merged = df if self.merged is None else pd.merge(self.merged, df, on=self.keys)
+
+    def result(self, frames):
+        """
+        Return the merge of `frames`, given in their source order.
+        """
+        if self.deferred or self.merged is None:
+            return _merge_frames(frames, self.keys, "inner", True) if frames else pd.DataFrame()
+        # Lay the columns out as a left-to-right merge would.
+        layout = list(frames[0].columns)
+        for df in frames[1:]:
+            layout += [col for col in df.columns if col not in self.keys]
+        return self.merged[layout].reset_index(drop=True)
+
+
+_ASOF_DIRECTIONS = ("backward", "forward", "nearest")
+
+
+def _merge_frames(frames, on, how, optimize):
+    """
+    Merge `frames` on `on`, planning inner joins if `optimize` is set.
+    """
+    keys = [on] if isinstance(on, str) else list(on)
+    if optimize and how == "inner" and _can_reorder(frames, keys):
+        return _planned_inner_join(frames, keys)
+    merged_df = frames[0]
+    for df in frames[1:]:
+        merged_df = pd.merge(merged_df, df, on=on, how=how)
+    return merged_df
+
+
+def _merge_partition(pieces, schemas, keys, how, optimize):
+    """
+    Load one bucket of every frame and merge them. Runs in a worker process.
+    """
+    frames = [_load_pieces(p, schema) for p, schema in zip(pieces, schemas)]
+    return _merge_frames(frames, keys, how, optimize)
+
+
+def _drain(futures):
+    """
+    Yield the result of every future in order, releasing each one.
+    """
+    while futures:
+        yield futures.pop(0).result()
+
+
+def _collect(results, output):
+    """
+    Concatenate the merged buckets, or write them to `output`.
+    """
+    if output is None:
+        return pd.concat(results, ignore_index=True)
+    from ..interfaces import DataExporter  # pylint: disable=import-outside-toplevel
+    DataExporter.for_path(output).write(_unified_results(results), output)
+    return None
+
+
+def _unified_results(results):
+    """
+    Yield the non-empty merged buckets with their column types unified.
+
+    Outer joins turn integer columns into floats only in the buckets that
+    have unmatched rows, so the buckets disagree on types. Each bucket is
+    cast to the common type of the buckets so far; the exporter widens the
+    rows it has already written when that type grows.
+    """
+    dtypes = {}
+    for result in results:
+        if result.empty:
+            continue
+        for col, dtype in result.dtypes.items():
+            dtypes[col] = dtype if col not in dtypes else find_common_type([dtypes[col], dtype])
+        changed = {col: dtypes[col] for col, dtype in result.dtypes.items()
+                   if dtype != dtypes[col]}
+        yield result.astype(changed) if changed else result
+
+
+def _can_reorder(frames, keys):
+    """
+    Return True if joining `frames` in any order gives the same columns.
+
+    Keys whose types differ across frames are left to `pd.merge`, which
+    converts them, e.g. int64 and float64, or refuses them, e.g. strings and
+    integers, where shared codes would silently match nothing.
+    """
+    if len(frames) < 2:
+        return False
+    seen = set()
+    for df in frames:
+        if any(key not in df.columns for key in keys):
+            return False
+        columns = set(df.columns) - set(keys)
+        if columns & seen or df.columns.has_duplicates:
+            return False
+        if any(df[key].dtype != frames[0][key].dtype for key in keys):
+            return False
+        seen |= columns
+    return True
+
+
+def _planned_inner_join(frames, keys):
+    """
+    Inner join `frames` on `keys`, in the cheapest order, with the rows and
+    columns of merging them left to right. Rows are ordered by their position
+    in the first frame, then in the second, and so on.
+    """
+    codes = _shared_key_codes(frames, keys)
+    n_codes = max(int(c.max()) + 1 if c.size else 0 for c in codes)
+    counts = [np.bincount(c, minlength=n_codes).astype(float) for c in codes]
+    # Keys missing from any frame cannot appear in the result.
+    keep = np.logical_and.reduce([count > 0 for count in counts])
+    rows = [np.flatnonzero(keep[c]) for c in codes]
+    order = _join_order(counts)
+
+    first = order[0]
+    joined = pd.DataFrame({"key": codes[first][rows[first]], first: rows[first]})
+    for i in order[1:]:
+        joined = joined.merge(pd.DataFrame({"key": codes[i][rows[i]], i: rows[i]}), on="key")
+    positions = [joined[i].to_numpy() for i in range(len(frames))]
+    sort = np.lexsort(positions[::-1])
+
+    pieces = [frames[0].take(positions[0][sort])]
+    pieces += [
+        df.drop(columns=keys).take(position[sort])
+        for df, position in zip(frames[1:], positions[1:])
+    ]
+    for piece in pieces:
+        piece.index = pd.RangeIndex(len(sort))
+    return pd.concat(pieces, axis=1)
+
+
+def _shared_key_codes(frames, keys):
+    """
+    Encode the keys of every frame as integer codes shared across frames.
+
+    Equal keys get equal codes, including missing keys, which pandas also
+    matches to each other.
+    """
+    stacked = pd.concat([df[keys] for df in frames], ignore_index=True)
+    if len(keys) == 1:
+        codes, _ = pd.factorize(stacked[keys[0]], use_na_sentinel=False)
+    else:
+        codes = stacked.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    bounds = np.cumsum([len(df) for df in frames])[:-1]
+    return np.split(codes, bounds)
+
+
+def _join_order(counts):
+    """
+    Choose a join order greedily from the per-key row count of every frame.
+
+    Joining frames on the same key gives, for each key, the product of their
+    counts, so the size of any intermediate result is known exactly. The
+    cheapest pair is joined first, then the frame that adds the fewest rows.
+    """
+    remaining = list(range(len(counts)))
+    first, second = min(
+        ((i, j) for i in remaining for j in remaining if i < j),
+        key=lambda pair: np.dot(counts[pair[0]], counts[pair[1]]),
+    )
+    order = [first, second]
+    current = counts[first] * counts[second]
+    remaining = [i for i in remaining if i not in order]
+    while remaining:
+        best = min(remaining, key=lambda i: np.dot(current, counts[i]))
+        order.append(best)
+        current = current * counts[best]
+        remaining.remove(best)
+    return order
+
+
+def _asof_join(frames, on, by, direction, tolerance):
+    """
+    As-of join every frame to the first one in a single pass.
+    """
+    if any(df[on].isna().any() for df in frames):
+        raise ValueError(f"Column '{on}' contains missing values.")
+    times = [_numeric_times(df[on]) for df in frames]
+    if by:
+        codes = _shared_key_codes(frames, by)
+        search_keys = _group_time_keys(times, codes)
+    else:
+        codes = [None] * len(frames)
+        search_keys = times
+    if tolerance is not None and _is_temporal(frames[0][on]):
+        tolerance = pd.Timedelta(tolerance).value
+
+    # Searching for sorted values is far faster than for values in random
+    # order, so the first frame is sorted once for all the searches.
+    inputs = [
+        _sorted_input(time, code, key)
+        for time, code, key in zip(times, codes, search_keys)
+    ]
+    left_order, left_time, left_code, left_key = inputs[0]
+    pieces = [frames[0].reset_index(drop=True)]
+    for df, (order, time, code, key) in zip(frames[1:], inputs[1:]):
+        matches = _asof_matches(
+            left_key, left_time, left_code, key, time, code, direction, tolerance
+        )
+        if order is not None:
+            matches = np.where(matches >= 0, order[np.maximum(matches, 0)], -1)
+        if left_order is not None:
+            unsorted = np.empty_like(matches)
+            unsorted[left_order] = matches
+            matches = unsorted
+        columns = df.drop(columns=[on] + by).reset_index(drop=True)
+        piece = columns.reindex(matches)
+        piece.index = pd.RangeIndex(len(matches))
+        pieces.append(piece)
+    return pd.concat(pieces, axis=1)
+
+
+def _group_time_keys(times, codes):
+    """
+    Combine group codes and times into one integer per row that sorts by
+    group, then by time, so that a single search finds both.
+    """
+    n_groups = max((int(code.max()) + 1 for code in codes if code.size), default=1)
+    present = [time for time in times if time.size]
+    if present and all(time.dtype.kind in "iu" for time in present):
+        low = min(int(time.min()) for time in present)
+        span = max(int(time.max()) for time in present) - low + 1
+        if n_groups * span < 2 ** 63:
+            return [code * span + (time - low) for code, time in zip(codes, times)]
+    # Otherwise use the rank of each time among all of them.
+    _, ranks = np.unique(np.concatenate(times), return_inverse=True)
+    ranks = np.split(ranks.ravel(), np.cumsum([len(time) for time in times])[:-1])
+    size = sum(len(time) for time in times)
+    return [code * size + rank for code, rank in zip(codes, ranks)]
+
+
+def _sorted_input(time, code, key):
+    """
+    Sort one input by its search key.
+
+    Returns:
+        tuple: The sorting permutation, or None if the input was already
+        sorted, and the sorted times, group codes and search keys.
+    """
+    if _is_sorted(key):
+        return None, time, code, key
+    if code is not None and _is_sorted(time):
+        # Already sorted by time, so a stable sort on the small group codes
+        # alone (a radix sort) gives the order by group, then time.
+        order = np.argsort(code.astype(np.min_scalar_type(code.max())), kind="stable")
+    else:
+        order = np.argsort(key, kind="stable")
+    return order, time[order], None if code is None else code[order], key[order]
+
+
+def _asof_matches(left_key, left_time, left_code, right_key, right_time, right_code,
+                  direction, tolerance):
+    """
+    Return the position in the sorted right input of each left row's match,
+    or -1 where there is none.
+    """
+    size = len(right_key)
+    if size == 0:
+        return np.full(len(left_key), -1)
+    candidates = []
+    if direction in ("backward", "nearest"):
+        before = np.searchsorted(right_key, left_key, side="right") - 1
+        clipped = np.maximum(before, 0)
+        candidates.append((before, before >= 0, left_time - right_time[clipped], clipped))
+    if direction in ("forward", "nearest"):
+        after = np.searchsorted(right_key, left_key, side="left")
+        clipped = np.minimum(after, size - 1)
+        candidates.append((after, after < size, right_time[clipped] - left_time, clipped))
+
+    best = np.full(len(left_key), -1)
+    best_distance = None
+    for position, valid, distance, clipped in candidates:
+        if right_code is not None:
+            valid &= right_code[clipped] == left_code
+        if tolerance is not None:
+            valid &= distance <= tolerance
+        if best_distance is not None:
+            # The earlier row wins ties.
+            valid &= (best < 0) | (distance < best_distance)
+        best = np.where(valid, position, best)
+        best_distance = distance if best_distance is None else np.where(valid, distance, best_distance)
+    return best
+
+
+def _numeric_times(values):
+    """
+    Return times as a NumPy array; datetimes and timedeltas as int64 ns.
+    """
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    if pd.api.types.is_datetime64_dtype(values.dtype):
+        return values.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    if pd.api.types.is_timedelta64_dtype(values.dtype):
+        return values.to_numpy(dtype="timedelta64[ns]").view(np.int64)
+    return values.to_numpy()
+
+
+def _is_temporal(values):
+    """
+    Return True for datetime and timedelta Series.
+    """
+    return (pd.api.types.is_datetime64_any_dtype(values.dtype)
+            or pd.api.types.is_timedelta64_dtype(values.dtype))
+
+
+def _is_sorted(values):
+    """
+    Return True if `values` is in non-decreasing order.
+    """
+    return bool(np.all(values[1:] >= values[:-1]))
@@ -0,0 +1,239 @@
+"""
+partitioning.py
+
+This module provides HashPartitioner, which splits several DataFrames into
+the same number of buckets by a hash of their key columns. Rows with equal
+keys land in the same bucket whichever frame they come from, so a join of
+the frames is the concatenation of the joins of their buckets, and the
+buckets can be joined independently and in parallel.
+
+Frames are added in chunks of rows. Buckets are kept in memory until their
+total size exceeds a memory budget, and the largest buckets are then pickled
+to a spill directory, so frames larger than the budget can be partitioned.
+
+Example usage:
+
+    with HashPartitioner(['customer_id'], n_partitions=16,
+                         memory_budget=2 * 1024**3) as partitioner:
+        partitioner.add('orders', orders_df)
+        partitioner.add('customers', customers_df)
+        for i in range(partitioner.n_partitions):
+            joined = partitioner.partition('orders', i).merge(
+                partitioner.partition('customers', i), on='customer_id'
+            )
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+class HashPartitioner:
+    """
+    Split DataFrames into buckets by a hash of their key columns.
+
+    Attributes:
+        keys (list of str): The key columns.
+        n_partitions (int): Number of buckets.
+        memory_budget (int): Bytes of buckets held in memory before spilling,
+          or None for no limit.
+        spill_dir (str): Directory of the spilled buckets.
+        spilled_bytes (int): Total size of the spilled buckets, as measured
+          in memory.
+    """
+
+    def __init__(self, keys, n_partitions, memory_budget=None, spill_dir=None):
+        """
+        Initialize an empty partitioner.
+
+        Args:
+            keys (str or list of str): The key columns.
+            n_partitions (int): Number of buckets.
+            memory_budget (int, optional): Bytes of buckets to hold in memory
+              before spilling to disk. Defaults to None, which never spills.
+            spill_dir (str, optional): Parent directory for spilled buckets.
+              Defaults to the system temporary directory.
+
+        Raises:
+            ValueError: If `n_partitions` is less than 1.
+        """
+        if n_partitions < 1:
+            raise ValueError("n_partitions must be at least 1.")
+        self.keys = [keys] if isinstance(keys, str) else list(keys)
+        self.n_partitions = n_partitions
+        self.memory_budget = memory_budget
+        self.spill_dir = tempfile.mkdtemp(prefix="partitions-", dir=spill_dir)
+        self.spilled_bytes = 0
+        self._schemas = {}
+        self._pieces = {}
+        self._memory = {}
+        self._files = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"HashPartitioner(keys={self.keys}, n_partitions={self.n_partitions}, "
+            f"sources={list(self._schemas)}, spilled_bytes={self.spilled_bytes})"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def sources(self):
+        """list: The names of the added frames, in the order they were added."""
+        return list(self._schemas)
+
+    def add(self, source, data, chunksize=1_000_000):
+        """
+        Partition the rows of a frame.
+
+        Args:
+            source (hashable): Name of the frame. Adding the same name again
+              appends rows to it.
+            data (DataFrame or iterable of DataFrame): The frame, or its
+              chunks.
+            chunksize (int, optional): Rows of a DataFrame to partition at a
+              time. Defaults to 1,000,000.
+
+        Returns:
+            HashPartitioner: This partitioner.
+
+        Raises:
+            ValueError: If a key column is missing.
+        """
+        chunks = _row_chunks(data, chunksize) if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            missing = [key for key in self.keys if key not in chunk.columns]
+            if missing:
+                raise ValueError(f"Key columns {missing} not found in '{source}'.")
+            self._schemas.setdefault(source, chunk.iloc[:0])
+            self._add_chunk(source, chunk)
+        return self
+
+    def partition(self, source, i):
+        """
+        Return bucket `i` of a frame.
+
+        Args:
+            source (hashable): Name of the frame.
+            i (int): The bucket.
+
+        Returns:
+            DataFrame: The rows of the bucket, in the order they were added.
+        """
+        return _load_pieces(self.pieces(source, i), self._schemas[source])
+
+    def pieces(self, source, i):
+        """
+        Return the stored pieces of bucket `i` of a frame: DataFrames held in
+        memory and paths of pickled DataFrames. Passing pieces to a worker
+        process instead of a loaded bucket avoids pickling spilled data twice.
+
+        Returns:
+            list: The pieces, in order.
+        """
+        return list(self._pieces.get((source, i), []))
+
+    def schema(self, source):
+        """
+        Return an empty DataFrame with the columns and types of a frame.
+        """
+        return self._schemas[source]
+
+    def close(self):
+        """
+        Drop the buckets and delete the spill directory.
+        """
+        self._pieces = {}
+        self._memory = {}
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _add_chunk(self, source, chunk):
+        """
+        Split a chunk into buckets and store them, spilling if over budget.
+        """
+        if chunk.empty:
+            return
+        buckets = partition_ids(chunk, self.keys, self.n_partitions)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(self.n_partitions + 1))
+        # Measure the chunk once and attribute its size to the rows.
+        row_bytes = chunk.memory_usage(index=False, deep=True).sum() / len(chunk)
+        for i in range(self.n_partitions):
+            rows = order[bounds[i]:bounds[i + 1]]
+            if rows.size == 0:
+                continue
+            key = (source, i)
+            self._pieces.setdefault(key, []).append(chunk.take(rows))
+            self._memory[key] = self._memory.get(key, 0) + rows.size * row_bytes
+        self._spill()
+
+    def _spill(self):
+        """
+        Pickle the largest in-memory buckets until the rest fit the budget.
+        """
+        if self.memory_budget is None:
+            return
+        in_memory = sum(self._memory.values())
+        while in_memory > self.memory_budget and self._memory:
+            key = max(self._memory, key=self._memory.get)
+            held = [piece for piece in self._pieces[key] if isinstance(piece, pd.DataFrame)]
+            path = os.path.join(self.spill_dir, f"bucket-{self._files:06d}.pkl")
+            self._files += 1
+            pd.concat(held).to_pickle(path)
+            self._pieces[key] = [
+                piece for piece in self._pieces[key] if not isinstance(piece, pd.DataFrame)
+            ] + [path]
+            size = self._memory.pop(key)
+            self.spilled_bytes += int(size)
+            in_memory -= size
+
+
+def partition_ids(data, keys, n_partitions):
+    """
+    Return the bucket of every row of `data` for the given key columns.
+
+    Numeric keys are hashed as float64, so equal numbers land in the same
+    bucket whether a frame stores them as integers or floats.
+
+    Args:
+        data (DataFrame): The rows.
+        keys (list of str): The key columns.
+        n_partitions (int): Number of buckets.
+
+    Returns:
+        ndarray: The bucket of each row, from 0 to n_partitions - 1.
+    """
+    key_data = data[keys]
+    numeric = [
+        col for col, dtype in key_data.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ]
+    if numeric:
+        key_data = key_data.astype({col: np.float64 for col in numeric})
+    hashes = pd.util.hash_pandas_object(key_data, index=False).to_numpy()
+    return (hashes % np.uint64(n_partitions)).astype(np.intp)
+
+
+def _row_chunks(data, chunksize):
+    """
+    Yield consecutive slices of `data`; an empty frame yields itself.
+    """
+    for start in range(0, max(len(data), 1), chunksize):
+        yield data.iloc[start:start + chunksize]
+
+
+def _load_pieces(pieces, schema):
+    """
+    Concatenate stored pieces, reading spilled ones from disk.
+    """
+    frames = [pd.read_pickle(piece) if isinstance(piece, str) else piece for piece in pieces]
+    if not frames:
+        return schema
+    return frames[0] if len(frames) == 1 else pd.concat(frames)
@@ -0,0 +1,178 @@
+"""
+source_loader.py
+
+This module loads DataFrames from several sources at the same time. Reading
+from a database, a spreadsheet or a web API is mostly waiting on I/O, so
+loading the sources one after another takes the sum of their latencies.
+`load_sources` runs every load on a thread pool and yields each DataFrame as
+soon as it is ready, so the total time approaches that of the slowest
+source and the caller can start combining the early ones while the rest are
+still loading.
+
+A DataSource describes what to load: a connector and the arguments of its
+load method, e.g. an SQLConnector and a query, an ExcelConnector and a sheet,
+or an APIConnector and an endpoint. Any callable that returns a DataFrame
+can also be used. Each source may have its own timeout.
+
+Example usage:
+
+    sources = {
+        'orders': DataSource(SQLConnector(db_uri), 'SELECT * FROM orders'),
+        'targets': DataSource(ExcelConnector('targets.xlsx'), sheet_name='2024'),
+        'rates': DataSource(APIConnector(url), 'rates', record_path='data',
+                            timeout=10),
+    }
+    for name, result in load_sources(sources, timeout=60):
+        print(name, result)
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+
+class DataSource:
+    """
+    A description of a DataFrame to load from a connector.
+
+    Attributes:
+        connector: An SQLConnector, ExcelConnector, APIConnector, or any
+          object with the method named by `method`.
+        method (str): The connector method that loads the data.
+        args (tuple): Positional arguments of the method.
+        kwargs (dict): Keyword arguments of the method.
+        record_path (str or list): For API sources, the path to the records
+          in the JSON response, as for `pd.json_normalize`.
+        timeout (float): Seconds to wait for this source, or None to use the
+          caller's timeout.
+    """
+
+    # The load method of each connector, found by duck typing so that no
+    # connector module, and none of its dependencies, has to be imported.
+    _METHODS = ("query_data", "load_data", "get")
+
+    def __init__(self, connector, *args, method=None, record_path=None, timeout=None,
+                 **kwargs):
+        """
+        Describe a source.
+
+        Args:
+            connector: The connector to load from.
+            *args: Positional arguments of the load method, e.g. the query,
+              sheet name or endpoint.
+            method (str, optional): The load method. Defaults to
+              `query_data`, `load_data` or `get`, whichever the connector has.
+            record_path (str or list, optional): For API sources, the path to
+              the records in the JSON response.
+            timeout (float, optional): Seconds to wait for this source.
+            **kwargs: Keyword arguments of the load method.
+
+        Raises:
+            ValueError: If `method` is not given and the connector has none of
+            the known load methods.
+        """
+        if method is None:
+            method = next((name for name in self._METHODS if hasattr(connector, name)), None)
+            if method is None:
+                raise ValueError(
+                    f"Cannot tell how to load from {connector!r}; pass `method`."
+                )
+        self.connector = connector
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.record_path = record_path
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"DataSource(connector={self.connector!r}, method={self.method}, args={self.args})"
+
+    def load(self):
+        """
+        Load the source.
+
+        Returns:
+            DataFrame: The data. API responses are converted from JSON with
+            `pd.json_normalize`.
+        """
+        result = getattr(self.connector, self.method)(*self.args, **self.kwargs)
+        if isinstance(result, pd.DataFrame):
+            return result
+        if hasattr(result, "json"):
+            result = result.json()
+        return pd.json_normalize(result, record_path=self.record_path)
+
+
+def load_sources(sources, max_workers=None, timeout=None):
+    """
+    Load sources concurrently and yield each one as soon as it is ready.
+
+    A source that is still running when its timeout expires is abandoned: it
+    is reported as timed out, and its thread finishes in the background
+    without being waited for.
+
+    Args:
+        sources (dict): Maps source names to DataSource objects, callables
+          returning a DataFrame, or DataFrames that are already loaded.
+        max_workers (int, optional): Number of threads. Defaults to one per
+          source.
+        timeout (float, optional): Seconds to wait for each source that has
+          no timeout of its own, measured from the start. Defaults to None,
+          which waits indefinitely.
+
+    Yields:
+        tuple: The source name and its DataFrame, or the exception raised
+        while loading it (a TimeoutError if it did not finish in time), in
+        order of completion.
+    """
+    loaders = {name: _loader(source) for name, source in sources.items()}
+    if not loaders:
+        return
+    pool = ThreadPoolExecutor(max_workers or len(loaders), thread_name_prefix="source-loader")
+    start = time.monotonic()
+    try:
+        names, deadlines = {}, {}
+        for name, (load, source_timeout) in loaders.items():
+            future = pool.submit(load)
+            names[future] = name
+            limit = timeout if source_timeout is None else source_timeout
+            if limit is not None:
+                deadlines[future] = (start + limit, limit)
+
+        positions = {future: i for i, future in enumerate(names)}
+        pending = set(names)
+        while pending:
+            waiting = [deadlines[future][0] for future in pending if future in deadlines]
+            wait_for = max(0.0, min(waiting) - time.monotonic()) if waiting else None
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=positions.get):
+                error = future.exception()
+                yield names[future], future.result() if error is None else error
+            now = time.monotonic()
+            expired = [future for future in pending
+                       if future in deadlines and deadlines[future][0] <= now]
+            for future in expired:
+                pending.discard(future)
+                future.cancel()
+                yield names[future], TimeoutError(
+                    f"Source '{names[future]}' did not load within "
+                    f"{deadlines[future][1]} seconds."
+                )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _loader(source):
+    """
+    Return the load function and timeout of a source.
+    """
+    if isinstance(source, DataSource):
+        return source.load, source.timeout
+    if isinstance(source, pd.DataFrame):
+        return (lambda: source), None
+    if callable(source):
+        return source, None
+    raise ValueError(
+        f"Unsupported source: {source!r}. Use a DataSource, a callable or a DataFrame."
+    )
@@ -1,5 +1,15 @@
 # data_sources/__init__.py
 
-from .api_connector import APIConnector
-from .excel_connector import ExcelConnector
-from .sql_connector import SQLConnector
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "APIConnector": ".api_connector",
+        "DataCache": ".data_cache",
+        "DataExporter": ".data_exporter",
+        "ExcelConnector": ".excel_connector",
+        "SQLConnector": ".sql_connector",
+    },
+)
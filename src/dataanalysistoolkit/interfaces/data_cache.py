@@ -0,0 +1,208 @@
+"""data_sources/data_cache.py
+
+This module provides a DataCache class that keeps parsed DataFrames in a
+columnar binary format (Feather or Parquet) on disk. Parsing a large CSV file
+is slow; reading the same data back from a columnar file, or memory-mapping
+it, is much faster. Entries are keyed on the source file's path, modification
+time and size, so an edited file is parsed again automatically. The cache
+directory is bounded in size and the least recently used entries are evicted
+first.
+
+Feather and Parquet support require the optional `pyarrow` package.
+
+Example usage:
+cache = DataCache('~/.cache/dataanalysistoolkit', max_bytes=10 * 1024 ** 3)
+df = cache.load('path/to/large_file.csv')  # parses the CSV and caches it
+df = cache.load('path/to/large_file.csv')  # reads the cached columnar copy
+cache.clear()
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"feather": ".feather", "parquet": ".parquet"}
+
+
+class DataCache:
+    """
+    A size-bounded, least recently used on-disk cache of parsed DataFrames.
+
+    Attributes:
+        cache_dir (str): Directory in which cached files are stored.
+        max_bytes (int): Upper bound on the total size of the cache directory.
+        file_format (str): Columnar format of cached files, 'feather' or
+          'parquet'.
+        memory_map (bool): Whether cached files are memory-mapped when read.
+    """
+
+    def __init__(self, cache_dir, max_bytes=4 * 1024 ** 3, file_format="feather",
+                 memory_map=True):
+        """
+        Initialize the DataCache.
+
+        Args:
+            cache_dir (str): Directory in which cached files are stored. It is
+              created if it does not exist.
+            max_bytes (int, optional): Upper bound on the total size of the
+              cache directory. Defaults to 4 GiB.
+            file_format (str, optional): 'feather' or 'parquet'. Defaults to
+              'feather'.
+            memory_map (bool, optional): Memory-map cached files when reading
+              them. Defaults to True.
+
+        Raises:
+            ValueError: If `file_format` is not supported.
+        """
+        if file_format not in _EXTENSIONS:
+            raise ValueError(
+                f"Unknown file format: '{file_format}'. "
+                f"Available formats are {sorted(_EXTENSIONS)}."
+            )
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+        self.memory_map = memory_map
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"DataCache(cache_dir={self.cache_dir}, max_bytes={self.max_bytes}, "
+            f"file_format={self.file_format})"
+        )
+
+    def cache_path(self, filename):
+        """
+        Return the path of the cache entry for `filename`.
+
+        The key is derived from the absolute path, modification time and size
+        of the source file, so any change to the file yields a new key.
+
+        Args:
+            filename (str): The path to the source file.
+
+        Returns:
+            str: The path of the cached file, whether or not it exists yet.
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        key = f"{path}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, digest + _EXTENSIONS[self.file_format])
+
+    def load(self, filename, loader=pd.read_csv):
+        """
+        Load `filename`, reading from the cache when a valid entry exists.
+
+        On a miss the file is parsed with `loader`, stored in the cache and
+        the cache is trimmed to `max_bytes`. If the parsed frame cannot be
+        stored, e.g. because a column mixes numbers and strings, the failure
+        is logged and the frame is returned uncached.
+
+        Args:
+            filename (str): The path to the source file.
+            loader (callable, optional): Function that parses `filename` into
+              a DataFrame. Defaults to `pd.read_csv`.
+
+        Returns:
+            DataFrame: The loaded data.
+        """
+        path = self.cache_path(filename)
+        if os.path.exists(path):
+            logger.debug("Cache hit for %s", filename)
+            # Touch the entry so that eviction sees it as recently used.
+            os.utime(path)
+            return self._read(path)
+
+        logger.debug("Cache miss for %s", filename)
+        df = loader(filename)
+        try:
+            self._write(df, path)
+        except ImportError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # The cache is an optimization; never fail a load because of it.
+            logger.warning("Could not cache %s", filename, exc_info=True)
+            return df
+        self.evict()
+        return df
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the cache directory is
+        no larger than `max_bytes`.
+
+        Returns:
+            list of str: The paths of the deleted entries.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if os.path.splitext(name)[1] not in _EXTENSIONS.values():
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path = os.path.join(self.cache_dir, name)
+            os.remove(path)
+            total -= size
+            removed.append(path)
+        return removed
+
+    def clear(self):
+        """
+        Delete every entry in the cache.
+        """
+        for name in os.listdir(self.cache_dir):
+            if os.path.splitext(name)[1] in _EXTENSIONS.values():
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def _read(self, path):
+        """
+        Read a cached file, memory-mapping it if configured to do so.
+        """
+        if self.file_format == "parquet":
+            return pd.read_parquet(path, memory_map=self.memory_map)
+        feather = _import_feather()
+        return feather.read_table(path, memory_map=self.memory_map).to_pandas()
+
+    def _write(self, df, path):
+        """
+        Write `df` to `path` through a temporary file so that a concurrent
+        reader never sees a partially written entry.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            if self.file_format == "parquet":
+                df.to_parquet(tmp_path)
+            else:
+                _import_feather().write_feather(df, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def _import_feather():
+    """
+    Import `pyarrow.feather`, raising a helpful error if pyarrow is missing.
+    """
+    try:
+        from pyarrow import feather  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "DataCache requires the optional 'pyarrow' package. "
+            "Install it with 'pip install pyarrow'."
+        ) from exc
+    return feather
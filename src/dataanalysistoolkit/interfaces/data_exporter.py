@@ -0,0 +1,449 @@
+"""data_sources/data_exporter.py
+
+This module provides a DataExporter class that writes a DataFrame, or a
+stream of DataFrame chunks, to CSV, Parquet or Feather files.
+
+- Compressed CSV is written as a sequence of independently compressed
+  blocks. The blocks are formatted and compressed by a thread pool, and zlib,
+  bz2 and lzma release the GIL while compressing. A concatenation of gzip,
+  bz2 or xz streams is itself a valid file of that type, so the result reads
+  back with any standard tool.
+- Parquet output gets one row group per block of rows.
+- Feather output is an Arrow IPC file whose buffers are compressed by
+  Arrow's own thread pool.
+- With `partition_cols`, the output is a directory of files laid out by
+  column value (`col=value/part-00000.parquet`), which `pd.read_parquet` and
+  pyarrow datasets read back as a single table.
+
+Every export is written to a temporary file or directory next to the target
+and then renamed into place, so readers never see a partially written file.
+The result gets the permissions of a newly created file, as set by the
+process umask. CSV can also be written to an open file object, such as an
+`io.StringIO`, which is written in place.
+
+Parquet and Feather support require the optional `pyarrow` package.
+
+Example usage:
+exporter = DataExporter(file_format='parquet', compression='zstd')
+exporter.write([df], 'path/to/output.parquet')
+
+exporter = DataExporter.for_path('path/to/output.csv.gz', workers=8)
+exporter.write(pd.read_csv('large_file.csv', chunksize=1_000_000),
+               'path/to/output.csv.gz')
+
+DataExporter(file_format='parquet', partition_cols=['date']).write(
+    [df], 'path/to/dataset')
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+_EXTENSIONS = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+_DEFAULT_COMPRESSION = {"csv": None, "parquet": "snappy", "feather": "lz4"}
+_CSV_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+# Name of the partition directory for missing values, as used by Hive.
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+class DataExporter:
+    """
+    Write DataFrames or chunk streams to CSV, Parquet or Feather, atomically.
+
+    Attributes:
+        file_format (str): 'csv', 'parquet' or 'feather'.
+        compression (str): Codec, or None for uncompressed output. CSV
+          supports 'gzip', 'bz2' and 'xz'; Parquet and Feather support the
+          codecs of pyarrow, such as 'snappy', 'zstd' and 'lz4'.
+        compression_level (int): Codec-specific compression level, or None
+          for the codec's default.
+        partition_cols (list of str): Columns to partition the output by, or
+          None to write a single file.
+        index (bool): Whether the index is written.
+        workers (int): Number of threads that format and compress CSV blocks.
+        block_rows (int): Rows per CSV block, Parquet row group or Feather
+          record batch.
+    """
+
+    def __init__(self, file_format="csv", compression=None, compression_level=None,
+                 partition_cols=None, index=False, workers=None, block_rows=100_000):
+        """
+        Initialize the DataExporter.
+
+        Args:
+            file_format (str, optional): 'csv', 'parquet' or 'feather'.
+              Defaults to 'csv'.
+            compression (str, optional): Codec. Defaults to none for CSV,
+              'snappy' for Parquet and 'lz4' for Feather.
+            compression_level (int, optional): Codec-specific compression
+              level. Defaults to the codec's default.
+            partition_cols (list of str, optional): Write one file per
+              distinct combination of these columns' values into a directory
+              tree. Defaults to None.
+            index (bool, optional): Write the index. Defaults to False.
+            workers (int, optional): Number of compression threads. Defaults
+              to the number of CPUs.
+            block_rows (int, optional): Rows per block. Defaults to 100,000.
+
+        Raises:
+            ValueError: If the format or the CSV compression is not supported.
+        """
+        if file_format not in _EXTENSIONS:
+            raise ValueError(
+                f"Unknown file format: '{file_format}'. "
+                f"Available formats are {sorted(_EXTENSIONS)}."
+            )
+        if compression is None:
+            compression = _DEFAULT_COMPRESSION[file_format]
+        if file_format == "csv" and compression not in (None, *_CSV_COMPRESSION_EXTENSIONS):
+            raise ValueError(
+                f"Unknown CSV compression: '{compression}'. "
+                f"Available compressions are {sorted(_CSV_COMPRESSION_EXTENSIONS)}."
+            )
+        self.file_format = file_format
+        self.compression = compression
+        self.compression_level = compression_level
+        self.partition_cols = list(partition_cols) if partition_cols else None
+        self.index = index
+        self.workers = workers or os.cpu_count() or 1
+        self.block_rows = block_rows
+
+    def __repr__(self) -> str:
+        return (
+            f"DataExporter(file_format={self.file_format}, "
+            f"compression={self.compression}, partition_cols={self.partition_cols})"
+        )
+
+    @classmethod
+    def for_path(cls, filename, **kwargs):
+        """
+        Create an exporter whose format and CSV compression are inferred from
+        the extension of `filename`, e.g. '.parquet', '.feather' or '.csv.gz'.
+        Unrecognized extensions, and file objects, give plain CSV.
+
+        Args:
+            filename (str, path-like or file object): The output.
+            **kwargs: Other DataExporter arguments.
+
+        Returns:
+            DataExporter: The exporter.
+        """
+        if _is_buffer(filename):
+            return cls(file_format="csv", **kwargs)
+        name = os.fspath(filename).lower()
+        for file_format, extension in _EXTENSIONS.items():
+            if name.endswith(extension):
+                return cls(file_format=file_format, **kwargs)
+        for compression, extension in _CSV_COMPRESSION_EXTENSIONS.items():
+            if name.endswith(extension):
+                kwargs.setdefault("compression", compression)
+        return cls(file_format="csv", **kwargs)
+
+    @property
+    def extension(self):
+        """str: The file extension of the files written by this exporter."""
+        extension = _EXTENSIONS[self.file_format]
+        if self.file_format == "csv" and self.compression:
+            extension += _CSV_COMPRESSION_EXTENSIONS[self.compression]
+        return extension
+
+    def write(self, chunks, filename):
+        """
+        Write every chunk to `filename`, replacing it atomically.
+
+        Args:
+            chunks (iterable of DataFrame): The data, in order. All chunks
+              must share the same columns. Parquet and Feather output widen
+              a column whose type changes between chunks, e.g. from int64 to
+              float64, to a type that holds every chunk's values.
+            filename (str, path-like or file object): The output file, or
+              the output directory if `partition_cols` is set. A file object
+              takes uncompressed CSV only and is written in place.
+
+        Returns:
+            str or file object: `filename`, as a string if it was path-like.
+
+        Raises:
+            ValueError: If a file object is given for output other than
+              unpartitioned, uncompressed CSV.
+        """
+        if _is_buffer(filename):
+            self._write_buffer(chunks, filename)
+            return filename
+        filename = os.fspath(filename)
+        parent = os.path.dirname(os.path.abspath(filename))
+        if self.partition_cols:
+            tmp_path = _create_temp(parent, os.mkdir, 0o777)
+            try:
+                self._write_partitions(chunks, tmp_path)
+                _replace(tmp_path, filename)
+            except BaseException:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                raise
+            return filename
+
+        tmp_path = _create_temp(parent, _create_file, 0o666)
+        try:
+            self._write_file(chunks, tmp_path)
+            _replace(tmp_path, filename)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return filename
+
+    def _write_buffer(self, chunks, buffer):
+        """
+        Write the chunks to an open file object as uncompressed CSV.
+        """
+        if self.file_format != "csv" or self.compression or self.partition_cols:
+            raise ValueError(
+                "Only unpartitioned, uncompressed CSV can be written to a file object."
+            )
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(buffer, index=self.index, header=i == 0)
+
+    def _write_file(self, chunks, path):
+        """
+        Write the chunks to a single file in the configured format.
+        """
+        if self.file_format == "csv":
+            self._write_csv(chunks, path)
+        elif self.file_format == "parquet":
+            self._write_parquet(chunks, path)
+        else:
+            self._write_feather(chunks, path)
+
+    def _write_csv(self, chunks, path):
+        """
+        Format and compress blocks of rows on a thread pool and write them in
+        order, keeping at most two blocks per thread in flight.
+        """
+        with open(path, "wb") as file, ThreadPoolExecutor(self.workers) as pool:
+            pending = deque()
+            for i, block in enumerate(_blocks(chunks, self.block_rows)):
+                pending.append(pool.submit(self._encode_csv, block, i == 0))
+                while len(pending) > 2 * self.workers:
+                    file.write(pending.popleft().result())
+            while pending:
+                file.write(pending.popleft().result())
+
+    def _encode_csv(self, block, header):
+        """
+        Return one block of rows as CSV bytes, compressed if configured.
+        """
+        data = block.to_csv(index=self.index, header=header).encode("utf-8")
+        if self.compression is None:
+            return data
+        level = self.compression_level
+        if self.compression == "gzip":
+            return gzip.compress(data, compresslevel=6 if level is None else level)
+        if self.compression == "bz2":
+            return bz2.compress(data, compresslevel=9 if level is None else level)
+        return lzma.compress(data, preset=level)
+
+    def _write_parquet(self, chunks, path):
+        """
+        Write the chunks to a Parquet file, one row group per block.
+        """
+        _import_pyarrow()
+        from pyarrow import parquet  # pylint: disable=import-outside-toplevel
+
+        def open_writer(file_path, schema):
+            return parquet.ParquetWriter(
+                file_path, schema, compression=self.compression,
+                compression_level=self.compression_level,
+            )
+
+        def read_batches(file_path):
+            yield from parquet.ParquetFile(file_path).iter_batches(batch_size=self.block_rows)
+
+        self._write_arrow(
+            chunks, path, open_writer, read_batches,
+            lambda writer, table: writer.write_table(table, row_group_size=self.block_rows),
+        )
+
+    def _write_feather(self, chunks, path):
+        """
+        Write the chunks to a Feather (Arrow IPC) file.
+        """
+        pa = _import_pyarrow()
+        codec = None
+        if self.compression is not None:
+            codec = pa.Codec(self.compression, compression_level=self.compression_level)
+        options = pa.ipc.IpcWriteOptions(compression=codec, use_threads=True)
+
+        def read_batches(file_path):
+            with pa.memory_map(file_path) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+
+        self._write_arrow(
+            chunks, path,
+            lambda file_path, schema: pa.ipc.new_file(file_path, schema, options=options),
+            read_batches,
+            lambda writer, table: writer.write_table(table, max_chunksize=self.block_rows),
+        )
+
+    def _write_arrow(self, chunks, path, open_writer, read_batches, write_table):
+        """
+        Write the chunks to an Arrow-based file through `open_writer`.
+
+        A chunk whose column types differ from those written so far is cast
+        to their common type, e.g. int64 and float64 columns are written as
+        float64. When that type is wider than the file's, the rows already
+        written are rewritten with the wider schema, read back with
+        `read_batches`. No chunks at all give a valid file with no columns.
+        """
+        pa = _import_pyarrow()
+        writer = schema = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=self.index)
+                if writer is None:
+                    schema = table.schema
+                    writer = open_writer(path, schema)
+                elif not table.schema.equals(schema):
+                    unified = pa.unify_schemas([schema, table.schema],
+                                               promote_options="permissive")
+                    if not unified.equals(schema):
+                        writer.close()
+                        writer = None  # Not closed again if the rewrite fails.
+                        writer = self._rewrite(path, unified, open_writer, read_batches,
+                                               write_table)
+                        schema = unified
+                    table = table.cast(schema)
+                write_table(writer, table)
+            if writer is None:
+                writer = open_writer(path, pa.schema([]))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _rewrite(self, path, schema, open_writer, read_batches, write_table):
+        """
+        Rewrite the file at `path` with a wider `schema` and return a writer
+        that appends to it.
+        """
+        pa = _import_pyarrow()
+        old_path = path + ".old"
+        os.replace(path, old_path)
+        try:
+            writer = open_writer(path, schema)
+            try:
+                for batch in read_batches(old_path):
+                    write_table(writer, pa.Table.from_batches([batch]).cast(schema))
+            except BaseException:
+                writer.close()
+                raise
+        finally:
+            os.remove(old_path)
+        return writer
+
+    def _write_partitions(self, chunks, directory):
+        """
+        Write each chunk's rows into one file per partition,
+        `col=value/.../part-<chunk number>.<ext>`.
+        """
+        for i, chunk in enumerate(chunks):
+            groups = chunk.groupby(self.partition_cols, sort=False, dropna=False,
+                                   observed=True)
+            for keys, group in groups:
+                subdir = os.path.join(directory, *(
+                    f"{col}={_partition_value(value)}"
+                    for col, value in zip(self.partition_cols, keys)
+                ))
+                os.makedirs(subdir, exist_ok=True)
+                self._write_file(
+                    [group.drop(columns=self.partition_cols)],
+                    os.path.join(subdir, f"part-{i:05d}{self.extension}"),
+                )
+
+
+def _blocks(chunks, block_rows):
+    """
+    Split each chunk into blocks of at most `block_rows` rows.
+    """
+    for chunk in chunks:
+        if len(chunk) == 0:
+            yield chunk
+        for start in range(0, len(chunk), block_rows):
+            yield chunk.iloc[start:start + block_rows]
+
+
+def _partition_value(value):
+    """
+    Return the directory name component for a partition value.
+    """
+    return _NULL_PARTITION if pd.isna(value) else str(value)
+
+
+def _replace(tmp_path, target):
+    """
+    Move `tmp_path` to `target`, replacing any existing file or directory.
+    """
+    if os.path.isdir(target):
+        # A directory cannot be replaced by a rename; move it aside first.
+        backup = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(target)),
+                                  prefix=".old-")
+        os.replace(target, os.path.join(backup, "old"))
+        os.replace(tmp_path, target)
+        shutil.rmtree(backup)
+    else:
+        os.replace(tmp_path, target)
+
+
+def _is_buffer(target):
+    """
+    Return True if `target` is an open file object rather than a path.
+    """
+    return hasattr(target, "write")
+
+
+def _create_file(path, mode):
+    """
+    Create an empty file at `path`, failing if it exists.
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode))
+
+
+def _create_temp(parent, create, mode):
+    """
+    Create a new, uniquely named temporary file or directory in `parent`
+    with `create(path, mode)` and return its path.
+
+    Unlike `tempfile`, which restricts the mode to the owner, the kernel
+    applies the process umask to `mode`, so the output gets the permissions
+    of any newly created file without reading or changing the umask.
+    """
+    while True:
+        path = os.path.join(parent, f".tmp-{uuid.uuid4().hex}")
+        try:
+            create(path, mode)
+        except FileExistsError:
+            continue
+        return path
+
+
+def _import_pyarrow():
+    """
+    Import `pyarrow`, raising a helpful error if it is missing.
+    """
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet and Feather export require the optional 'pyarrow' "
+            "package. Install it with 'pip install pyarrow'."
+        ) from exc
+    return pyarrow
@@ -20,6 +20,8 @@ preview_data = connector.preview_sheet(sheet_name='Sheet1', num_rows=10)
 
 import pandas as pd
 
+from ..preprocessor.memory_optimizer import optimize_memory
+
 class ExcelConnector:
     """
      _summary_
@@ -34,8 +36,9 @@ class ExcelConnector:
             file_path (str): The path to the Excel file.
         """
         self.file_path = file_path
+        self.memory_report = None
 
-    def load_data(self, sheet_name=0, header=0):
+    def load_data(self, sheet_name=0, header=0, optimize=False):
         """
         Load data from a specified sheet in the Excel file.
 
@@ -44,6 +47,9 @@ class ExcelConnector:
               to read data from. Defaults to the first sheet.
             header (int, list of int, optional): Row (0-indexed) to use as the
               header.
+            optimize (bool, optional): Shrink the column types of the result
+              with `optimize_memory`, keeping its report as `memory_report`.
+              Defaults to False.
 
         Returns:
             DataFrame: A pandas DataFrame containing the data from the Excel
@@ -52,9 +58,12 @@ class ExcelConnector:
         # TODO: add more exceptions with less broad catching
         """
         try:
-            return pd.read_excel(self.file_path, sheet_name=sheet_name, header=header)
+            df = pd.read_excel(self.file_path, sheet_name=sheet_name, header=header)
         except Exception as e:
             raise Exception(f"Error reading Excel file: {e}") from e
+        if optimize:
+            df, self.memory_report = optimize_memory(df)
+        return df
 
     def load_all_sheets(self):
         """
@@ -26,6 +26,8 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError
 import pandas as pd
 from pandas.errors import DatabaseError
 
+from ..preprocessor.memory_optimizer import optimize_memory
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +76,7 @@ class SQLConnector:
         self.db_uri = db_uri
         self.engine = sqlalchemy.create_engine(db_uri)
         self._logger = None
+        self.memory_report = None
 
     @property
     def logger(self):
@@ -88,12 +91,15 @@ class SQLConnector:
     def __repr__(self) -> str:
         return f"SQLConnector(db_uri={self.db_uri})"
 
-    def query_data(self, query):
+    def query_data(self, query, optimize=False):
         """
         Execute a SQL query and return the results as a DataFrame.
 
         Args:
             query (str): The SQL query to execute.
+            optimize (bool, optional): Shrink the column types of the result
+              with `optimize_memory`, keeping its report as `memory_report`.
+              Defaults to False.
 
         Returns:
             DataFrame: The result of the SQL query.
@@ -104,10 +110,13 @@ class SQLConnector:
         self.logger.info("Executing query: %s", query)
         try:
             with self.engine.connect() as connection:
-                return pd.DataFrame(pd.read_sql_query(query, connection))
+                df = pd.DataFrame(pd.read_sql_query(query, connection))
         except (SQLAlchemyError, DatabaseError) as e:
             self.logger.error("Error executing query: %s. Error: %s", query, str(e))
             raise SQLConnectorError(e, query) from e
+        if optimize:
+            df, self.memory_report = optimize_memory(df)
+        return df
 
     def insert_data(self, df, table_name, if_exists="append"):
         """
@@ -1,4 +1,12 @@
 # models/__init__.py
 
-from .feature_engineer import FeatureEngineer
-from .model_evaluator import ModelEvaluator
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "FeatureEngineer": ".feature_engineer",
+        "ModelEvaluator": ".model_evaluator",
+    },
+)
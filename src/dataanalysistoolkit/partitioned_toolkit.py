@@ -0,0 +1,613 @@
+"""partitioned_toolkit.py
+
+This module contains PartitionedDataAnalysisToolkit, which runs the
+DataAnalysisToolkit API on a dataset stored as a list of on-disk partitions,
+such as the part files of a Spark or Hive export or the output of
+`export_data(..., partition_cols=...)`. Except for the exact statistics
+noted below, only one partition, or one chunk of a partition, is held in
+memory at a time, so datasets several times larger than RAM can be analyzed
+and cleaned.
+
+Operations follow map/reduce semantics:
+
+- Statistics, quantiles and outlier detection reduce over the partitions
+  exactly as DataAnalysisToolkit does over the chunks of a file in streaming
+  mode. The exceptions are `calculate_budget_statistics` and
+  `detect_outliers` with a method other than 'zscore': their exact medians,
+  modes and quantiles need whole columns, so the requested columns of every
+  partition, and only those, are loaded into memory together. For bounded
+  memory use `get_summary_statistics`, `approximate_quantiles` or the
+  'zscore' method.
+- Missing-value handling maps over the partitions and writes the results as
+  new partitions in a working directory.
+- Categorical encoding first reduces the vocabularies of every partition and
+  then maps the encoding over them, so codes are consistent across the
+  dataset.
+- Deduplication maps over the partitions in order with a shared, disk
+  spilling hash set, keeping the first occurrence of each row.
+- Splitting into training and testing sets maps over the partitions and
+  returns two partitioned toolkits.
+- Export writes every partition, in order, to a single output.
+
+Directories named `col=value`, as written by Hive, Spark and
+`export_data(..., partition_cols=...)`, are read back as a column `col`
+holding `value` for every row below them. Column types are combined across
+partitions, e.g. a column that is int64 in one partition and float64 in
+another is float64; Parquet and Feather partitions are typed from their
+schemas without reading any rows.
+
+The dataset is never loaded whole, so `data`, `optimize_memory` and the
+helpers built on `data`, such as `visualizer`, raise a ValueError.
+
+The source partitions are never modified; rewritten partitions live in
+`workdir`, which is deleted with the toolkit unless it was given explicitly.
+Partitions may be CSV, Parquet or Feather files; Parquet and Feather require
+the optional `pyarrow` package.
+
+Example usage:
+
+    from dataanalysistoolkit import PartitionedDataAnalysisToolkit
+
+    toolkit = PartitionedDataAnalysisToolkit('path/to/dataset_dir')
+    summary = toolkit.get_summary_statistics()
+    toolkit.handle_missing_values({'price': 0, 'id': toolkit.DROP})
+    toolkit.encode_categorical_features()
+    toolkit.drop_duplicates(subset=['id'])
+    train, test = toolkit.split_data('target', hash_column='id')
+    toolkit.export_data('clean.parquet')
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+import weakref
+from urllib.parse import unquote
+
+import numpy as np
+import pandas as pd
+from pandas.core.dtypes.cast import find_common_type
+
+from .data_analysis_toolkit import (
+    DataAnalysisToolkit,
+    _apply_missing_value_plan,
+    _hash_split,
+)
+
+# pylint: disable=import-outside-toplevel
+
+# Name of the partition directory for missing values, as used by Hive.
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+_READERS = {
+    ".csv": lambda path, columns: pd.read_csv(path, usecols=columns),
+    ".parquet": lambda path, columns: pd.read_parquet(path, columns=columns),
+    ".feather": lambda path, columns: pd.read_feather(path, columns=columns),
+}
+
+
+class PartitionedDataAnalysisToolkit(DataAnalysisToolkit):
+    """
+    DataAnalysisToolkit over a dataset split into on-disk partitions.
+
+    Attributes:
+        partitions (list of str): Paths of the current partitions, in order.
+        workdir (str): Directory in which rewritten partitions are stored.
+        partition_values (dict): Maps each partition path to the values of
+          the columns encoded in its directory names, `{col: value}`.
+    """
+
+    def __init__(self, partitions, chunksize=None, workdir=None, executor=None):
+        """
+        Initialize the toolkit with a list of partitions.
+
+        Args:
+            partitions (str or list of str): A directory, searched
+              recursively for CSV, Parquet and Feather files, a glob pattern,
+              or a list of partition paths. Partitions are processed in
+              sorted path order for a directory or pattern, and in the given
+              order for a list.
+            chunksize (int, optional): Read CSV partitions in chunks of at
+              most this many rows when computing statistics. Default is None,
+              which reads one whole partition at a time.
+            workdir (str, optional): Directory for rewritten partitions.
+              Default is a temporary directory that is deleted with the
+              toolkit.
+            executor (ColumnExecutor, optional): Pool that runs column-wise
+              work in parallel across columns.
+
+        Raises:
+            ValueError: If no partitions are found or a partition has an
+            unsupported file type.
+        """
+        self.partitions, root = _resolve_partitions(partitions)
+        self.partition_values = _hive_values(self.partitions, root)
+        self._generation = 0
+        self._cleanup = None
+        if workdir is None:
+            self.workdir = tempfile.mkdtemp(prefix="dataanalysistoolkit-")
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self.workdir, True)
+        else:
+            self.workdir = workdir
+            os.makedirs(workdir, exist_ok=True)
+        super().__init__(None, chunksize=chunksize, executor=executor)
+
+    def __repr__(self) -> str:
+        return (
+            f"PartitionedDataAnalysisToolkit(partitions={len(self.partitions)}, "
+            f"workdir={self.workdir})"
+        )
+
+    @property
+    def streaming(self):
+        """bool: Always True; the data is read one partition at a time."""
+        return True
+
+    def _check_source(self):
+        """
+        The partitions are checked when they are resolved.
+        """
+
+    def _require_in_memory(self, operation):
+        """
+        Raise a ValueError for operations that need the whole dataset in
+        memory.
+        """
+        raise ValueError(
+            f"{operation} is not supported for partitioned data, which is never "
+            "loaded whole; use map_partitions or iter_partitions instead."
+        )
+
+    @property
+    def data(self):
+        """Not available; raises a ValueError. Use `iter_partitions`."""
+        return self._require_in_memory("data")
+
+    @data.setter
+    def data(self, new_data):
+        self._require_in_memory("data")
+
+    @property
+    def shape(self):
+        return self._cached_metadata("shape", lambda: (
+            sum(len(chunk) for chunk in self.iter_chunks(usecols=self.column_names[:1])),
+            len(self.column_names),
+        ))
+
+    @property
+    def dtypes(self):
+        return self._cached_metadata("dtypes", self._combined_dtypes)
+
+    @property
+    def missing_values(self):
+        return self._cached_metadata("missing_values", lambda: pd.concat(
+            (chunk.isnull().sum() for chunk in self.iter_chunks()), axis=1
+        ).sum(axis=1).astype(np.int64).reindex(self.dtypes.index, fill_value=0))
+
+    def _header(self):
+        """
+        Return the column names of the data.
+        """
+        return self.dtypes.index
+
+    def _combined_dtypes(self):
+        """
+        Return the common type of every column across the partitions, in
+        order of first appearance.
+        """
+        dtypes = {}
+        for path in self.partitions:
+            partition_dtypes = _partition_dtypes(path, self.chunksize).to_dict()
+            for col, value in self.partition_values.get(path, {}).items():
+                partition_dtypes.setdefault(col, pd.Series([value]).dtype)
+            for col, dtype in partition_dtypes.items():
+                dtypes[col] = dtype if col not in dtypes else find_common_type(
+                    [dtypes[col], dtype]
+                )
+        return pd.Series(dtypes, dtype=object)
+
+    def iter_partitions(self, usecols=None):
+        """
+        Iterate over the partitions, reading each one whole.
+
+        Args:
+            usecols (list of str, optional): Only read these columns.
+
+        Yields:
+            DataFrame: The next partition.
+        """
+        for path in self.partitions:
+            yield self._read(path, usecols)
+
+    def iter_chunks(self, usecols=None):
+        """
+        Iterate over the data one partition, or one chunk of a CSV
+        partition, at a time. Chunks are numbered consecutively across
+        partitions, so their indexes do not overlap.
+
+        Args:
+            usecols (list of str, optional): Only read these columns.
+
+        Yields:
+            DataFrame: The next chunk of the data.
+        """
+        offset = 0
+        for path in self.partitions:
+            if self.chunksize is not None and _extension(path) == ".csv":
+                values = self.partition_values.get(path, {})
+                file_columns = _file_columns(usecols, values)
+                with pd.read_csv(path, chunksize=self.chunksize,
+                                 usecols=file_columns) as reader:
+                    for chunk in reader:
+                        chunk = _add_values(chunk, values, usecols)
+                        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                        offset += len(chunk)
+                        yield chunk
+                continue
+            chunk = self._read(path, usecols)
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+    def _read(self, path, usecols=None):
+        """
+        Read one partition, with the columns encoded in its directory names.
+        """
+        values = self.partition_values.get(path, {})
+        return _add_values(
+            _read_partition(path, _file_columns(usecols, values)), values, usecols
+        )
+
+    def map_partitions(self, func):
+        """
+        Replace every partition with `func(partition)`.
+
+        The results are written to `workdir` in the format of the source
+        partition, including any columns encoded in its directory names.
+        Partitions written by an earlier map are deleted once the new ones
+        are complete; source partitions are never touched.
+
+        Args:
+            func (callable): Takes a partition DataFrame and returns the new
+              one.
+
+        Returns:
+            list of str: The paths of the new partitions.
+        """
+        from .interfaces import DataExporter
+
+        self._generation += 1
+        new_partitions = []
+        for i, (path, partition) in enumerate(zip(self.partitions, self.iter_partitions())):
+            extension = _extension(path)
+            new_path = os.path.join(
+                self.workdir, f"gen{self._generation:03d}-part-{i:05d}{extension}"
+            )
+            DataExporter.for_path(new_path).write([func(partition)], new_path)
+            new_partitions.append(new_path)
+
+        old_partitions, self.partitions = self.partitions, new_partitions
+        # The new partitions hold the directory-encoded columns themselves.
+        self.partition_values = {}
+        for path in old_partitions:
+            if os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.workdir):
+                os.remove(path)
+        self._reset_helpers()
+        self.invalidate_metadata()
+        return new_partitions
+
+    def handle_missing_values(self, column_name, strategy="drop", fill_value=None):
+        """
+        Handle missing values in one or more columns of every partition.
+
+        Takes the same arguments as DataAnalysisToolkit.handle_missing_values.
+
+        Returns:
+            None
+        """
+        drop_columns, fills = self._missing_value_plan(column_name, strategy, fill_value)
+        self.map_partitions(
+            lambda partition: _apply_missing_value_plan(partition, drop_columns, fills)
+        )
+
+    def drop_duplicates(self, subset=None, keep="first", method="pandas", output=None,
+                        max_memory_hashes=10_000_000):
+        """
+        Drop duplicate rows across all partitions, keeping the first
+        occurrence of each row in partition order.
+
+        Takes the same arguments as DataAnalysisToolkit.drop_duplicates.
+        Rows are compared by hash with a disk-spilling hash set whatever the
+        `method`. If `output` is given the deduplicated data is written there
+        and the partitions are left unchanged.
+
+        Returns:
+            None
+        """
+        if output is not None:
+            super().drop_duplicates(subset, keep, method, output, max_memory_hashes)
+            return
+        if keep != "first":
+            raise ValueError("Only keep='first' is supported for partitioned data.")
+        from .preprocessor import StreamingDeduplicator
+        with StreamingDeduplicator(subset, max_memory_hashes) as dedup:
+            self.map_partitions(dedup.unique)
+
+    def encode_categorical_features(self, columns=None, encoder=None):
+        """
+        Encode categorical features as integer codes, consistently across
+        partitions.
+
+        The vocabularies of every partition are collected first, reading only
+        the columns to encode, and then every partition is encoded with them.
+
+        Args:
+            columns (list of str, optional): Columns to encode. Defaults to
+              every categorical column.
+            encoder (CategoricalEncoder, optional): An encoder with saved
+              vocabularies to reuse.
+
+        Returns:
+            CategoricalEncoder: The encoder holding the vocabularies.
+        """
+        if encoder is not None:
+            self._categorical_encoder = encoder
+        if columns is None:
+            columns = self.categorical_columns
+        encoder = self.categorical_encoder
+        if encoder.handle_unknown == "extend":
+            for partition in self.iter_partitions(usecols=columns):
+                encoder.partial_fit(partition, columns)
+        self.map_partitions(
+            lambda partition: encoder.transform(partition, columns, executor=self.executor)
+        )
+        return encoder
+
+    def split_data(self, target_column, test_size=0.2, random_state=None,
+                   stratify=False, hash_column=None, return_indices=False):
+        """
+        Split the data into training and testing sets, one partition at a
+        time.
+
+        Each partition is split on its own and its training and testing rows
+        are written as new partitions, so neither set is ever held in memory.
+        Rows are assigned at random, in the proportion `test_size`, or
+        deterministically by the hash of `hash_column` as in
+        DataAnalysisToolkit.split_data. With `stratify` every class of the
+        target column is split in that proportion within each partition.
+
+        Args:
+            target_column (str): The name of the target column.
+            test_size (float, optional): The proportion of the rows in the
+              test set. Default is 0.2.
+            random_state (int, optional): Seed of the random assignment.
+            stratify (bool, optional): Keep the class proportions of the
+              target column in both sets. Default is False.
+            hash_column (str, optional): Split deterministically by the hash
+              of this column. Default is None.
+            return_indices (bool, optional): Not supported; row positions
+              would index data that is never in memory.
+
+        Returns:
+            tuple: (train, test) PartitionedDataAnalysisToolkit objects with
+            one partition for each partition of this toolkit. Their files
+            are deleted with them, unless this toolkit was given a `workdir`,
+            in which case they are kept in a subdirectory of it.
+
+        Raises:
+            ValueError: If a column is not found, if both `stratify` and
+            `hash_column` are given, or if `return_indices` is True.
+        """
+        self._check_column(target_column)
+        if return_indices:
+            raise ValueError("return_indices is not supported for partitioned data.")
+        if hash_column is not None:
+            if stratify:
+                raise ValueError("stratify and hash_column cannot be combined.")
+            self._check_column(hash_column)
+        from .interfaces import DataExporter
+
+        rng = np.random.default_rng(random_state)
+        parent = None if self._cleanup is not None else self.workdir
+        directories = {
+            name: tempfile.mkdtemp(prefix=f"{name}-", dir=parent) for name in ("train", "test")
+        }
+        outputs = {"train": [], "test": []}
+        for i, (path, partition) in enumerate(zip(self.partitions, self.iter_partitions())):
+            if hash_column is not None:
+                train_idx, test_idx = _hash_split(partition[hash_column], test_size)
+            else:
+                train_idx, test_idx = _random_split(
+                    partition[target_column] if stratify else None,
+                    len(partition), test_size, rng,
+                )
+            for name, rows in (("train", train_idx), ("test", test_idx)):
+                new_path = os.path.join(directories[name], f"part-{i:05d}{_extension(path)}")
+                DataExporter.for_path(new_path).write([partition.iloc[rows]], new_path)
+                outputs[name].append(new_path)
+        sets = []
+        for name in ("train", "test"):
+            toolkit = type(self)(outputs[name], chunksize=self.chunksize,
+                                 workdir=directories[name], executor=self.executor)
+            if self._cleanup is not None:
+                # The set owns its files, like a temporary workdir.
+                toolkit._cleanup = weakref.finalize(
+                    toolkit, shutil.rmtree, directories[name], True
+                )
+            sets.append(toolkit)
+        return tuple(sets)
+
+    def cleanup(self):
+        """
+        Delete the working directory if the toolkit created it.
+        """
+        if self._cleanup is not None:
+            self._cleanup()
+
+
+def _resolve_partitions(partitions):
+    """
+    Expand a directory, glob pattern or list into a list of partition paths,
+    and return it with the root directory of the dataset.
+    """
+    root = None
+    if isinstance(partitions, (str, os.PathLike)):
+        partitions = os.fspath(partitions)
+        if os.path.isdir(partitions):
+            root = partitions
+            paths = glob.glob(os.path.join(partitions, "**", "*"), recursive=True)
+            paths = [path for path in paths if _extension(path) in _READERS]
+        else:
+            root = _glob_root(partitions)
+            paths = glob.glob(partitions)
+        partitions = sorted(paths)
+    partitions = [os.fspath(path) for path in partitions]
+    if not partitions:
+        raise ValueError("No partitions found.")
+    for path in partitions:
+        if _extension(path) not in _READERS:
+            raise ValueError(
+                f"Unsupported partition file type: '{path}'. "
+                f"Supported types are {sorted(_READERS)}."
+            )
+    if root is None:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path))
+                                   for path in partitions])
+    return partitions, root
+
+
+def _glob_root(pattern):
+    """
+    Return the directory part of a glob pattern before its first wildcard.
+    """
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def _hive_values(partitions, root):
+    """
+    Return the `{col: value}` pairs of the `col=value` directories between
+    `root` and each partition. A column whose values are all numbers gets
+    numbers; Hive's directory for missing values gives a missing value.
+    """
+    raw = {}
+    for path in partitions:
+        relative = os.path.relpath(os.path.dirname(os.path.abspath(path)),
+                                   os.path.abspath(root))
+        raw[path] = dict(
+            part.split("=", 1) for part in relative.split(os.sep) if "=" in part
+        )
+    columns = {col for values in raw.values() for col in values}
+    converted = {}
+    for col in columns:
+        strings = pd.Series([
+            None if values.get(col) in (None, _NULL_PARTITION) else unquote(values[col])
+            for values in raw.values()
+        ], dtype=object)
+        try:
+            converted[col] = pd.to_numeric(strings)
+        except (TypeError, ValueError):
+            converted[col] = strings
+    return {
+        path: {
+            col: _missing_or(converted[col].iloc[i])
+            for col in values
+        }
+        for i, (path, values) in enumerate(raw.items())
+    }
+
+
+def _missing_or(value):
+    """
+    Return `value` as a plain Python scalar, or NaN if it is missing.
+    """
+    if pd.isna(value):
+        return np.nan
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _file_columns(usecols, values):
+    """
+    Return the columns to read from a partition file, leaving out those
+    encoded in its directory names.
+    """
+    if usecols is None:
+        return None
+    return [col for col in usecols if col not in values]
+
+
+def _add_values(frame, values, usecols):
+    """
+    Add the columns encoded in a partition's directory names to `frame`.
+    """
+    for col, value in values.items():
+        if col not in frame.columns and (usecols is None or col in usecols):
+            frame[col] = value
+    return frame
+
+
+def _partition_dtypes(path, chunksize):
+    """
+    Return the column types of one partition file. Parquet and Feather
+    types come from the file's schema; CSV files are parsed, in chunks of
+    `chunksize` rows if given, and the types of the chunks combined.
+    """
+    extension = _extension(path)
+    if extension in (".parquet", ".feather"):
+        import pyarrow
+        if extension == ".parquet":
+            from pyarrow import parquet
+            schema = parquet.read_schema(path)
+        else:
+            with pyarrow.memory_map(path) as source:
+                schema = pyarrow.ipc.open_file(source).schema
+        return schema.empty_table().to_pandas().dtypes
+    if chunksize is None:
+        return pd.read_csv(path).dtypes
+    dtypes = None
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            dtypes = chunk.dtypes if dtypes is None else pd.Series({
+                col: find_common_type([dtype, chunk.dtypes[col]])
+                for col, dtype in dtypes.items()
+            }, dtype=object)
+    return dtypes if dtypes is not None else pd.read_csv(path, nrows=0).dtypes
+
+
+def _random_split(target, size, test_size, rng):
+    """
+    Return the positions of the train and test rows of a random split of
+    `size` rows, splitting each class of `target` separately if given.
+    """
+    if target is None:
+        groups = [np.arange(size)]
+    else:
+        codes = pd.factorize(target, use_na_sentinel=False)[0]
+        order = np.argsort(codes, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+    test = [
+        rng.permutation(group)[:int(round(test_size * len(group)))]
+        for group in groups if len(group)
+    ]
+    in_test = np.zeros(size, dtype=bool)
+    if test:
+        in_test[np.concatenate(test)] = True
+    return np.flatnonzero(~in_test), np.flatnonzero(in_test)
+
+
+def _extension(path):
+    """
+    Return the lower-case file extension of `path`.
+    """
+    return os.path.splitext(path)[1].lower()
+
+
+def _read_partition(path, columns=None):
+    """
+    Read one partition, optionally only some of its columns.
+    """
+    return _READERS[_extension(path)](path, columns)
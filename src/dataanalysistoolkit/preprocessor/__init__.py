@@ -1,5 +1,17 @@
 # preprocessor/__init__.py
 
-from .data_prep import DataPreprocessor
-from .data_formatter import DataFormatter
-from .data_imputer import DataImputer
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "CategoricalEncoder": ".categorical_encoder",
+        "DataPreprocessor": ".data_prep",
+        "duplicated_rows": ".deduplicator",
+        "optimize_memory": ".memory_optimizer",
+        "DataFormatter": ".data_formatter",
+        "DataImputer": ".data_imputer",
+        "StreamingDeduplicator": ".deduplicator",
+    },
+)
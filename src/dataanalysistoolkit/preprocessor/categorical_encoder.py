@@ -0,0 +1,251 @@
+"""categorical_encoder.py
+
+This module provides a CategoricalEncoder class that replaces the values of
+categorical columns with integer codes through the pandas category dtype.
+Each column's vocabulary, the list of categories in code order, is kept so
+that later batches of data are encoded consistently, new categories can be
+added incrementally without renumbering the existing ones, and the mapping
+can be saved and restored. Codes use the smallest integer type that fits the
+vocabulary (int8 for up to 127 categories, then int16, int32 or int64), and
+missing values are encoded as -1.
+
+Example usage:
+encoder = CategoricalEncoder()
+encoded = encoder.fit_transform(df, ['city', 'product'])
+more = encoder.transform(next_batch)           # new categories are appended
+restored = encoder.inverse_transform(encoded)
+with open('vocabularies.json', 'w', encoding='utf-8') as file:
+    json.dump(encoder.to_dict(), file)
+"""
+
+import pandas as pd
+
+_UNKNOWN_POLICIES = ("extend", "error", "missing")
+
+
+class CategoricalEncoder:
+    """
+    Encode categorical columns as integer codes with reusable vocabularies.
+
+    Attributes:
+        vocabularies (dict): Maps each fitted column to a pandas Index of its
+          categories; a category's position in the Index is its code.
+        handle_unknown (str): What `transform` does with categories that are
+          not in the vocabulary: 'extend' appends them, 'error' raises a
+          ValueError and 'missing' encodes them as -1.
+    """
+
+    def __init__(self, handle_unknown="extend"):
+        """
+        Initialize the encoder with empty vocabularies.
+
+        Args:
+            handle_unknown (str, optional): 'extend', 'error' or 'missing'.
+              Defaults to 'extend'.
+
+        Raises:
+            ValueError: If `handle_unknown` is not supported.
+        """
+        if handle_unknown not in _UNKNOWN_POLICIES:
+            raise ValueError(
+                f"Unknown handle_unknown policy: '{handle_unknown}'. "
+                f"Available policies are {list(_UNKNOWN_POLICIES)}."
+            )
+        self.handle_unknown = handle_unknown
+        self.vocabularies = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"CategoricalEncoder(columns={list(self.vocabularies)}, "
+            f"handle_unknown={self.handle_unknown})"
+        )
+
+    def partial_fit(self, data, columns=None):
+        """
+        Add the categories found in `data` to the vocabularies.
+
+        A new column's categories are sorted, so a single fit numbers them as
+        `LabelEncoder` would. Categories first seen in later calls are
+        appended, so existing codes never change.
+
+        Args:
+            data (DataFrame): The data to learn categories from.
+            columns (list of str, optional): Columns to fit. Defaults to the
+              fitted columns, or to every object and category column if
+              nothing has been fitted yet.
+
+        Returns:
+            CategoricalEncoder: This encoder, updated in place.
+        """
+        for col in self._columns(data, columns):
+            categories = _categories(data[col])
+            known = self.vocabularies.get(col)
+            if known is None:
+                self.vocabularies[col] = categories
+            else:
+                new = categories[~categories.isin(known)]
+                if len(new):
+                    self.vocabularies[col] = known.append(new)
+        return self
+
+    def fit(self, data, columns=None):
+        """
+        Learn the vocabularies of `columns` from scratch.
+
+        Args:
+            data (DataFrame): The data to learn categories from.
+            columns (list of str, optional): Columns to fit. Defaults to every
+              object and category column.
+
+        Returns:
+            CategoricalEncoder: This encoder.
+        """
+        columns = self._columns(data, columns)
+        for col in columns:
+            self.vocabularies.pop(col, None)
+        return self.partial_fit(data, columns)
+
+    def transform(self, data, columns=None, executor=None):
+        """
+        Replace categories with their integer codes.
+
+        Args:
+            data (DataFrame): The data to encode.
+            columns (list of str, optional): Columns to encode. Defaults to
+              every fitted column present in `data`.
+            executor (ColumnExecutor, optional): Encode batches of columns in
+              parallel. Defaults to None, which encodes serially.
+
+        Returns:
+            DataFrame: A copy of `data` with the columns replaced by codes.
+
+        Raises:
+            ValueError: If a column has not been fitted, or if it holds an
+            unknown category and `handle_unknown` is 'error'.
+        """
+        if columns is None:
+            columns = [col for col in self.vocabularies if col in data.columns]
+        if self.handle_unknown == "extend":
+            self.partial_fit(data, columns)
+        for col in columns:
+            if col not in self.vocabularies:
+                raise ValueError(f"Column '{col}' has not been fitted.")
+        if executor is None:
+            encoded = self._encode(data[columns], columns)
+        else:
+            encoded = {}
+            for batch in executor.map_columns(self._encode, data, columns):
+                encoded.update(batch)
+        return _replace_columns(data, encoded)
+
+    def fit_transform(self, data, columns=None):
+        """
+        Fit the vocabularies of `columns` and encode them.
+
+        Returns:
+            DataFrame: A copy of `data` with the columns replaced by codes.
+        """
+        columns = self._columns(data, columns)
+        return self.fit(data, columns).transform(data, columns)
+
+    def inverse_transform(self, data, columns=None):
+        """
+        Replace integer codes with their categories.
+
+        Args:
+            data (DataFrame): Data encoded by this encoder.
+            columns (list of str, optional): Columns to decode. Defaults to
+              every fitted column present in `data`.
+
+        Returns:
+            DataFrame: A copy of `data` with category columns restored. Code
+            -1 becomes a missing value.
+        """
+        if columns is None:
+            columns = [col for col in self.vocabularies if col in data.columns]
+        decoded = {
+            col: pd.Categorical.from_codes(data[col], categories=self.vocabularies[col])
+            for col in columns
+        }
+        return _replace_columns(data, {
+            col: pd.Series(values, index=data.index, name=col)
+            for col, values in decoded.items()
+        })
+
+    def to_dict(self):
+        """ Returns the vocabularies as a plain, JSON-serializable dict. """
+        return {
+            "handle_unknown": self.handle_unknown,
+            "vocabularies": {
+                col: categories.tolist() for col, categories in self.vocabularies.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """ Rebuilds an encoder from the output of `to_dict`. """
+        encoder = cls(handle_unknown=state["handle_unknown"])
+        encoder.vocabularies = {
+            col: pd.Index(categories) for col, categories in state["vocabularies"].items()
+        }
+        return encoder
+
+    def _columns(self, data, columns):
+        """
+        Resolve the default column selection.
+        """
+        if columns is not None:
+            return list(columns)
+        if self.vocabularies:
+            return [col for col in self.vocabularies if col in data.columns]
+        return data.select_dtypes(include=["object", "category"]).columns.tolist()
+
+    def _encode(self, data, columns):
+        """
+        Return a dict mapping each column to a Series of its codes.
+        """
+        return {
+            col: pd.Series(self._codes(data[col], col), index=data.index, name=col)
+            for col in columns
+        }
+
+    def _codes(self, values, col):
+        """
+        Return the codes of `values` under the vocabulary of `col`.
+        """
+        categories = self.vocabularies[col]
+        codes = pd.Categorical(values, categories=categories).codes
+        if self.handle_unknown == "error":
+            unknown = (codes == -1) & values.notna().to_numpy()
+            if unknown.any():
+                examples = values[unknown].unique()[:5].tolist()
+                raise ValueError(
+                    f"Column '{col}' contains unknown categories: {examples}."
+                )
+        return codes
+
+
+def _categories(values):
+    """
+    Return the distinct non-missing categories of a Series, sorted if possible.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.categories
+    uniques = pd.Index(values.dropna().unique())
+    try:
+        return uniques.sort_values()
+    except TypeError:
+        # Mixed types that cannot be ordered keep their order of appearance.
+        return uniques
+
+
+def _replace_columns(data, columns):
+    """
+    Return a copy of `data` with some columns replaced. Unlike
+    `DataFrame.assign`, this works with column names that are not strings,
+    such as the integers of `pd.read_csv(header=None)`.
+    """
+    result = data.copy()
+    for col, values in columns.items():
+        result[col] = values
+    return result
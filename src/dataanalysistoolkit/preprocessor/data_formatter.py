@@ -45,31 +45,46 @@ class DataFormatter:
         """
         self.data[date_column] = pd.to_datetime(self.data[date_column]).dt.strftime(date_format)
 
-    def categorize_columns(self, columns):
+    def categorize_columns(self, columns, executor=None):
         """
         Convert specified columns to categorical data types.
 
         Args:
             columns (list of str): A list of column names to be converted to categorical type.
+            executor (ColumnExecutor, optional): Convert batches of columns in
+                parallel. Defaults to None, which converts them serially.
 
         Returns:
             None: The method modifies the DataFrame in place.
         """
-        for col in columns:
-            self.data[col] = self.data[col].astype('category')
+        self._apply_by_column(_to_category, columns, executor)
 
-    def normalize_numeric(self, numeric_columns):
+    def normalize_numeric(self, numeric_columns, executor=None):
         """
         Normalize numeric columns in the DataFrame.
 
         Args:
             numeric_columns (list of str): A list of column names containing numeric data.
+            executor (ColumnExecutor, optional): Normalize batches of columns
+                in parallel. Defaults to None, which normalizes them serially.
 
         Returns:
             None: The method modifies the DataFrame in place.
         """
-        for col in numeric_columns:
-            self.data[col] = (self.data[col] - self.data[col].mean()) / self.data[col].std()
+        self._apply_by_column(_standardize, numeric_columns, executor)
+
+    def _apply_by_column(self, func, columns, executor):
+        """
+        Replace `columns` with `func(data[columns], columns=columns)`, run
+        over batches of columns when an executor is given.
+        """
+        columns = list(columns)
+        if executor is None:
+            results = [func(self.data[columns], columns=columns)]
+        else:
+            results = executor.map_columns(func, self.data, columns)
+        for result in results:
+            self.data[result.columns] = result
 
     def fill_missing_values(self, column, fill_value=None, method=None):
         """
@@ -114,3 +129,18 @@ class DataFormatter:
         self.data[column] = self.data[column].apply(transform_func)
 
     # Additional methods for other formatting tasks can be added here.
+
+
+def _to_category(data, columns):
+    """
+    Return `columns` of `data` converted to the category dtype.
+    """
+    return data[columns].astype('category')
+
+
+def _standardize(data, columns):
+    """
+    Return `columns` of `data` scaled to zero mean and unit standard deviation.
+    """
+    values = data[columns]
+    return (values - values.mean()) / values.std()
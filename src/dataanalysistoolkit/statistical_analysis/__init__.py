@@ -1 +1,21 @@
 # statistical_analysis/__init__.py
+
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "budget_statistics": ".descriptive",
+        "central_tendency": ".descriptive",
+        "DatasetProfiler": ".profiler",
+        "detect_outliers": ".outliers",
+        "HyperLogLog": ".profiler",
+        "KLLSketch": ".quantile_sketch",
+        "outlier_mask": ".outliers",
+        "RunningRegression": ".statistics_1",
+        "RunningStatistics": ".statistics_1",
+        "SpaceSaving": ".profiler",
+        "Statistics_1": ".statistics_1",
+    },
+)
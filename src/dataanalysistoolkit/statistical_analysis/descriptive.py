@@ -0,0 +1,101 @@
+"""statistical_analysis/descriptive.py
+
+This module computes the mean, median, mode and trimmed mean of many numeric
+columns together. The three order-based statistics share one sort per
+column: the median and the trimmed mean are read from the sorted values by
+position and the mode from their run lengths, instead of sorting once for
+the median, once for the trimmed mean and hashing every value again for the
+mode. The columns are sorted together as rows of a single contiguous array.
+Missing values are skipped.
+
+Example usage:
+stats = budget_statistics(df)                  # every numeric column
+stats = budget_statistics(df, ['a', 'b'], proportiontocut=0.1)
+print(stats.loc['a', 'median'])
+"""
+
+import numpy as np
+import pandas as pd
+
+STATISTICS = ["mean", "median", "mode", "trimmed_mean"]
+
+
+def central_tendency(values, proportiontocut=0.2):
+    """
+    Compute the mean, median, mode and trimmed mean of every column of a
+    2-D array.
+
+    The trimmed mean removes `int(proportiontocut * n)` values from each end,
+    matching `scipy.stats.trim_mean`. When several values share the highest
+    count, the smallest is reported as the mode, matching `Series.mode()[0]`.
+
+    Args:
+        values (array-like): Array of shape (rows, columns). Missing values
+          must be NaN and are skipped.
+        proportiontocut (float, optional): Fraction to cut from each end for
+          the trimmed mean. Defaults to 0.2.
+
+    Returns:
+        numpy.ndarray: Array of shape (columns, 4) holding the mean, median,
+        mode and trimmed mean of each column. All-NaN columns give NaN.
+
+    Raises:
+        ValueError: If `proportiontocut` leaves no values to average.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    # One row per column, so that each column is contiguous while sorting.
+    # NaNs sort to the end of each row.
+    rows = np.sort(values.T, axis=1)
+    counts = values.shape[0] - np.isnan(rows).sum(axis=1)
+
+    result = np.full((rows.shape[0], len(STATISTICS)), np.nan)
+    for j, (row, n) in enumerate(zip(rows, counts)):
+        if n == 0:
+            continue
+        row = row[:n]
+        lowercut = int(proportiontocut * n)
+        if lowercut >= n - lowercut:
+            raise ValueError("Proportion too big.")
+        result[j, 0] = row.mean()
+        result[j, 1] = (row[(n - 1) // 2] + row[n // 2]) / 2
+        result[j, 2] = _sorted_mode(row)
+        result[j, 3] = row[lowercut:n - lowercut].mean()
+    return result
+
+
+def budget_statistics(data, columns=None, proportiontocut=0.2):
+    """
+    Compute the mean, median, mode and trimmed mean of several columns of a
+    DataFrame.
+
+    Args:
+        data (DataFrame): The data to summarize.
+        columns (list of str, optional): Columns to summarize. Defaults to
+          every numeric column.
+        proportiontocut (float, optional): Fraction to cut from each end for
+          the trimmed mean. Defaults to 0.2.
+
+    Returns:
+        DataFrame: One row per column and one column per statistic: 'mean',
+        'median', 'mode' and 'trimmed_mean'.
+    """
+    if columns is None:
+        columns = data.select_dtypes(include="number").columns.tolist()
+    values = data[columns].to_numpy(dtype=float, na_value=np.nan)
+    return pd.DataFrame(
+        central_tendency(values, proportiontocut=proportiontocut),
+        index=pd.Index(columns),
+        columns=STATISTICS,
+    )
+
+
+def _sorted_mode(row):
+    """
+    Return the smallest most frequent value of a sorted 1-D array.
+    """
+    starts = np.flatnonzero(np.concatenate(([True], row[1:] != row[:-1])))
+    lengths = np.diff(np.append(starts, row.size))
+    # argmax returns the first, and therefore smallest, tied value.
+    return row[starts[lengths.argmax()]]
@@ -0,0 +1,141 @@
+"""statistical_analysis/outliers.py
+
+This module provides vectorized outlier detection over many columns at once.
+Instead of scoring one column at a time, the detectors work on a 2-D array of
+shape (rows, columns) and compute every column's statistics in a single pass
+with NumPy's NaN-aware reductions. Missing values are never flagged as
+outliers and do not affect the statistics of the other values.
+
+Supported methods:
+    zscore: |x - mean| / std > threshold (default 3).
+    iqr: x outside [Q1 - threshold * IQR, Q3 + threshold * IQR] (default 1.5).
+    mad: robust z-score 0.6745 * |x - median| / MAD > threshold (default 3.5).
+      Where more than half the values equal the median, MAD is 0 and the
+      mean absolute deviation is used instead, 0.7979 * |x - median| /
+      MeanAD > threshold.
+    isolation: an IsolationForest fitted to each column; requires
+      scikit-learn. Extra keyword arguments are passed to IsolationForest.
+
+Example usage:
+mask = outlier_mask(df[['a', 'b']].to_numpy(dtype=float), method='iqr')
+outliers = detect_outliers(df, method='mad')  # all numeric columns
+rows_with_outliers = outliers.any(axis=1)
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLDS = {"zscore": 3.0, "iqr": 1.5, "mad": 3.5, "isolation": None}
+
+# Scales the median absolute deviation to the standard deviation of a normal
+# distribution (Iglewicz and Hoaglin).
+_MAD_SCALE = 0.6745
+# Scales the mean absolute deviation likewise, sqrt(2 / pi); used for the
+# columns whose MAD is 0.
+_MEANAD_SCALE = 0.7979
+
+
+def outlier_mask(values, method="zscore", threshold=None, **kwargs):
+    """
+    Flag outliers in every column of a 2-D array.
+
+    Args:
+        values (array-like): Array of shape (rows, columns), or a 1-D array
+          treated as a single column. Missing values must be NaN.
+        method (str, optional): 'zscore', 'iqr', 'mad' or 'isolation'.
+          Defaults to 'zscore'.
+        threshold (float, optional): Cut-off for the method. Defaults to the
+          value in DEFAULT_THRESHOLDS.
+        **kwargs: Passed to IsolationForest when method is 'isolation'.
+
+    Returns:
+        numpy.ndarray: Boolean array with the shape of `values` where True
+        marks an outlier.
+
+    Raises:
+        ValueError: If `method` is unknown.
+    """
+    if method not in DEFAULT_THRESHOLDS:
+        raise ValueError(
+            f"Unknown method: '{method}'. "
+            f"Available methods are {sorted(DEFAULT_THRESHOLDS)}."
+        )
+    values = np.asarray(values, dtype=float)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, np.newaxis]
+    if threshold is None:
+        threshold = DEFAULT_THRESHOLDS[method]
+
+    if method == "isolation":
+        mask = _isolation_mask(values, **kwargs)
+    else:
+        # All-NaN columns and constant columns produce NaN scores and warnings;
+        # NaN compares as False, which is the answer we want for them.
+        with np.errstate(invalid="ignore", divide="ignore"), \
+                warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if method == "zscore":
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0)
+                mask = np.abs(values - mean) / std > threshold
+            elif method == "iqr":
+                q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+                spread = threshold * (q3 - q1)
+                mask = (values < q1 - spread) | (values > q3 + spread)
+            else:
+                median = np.nanmedian(values, axis=0)
+                deviation = np.abs(values - median)
+                mad = np.nanmedian(deviation, axis=0)
+                # A zero MAD would flag every value off the median.
+                zero = mad == 0
+                scale = np.where(zero, _MEANAD_SCALE, _MAD_SCALE)
+                spread = np.where(zero, np.nanmean(deviation, axis=0), mad)
+                mask = scale * deviation / spread > threshold
+    return mask[:, 0] if squeeze else mask
+
+
+def detect_outliers(data, columns=None, method="zscore", threshold=None, **kwargs):
+    """
+    Flag outliers in several columns of a DataFrame in one vectorized pass.
+
+    Args:
+        data (DataFrame): The data to check.
+        columns (list of str, optional): Columns to check. Defaults to every
+          numeric column.
+        method (str, optional): 'zscore', 'iqr', 'mad' or 'isolation'.
+          Defaults to 'zscore'.
+        threshold (float, optional): Cut-off for the method. Defaults to the
+          value in DEFAULT_THRESHOLDS.
+        **kwargs: Passed to IsolationForest when method is 'isolation'.
+
+    Returns:
+        DataFrame: Boolean mask with the index of `data` and one column per
+        checked column, where True marks an outlier.
+    """
+    if columns is None:
+        columns = data.select_dtypes(include="number").columns.tolist()
+    values = data[columns].to_numpy(dtype=float, na_value=np.nan)
+    mask = outlier_mask(values, method=method, threshold=threshold, **kwargs)
+    return pd.DataFrame(mask, index=data.index, columns=columns)
+
+
+def _isolation_mask(values, **kwargs):
+    """
+    Fit an IsolationForest to the non-missing values of each column.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sklearn.ensemble import IsolationForest
+
+    mask = np.zeros(values.shape, dtype=bool)
+    for j in range(values.shape[1]):
+        present = ~np.isnan(values[:, j])
+        if not present.any():
+            continue
+        forest = IsolationForest(**kwargs)
+        column = values[present, j].reshape(-1, 1)
+        mask[present, j] = forest.fit_predict(column) == -1
+    return mask
+
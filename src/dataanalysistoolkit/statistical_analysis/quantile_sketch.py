@@ -0,0 +1,273 @@
+"""statistical_analysis/quantile_sketch.py
+
+This module provides KLLSketch, a mergeable, bounded-memory quantile sketch
+(Karnin, Lang and Liberty, "Optimal Quantile Approximation in Streams",
+2016). The sketch keeps a small, weighted sample of the values it has seen
+in a stack of compactors. When a compactor fills up, its values are sorted
+and every other one, starting at a random offset, is promoted to the next
+level with twice the weight. Memory grows only with log(n), and the rank
+error is controlled by `k`: with the default k=200 quantiles are typically
+within about 1% of the true rank.
+
+Sketches built on separate partitions of the data, for example from chunks
+of a CSV file, batches of a SQL query or separate processes, can be merged,
+and their state can be serialized with `to_dict` and restored with
+`from_dict`. The exact minimum and maximum are always kept.
+
+Example usage:
+sketch = KLLSketch(k=200)
+for chunk in pd.read_csv('large_file.csv', chunksize=100_000):
+    sketch.update_batch(chunk['amount'])
+p50, p95, p99 = sketch.quantiles([0.5, 0.95, 0.99])
+
+batches = connector.execute_large_query_in_batches('SELECT amount FROM sales')
+other = KLLSketch.from_chunks(batches, column='amount')
+sketch.merge(other)
+"""
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    A mergeable quantile sketch with bounded memory.
+
+    Attributes:
+        k (int): Accuracy parameter; the capacity of the top compactor.
+        count (int): Number of values seen.
+        min (float): Smallest value seen, or None.
+        max (float): Largest value seen, or None.
+    """
+
+    # Ratio between the capacities of consecutive compactors.
+    _CAPACITY_RATIO = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=None):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k (int, optional): Accuracy parameter. Larger values give more
+              accurate quantiles and use proportionally more memory. Defaults
+              to 200.
+            seed (int, optional): Seed for the random compaction offsets.
+
+        Raises:
+            ValueError: If `k` is smaller than 8.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._rng = np.random.default_rng(seed)
+        self._levels = [np.empty(0)]
+
+    def __repr__(self) -> str:
+        return f"KLLSketch(k={self.k}, count={self.count}, retained={self.retained})"
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def retained(self):
+        """int: Number of values currently stored by the sketch."""
+        return sum(level.size for level in self._levels)
+
+    def _capacity(self, height):
+        """
+        Return the capacity of the compactor at `height`; the top compactor
+        holds `k` values and each one below it holds 2/3 as many.
+        """
+        depth = len(self._levels) - height - 1
+        return int(np.ceil(self.k * self._CAPACITY_RATIO ** depth)) + 1
+
+    def _max_retained(self):
+        return sum(self._capacity(height) for height in range(len(self._levels)))
+
+    def update(self, value):
+        """
+        Add a single value. NaN is ignored.
+
+        Args:
+            value (float): The value to add.
+        """
+        self.update_batch([value])
+
+    def update_batch(self, values):
+        """
+        Add many values at once. NaNs are ignored.
+
+        Args:
+            values (array-like): The values to add.
+
+        Returns:
+            KLLSketch: This sketch, updated in place.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        batch_min, batch_max = values.min(), values.max()
+        self.min = batch_min if self.min is None else min(self.min, batch_min)
+        self.max = batch_max if self.max is None else max(self.max, batch_max)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        """
+        Compact full levels, bottom up, until the sketch fits its budget.
+        """
+        while self.retained >= self._max_retained():
+            for height, level in enumerate(self._levels):
+                if level.size < self._capacity(height):
+                    continue
+                if height + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd value out stays behind at this level.
+                keep = level[-1:] if level.size % 2 else level[:0]
+                paired = level[:level.size - keep.size]
+                offset = int(self._rng.integers(2))
+                self._levels[height + 1] = np.concatenate(
+                    [self._levels[height + 1], paired[offset::2]]
+                )
+                self._levels[height] = keep
+                break
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other (KLLSketch): The sketch to merge in.
+
+        Returns:
+            KLLSketch: This sketch, updated in place.
+        """
+        if other.count == 0:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for height, level in enumerate(other._levels):
+            self._levels[height] = np.concatenate([self._levels[height], level])
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    def __add__(self, other):
+        """ Returns a new sketch holding both inputs. """
+        merged = KLLSketch(k=max(self.k, other.k))
+        return merged.merge(self).merge(other)
+
+    def _weighted_values(self):
+        """
+        Return the retained values in ascending order with the cumulative
+        weight of each.
+        """
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level.size, 2 ** height, dtype=np.int64)
+            for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs):
+        """
+        Estimate several quantiles.
+
+        Args:
+            qs (iterable of float): Quantiles to estimate, each in [0, 1].
+
+        Returns:
+            list of float: The estimated quantiles, or None if the sketch is
+            empty. q=0 and q=1 return the exact minimum and maximum.
+        """
+        if self.count == 0:
+            return None
+        qs = np.asarray(qs, dtype=float)
+        if ((qs < 0) | (qs > 1)).any():
+            raise ValueError("Quantiles must be between 0 and 1.")
+        values, cumulative = self._weighted_values()
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side="left")
+        result = values[np.minimum(positions, values.size - 1)]
+        result = np.where(qs == 0, self.min, np.where(qs == 1, self.max, result))
+        return result.tolist()
+
+    def quantile(self, q):
+        """
+        Estimate a single quantile.
+
+        Args:
+            q (float): The quantile to estimate, in [0, 1].
+
+        Returns:
+            float: The estimated quantile, or None if the sketch is empty.
+        """
+        result = self.quantiles([q])
+        return None if result is None else result[0]
+
+    def rank(self, value):
+        """
+        Estimate the fraction of values that are less than or equal to
+        `value`.
+
+        Args:
+            value (float): The value to rank.
+
+        Returns:
+            float: The estimated normalized rank, or None if the sketch is
+            empty.
+        """
+        if self.count == 0:
+            return None
+        values, cumulative = self._weighted_values()
+        position = np.searchsorted(values, value, side="right")
+        return 0.0 if position == 0 else float(cumulative[position - 1] / cumulative[-1])
+
+    def to_dict(self):
+        """ Returns the state as a plain, JSON-serializable dict. """
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": None if self.min is None else float(self.min),
+            "max": None if self.max is None else float(self.max),
+            "levels": [level.tolist() for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """ Rebuilds a sketch from the output of `to_dict`. """
+        sketch = cls(k=state["k"])
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch._levels = [np.asarray(level, dtype=float) for level in state["levels"]]
+        return sketch
+
+    @classmethod
+    def from_chunks(cls, chunks, column=None, k=200, seed=None):
+        """
+        Build a sketch from an iterable of batches, such as the chunks of
+        `pd.read_csv(..., chunksize=...)` or the batches of
+        `SQLConnector.execute_large_query_in_batches`.
+
+        Args:
+            chunks (iterable): DataFrames, Series or arrays.
+            column (str, optional): Column to read from each DataFrame batch.
+            k (int, optional): Accuracy parameter. Defaults to 200.
+            seed (int, optional): Seed for the random compaction offsets.
+
+        Returns:
+            KLLSketch: The sketch of every batch.
+        """
+        sketch = cls(k=k, seed=seed)
+        for chunk in chunks:
+            sketch.update_batch(chunk if column is None else chunk[column])
+        return sketch
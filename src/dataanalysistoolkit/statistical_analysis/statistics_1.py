@@ -1,10 +1,28 @@
 """statistical_analysis/statistics.py
-_summary_
+Descriptive statistics and simple linear regression over a series of values.
 
-_extended_summary_
+Statistics_1 keeps the values it is given so that order statistics (median,
+mode, quantiles) can be computed. Count, mean, variance, minimum and maximum
+are maintained incrementally by a RunningStatistics accumulator, which uses
+Welford's algorithm so that each `add_data` call is O(1) and numerically
+stable. Accumulators built on separate partitions of the data, for example in
+separate processes, can be merged exactly with Chan's parallel formula. Pass
+`keep_data=False` to Statistics_1, or use RunningStatistics directly, to
+summarize streams too large to keep in memory.
 
-Returns:
-    _type_: _description_
+With `use_numpy=True`, Statistics_1 stores its values in a NumPy array,
+accepts bulk `extend` calls, and sorts the data once, caching the sorted view
+until new data arrives, so that asking for many quantiles of a large series
+costs a single sort.
+
+Simple linear regression is fitted from running co-moments kept by a
+RunningRegression accumulator: each `add_paired_data` call is O(1), the
+slope, intercept, r-squared and standard errors are read off in O(1), and
+accumulators built on separate partitions can be merged.
+
+Values that are not numbers, such as strings, can still be summarized by the
+median, mode and quantiles of Statistics_1; the mean, variance and standard
+deviation of such data raise a TypeError.
 
 # Usage
 stats = Statistics_1([1, 2, 3, 4, 5, 5, 2])
@@ -21,37 +39,571 @@ print(
     f"Quantile (0.5): {stats.quantile(0.5)}\n",
     f"Linear Regression (Slope, Intercept): {stats.simple_linear_regression()}\n",
 )
+
+# Bulk usage with NumPy storage
+stats = Statistics_1(use_numpy=True)
+stats.extend(np.random.default_rng().normal(size=1_000_000))
+p05, p50, p95 = stats.quantiles([0.05, 0.5, 0.95])
+
+# Streaming usage, merging per-partition results
+left, right = RunningStatistics(), RunningStatistics()
+left.extend([1, 2, 3])
+right.extend([4, 5])
+total = left + right
+print(total.count, total.mean(), total.variance())
+
+# Refitting a trend line on a live feed
+trend = RunningRegression()
+trend.extend(xs, ys)
+trend.add(x_new, y_new)
+slope, intercept = trend.slope(), trend.intercept()
 """
 
 import statistics
 from collections import Counter
 
-class Statistics_1:
+import numpy as np
+
+from .quantile_sketch import KLLSketch
+
+
+class RunningStatistics:
+    """
+    Mergeable accumulator for count, mean, variance, minimum and maximum.
+
+    Values are folded in one at a time with Welford's algorithm, or a batch
+    at a time with NumPy, in O(1) memory. Two accumulators are combined with
+    Chan's parallel formula, which gives the same result as a single pass
+    over all of the values.
+
+    Attributes:
+        count (int): Number of values seen.
+        min: Smallest value seen, or None.
+        max: Largest value seen, or None.
+    """
+
     def __init__(self, data=None):
-        if data is None:
-            data = []
-        self.data = data
+        """
+        Initialize the accumulator, optionally with some starting values.
+
+        Args:
+            data (iterable, optional): Values to add.
+        """
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        if data is not None:
+            self.extend(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"RunningStatistics(count={self.count}, mean={self.mean()}, "
+            f"variance={self.variance()}, min={self.min}, max={self.max})"
+        )
+
+    def add_data(self, value):
+        """ Adds a single value in O(1). """
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def extend(self, values):
+        """ Adds a batch of values using vectorized NumPy reductions. """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        batch = RunningStatistics()
+        batch.count = values.size
+        batch._mean = float(values.mean())
+        batch._m2 = float(((values - batch._mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        return self.merge(batch)
+
+    def merge(self, other):
+        """
+        Folds another accumulator into this one with Chan's parallel formula.
+
+        Args:
+            other (RunningStatistics): The accumulator to merge in.
+
+        Returns:
+            RunningStatistics: This accumulator, updated in place.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self._mean, self._m2 = other.count, other._mean, other._m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def __add__(self, other):
+        """ Returns a new accumulator holding both inputs. """
+        return RunningStatistics().merge(self).merge(other)
+
+    def mean(self):
+        """ Returns the mean, or None if no values were added. """
+        if not self.count:
+            return None
+        return self._mean
+
+    def variance(self, ddof=0):
+        """
+        Returns the variance, or None if there are not enough values.
+
+        Args:
+            ddof (int, optional): Delta degrees of freedom. Defaults to 0,
+              the population variance.
+        """
+        if self.count <= ddof:
+            return None
+        return self._m2 / (self.count - ddof)
+
+    def standard_deviation(self, ddof=0):
+        """ Returns the standard deviation, or None. """
+        variance = self.variance(ddof)
+        return None if variance is None else variance ** 0.5
+
+    def to_dict(self):
+        """ Returns the state as a plain dict, e.g. to send between processes. """
+        return {
+            "count": self.count,
+            "mean": self._mean,
+            "m2": self._m2,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """ Rebuilds an accumulator from the output of `to_dict`. """
+        running = cls()
+        running.count = state["count"]
+        running._mean = state["mean"]
+        running._m2 = state["m2"]
+        running.min = state["min"]
+        running.max = state["max"]
+        return running
+
+
+class RunningRegression:
+    """
+    Mergeable accumulator for simple linear regression of paired data.
+
+    Rather than the raw sums of x, y, xy, x² and y², which lose precision
+    through cancellation when the values are large, it keeps the equivalent
+    centered sufficient statistics: the count, the means of x and y and the
+    sums of squared and cross deviations from them. They are updated one pair
+    at a time in the manner of Welford's algorithm, or a batch at a time with
+    NumPy, and combined across partitions with Chan's parallel formula.
+
+    Attributes:
+        count (int): Number of pairs seen.
+    """
+
+    def __init__(self, x=None, y=None):
+        """
+        Initialize the accumulator, optionally with some starting pairs.
+
+        Args:
+            x (array-like, optional): Starting x values.
+            y (array-like, optional): Starting y values, the same length as x.
+        """
+        self.count = 0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._sxx = 0.0
+        self._syy = 0.0
+        self._sxy = 0.0
+        if x is not None:
+            self.extend(x, y)
+
+    def __repr__(self) -> str:
+        return (
+            f"RunningRegression(count={self.count}, slope={self.slope()}, "
+            f"intercept={self.intercept()})"
+        )
+
+    def add(self, x, y):
+        """ Adds a single (x, y) pair in O(1). """
+        self.count += 1
+        dx = x - self._mean_x
+        dy = y - self._mean_y
+        self._mean_x += dx / self.count
+        self._mean_y += dy / self.count
+        self._sxx += dx * (x - self._mean_x)
+        self._syy += dy * (y - self._mean_y)
+        self._sxy += dx * (y - self._mean_y)
+
+    def extend(self, x, y):
+        """
+        Adds a batch of pairs using vectorized NumPy reductions.
+
+        Raises:
+            ValueError: If `x` and `y` have different lengths.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("x and y must have the same length.")
+        if x.size == 0:
+            return self
+        batch = RunningRegression()
+        batch.count = x.size
+        batch._mean_x = float(x.mean())
+        batch._mean_y = float(y.mean())
+        dx = x - batch._mean_x
+        dy = y - batch._mean_y
+        batch._sxx = float(dx @ dx)
+        batch._syy = float(dy @ dy)
+        batch._sxy = float(dx @ dy)
+        return self.merge(batch)
+
+    def merge(self, other):
+        """
+        Folds another accumulator into this one with Chan's parallel formula.
+
+        Args:
+            other (RunningRegression): The accumulator to merge in.
+
+        Returns:
+            RunningRegression: This accumulator, updated in place.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self._mean_x, self._mean_y = other._mean_x, other._mean_y
+            self._sxx, self._syy, self._sxy = other._sxx, other._syy, other._sxy
+            return self
+        count = self.count + other.count
+        weight = self.count * other.count / count
+        dx = other._mean_x - self._mean_x
+        dy = other._mean_y - self._mean_y
+        self._mean_x += dx * other.count / count
+        self._mean_y += dy * other.count / count
+        self._sxx += other._sxx + dx * dx * weight
+        self._syy += other._syy + dy * dy * weight
+        self._sxy += other._sxy + dx * dy * weight
+        self.count = count
+        return self
+
+    def __add__(self, other):
+        """ Returns a new accumulator holding both inputs. """
+        return RunningRegression().merge(self).merge(other)
+
+    def slope(self):
+        """ Returns the least-squares slope, or None if it is undefined. """
+        if self.count == 0 or self._sxx == 0:
+            return None
+        return self._sxy / self._sxx
+
+    def intercept(self):
+        """ Returns the least-squares intercept, or None if it is undefined. """
+        slope = self.slope()
+        if slope is None:
+            return None
+        return self._mean_y - slope * self._mean_x
+
+    def r_squared(self):
+        """
+        Returns the coefficient of determination, or None if it is undefined.
+        A constant y is fitted exactly and gives 1.0.
+        """
+        if self.slope() is None:
+            return None
+        if self._syy == 0:
+            return 1.0
+        return self._sxy ** 2 / (self._sxx * self._syy)
+
+    def residual_sum_of_squares(self):
+        """ Returns the sum of squared residuals, or None. """
+        if self.slope() is None:
+            return None
+        return max(self._syy - self._sxy ** 2 / self._sxx, 0.0)
+
+    def standard_errors(self):
+        """
+        Returns the standard errors of the slope and the intercept.
+
+        Returns:
+            tuple: (slope standard error, intercept standard error), or
+            (None, None) if fewer than three pairs were added or the slope is
+            undefined.
+        """
+        if self.count < 3 or self.slope() is None:
+            return None, None
+        residual_variance = self.residual_sum_of_squares() / (self.count - 2)
+        slope_error = (residual_variance / self._sxx) ** 0.5
+        intercept_error = (
+            residual_variance * (1 / self.count + self._mean_x ** 2 / self._sxx)
+        ) ** 0.5
+        return slope_error, intercept_error
+
+    def to_dict(self):
+        """ Returns the state as a plain dict, e.g. to send between processes. """
+        return {
+            "count": self.count,
+            "mean_x": self._mean_x,
+            "mean_y": self._mean_y,
+            "sxx": self._sxx,
+            "syy": self._syy,
+            "sxy": self._sxy,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """ Rebuilds an accumulator from the output of `to_dict`. """
+        regression = cls()
+        regression.count = state["count"]
+        regression._mean_x = state["mean_x"]
+        regression._mean_y = state["mean_y"]
+        regression._sxx = state["sxx"]
+        regression._syy = state["syy"]
+        regression._sxy = state["sxy"]
+        return regression
+
+
+class Statistics_1:
+    def __init__(self, data=None, keep_data=True, use_numpy=False, sketch_k=None):
+        """
+        Initialize the statistics with optional starting values.
+
+        Args:
+            data (list, optional): Starting values.
+            keep_data (bool, optional): Keep every value so that the median,
+              mode and quantiles can be computed. With False only the running
+              statistics are kept, in O(1) memory. Defaults to True.
+            use_numpy (bool, optional): Store the values in a NumPy array
+              instead of a list. The sorted values are then computed once and
+              cached until new data arrives, so repeated median and quantile
+              queries do not re-sort. Defaults to False.
+            sketch_k (int, optional): If given, also feed every value into a
+              KLLSketch with this accuracy parameter, so that approximate
+              quantiles are available in bounded memory even with
+              `keep_data=False`. The values must be numbers. Defaults to
+              None.
+        """
+        self.keep_data = keep_data
+        self.use_numpy = use_numpy
+        self.sketch_k = sketch_k
+        # Paired data is only kept for inspection; the regression itself is
+        # fitted from the running sufficient statistics.
+        self.regression = RunningRegression()
         self.paired_data = []
+        self.data = data
+
+    @property
+    def data(self):
+        """
+        The stored values: a list, or a NumPy array in NumPy mode.
+
+        Assigning new values replaces the old ones and recomputes the running
+        statistics and the sketch. Values appended to the list in place are
+        not seen by the running statistics; use `add_data` or `extend`.
+        """
+        if self._buffer or self._chunks:
+            self._flush_buffer()
+            self._data = np.concatenate([self._data, *self._chunks])
+            self._chunks = []
+        return self._data
+
+    @data.setter
+    def data(self, values):
+        if values is None:
+            values = []
+        self.running = RunningStatistics()
+        self._update_running(values)
+        self.sketch = None
+        if self.sketch_k is not None:
+            self.sketch = KLLSketch(k=self.sketch_k).update_batch(values)
+        if not self.keep_data:
+            values = []
+        self._data = np.asarray(values, dtype=float) if self.use_numpy else values
+        # NumPy mode only: values appended since the array was last built,
+        # and the cached sorted view of the array.
+        self._chunks = []
+        self._buffer = []
+        self._sorted = None
+
+    def _update_running(self, values, single=False):
+        """
+        Folds values into the running statistics. Values that are not
+        numbers switch them off for good, leaving the order statistics.
+        """
+        if self.running is None:
+            return
+        try:
+            if single:
+                self.running.add_data(values)
+            else:
+                self.running.extend(values)
+        except (TypeError, ValueError):
+            self.running = None
+
+    def _numeric_running(self, name):
+        """ Returns the running statistics, or raises if the data is not numeric. """
+        if self.running is None:
+            raise TypeError(f"{name} requires numeric data.")
+        return self.running
 
     def add_data(self, value):
-        """ Adds a new value to the data list. """
-        self.data.append(value)
+        """ Adds a new value to the data list and the running statistics. """
+        self._update_running(value, single=True)
+        if self.sketch is not None:
+            self.sketch.update(value)
+        if not self.keep_data:
+            return
+        if self.use_numpy:
+            self._buffer.append(value)
+            self._sorted = None
+        else:
+            self._data.append(value)
+
+    def extend(self, values):
+        """
+        Adds many values at once.
+
+        In NumPy mode the values are stored as one array chunk and the running
+        statistics are updated with vectorized reductions, so no Python object
+        is created per value.
+
+        Args:
+            values (iterable): The values to add.
+
+        Returns:
+            Statistics_1: This object, updated in place.
+        """
+        if self.use_numpy:
+            values = np.asarray(values, dtype=float).ravel()
+        else:
+            values = list(values)
+        self._update_running(values)
+        if self.sketch is not None:
+            self.sketch.update_batch(values)
+        if not self.keep_data:
+            return self
+        if self.use_numpy:
+            self._flush_buffer()
+            self._chunks.append(values)
+            self._sorted = None
+        else:
+            self._data.extend(values)
+        return self
+
+    def _flush_buffer(self):
+        """ Moves values added one at a time into an array chunk. """
+        if self._buffer:
+            self._chunks.append(np.asarray(self._buffer, dtype=float))
+            self._buffer = []
+
+    def _sorted_data(self):
+        """ Returns the sorted values, cached in NumPy mode. """
+        if not self.use_numpy:
+            return sorted(self.data)
+        if self._sorted is None:
+            self._sorted = np.sort(self.data)
+        return self._sorted
+
+    def merge(self, other):
+        """
+        Merges the values of another Statistics_1 into this one.
+
+        Args:
+            other (Statistics_1): Statistics computed on another partition.
+
+        Returns:
+            Statistics_1: This object, updated in place.
+
+        Raises:
+            ValueError: If this object has a sketch and `other` has neither a
+            sketch nor its values, so the sketch cannot be updated.
+        """
+        if self.sketch is not None and other.sketch is None and not other.keep_data:
+            raise ValueError(
+                "Cannot merge statistics that have neither a sketch nor their "
+                "values into statistics with a sketch."
+            )
+        if self.running is not None and other.running is not None:
+            self.running.merge(other.running)
+        else:
+            self.running = None
+        if self.sketch is not None:
+            if other.sketch is not None:
+                self.sketch.merge(other.sketch)
+            else:
+                self.sketch.update_batch(other.data)
+        if self.keep_data and self.use_numpy:
+            self._flush_buffer()
+            self._chunks.append(np.asarray(other.data, dtype=float))
+            self._sorted = None
+        elif self.keep_data:
+            self.data.extend(other.data)
+        self.regression.merge(other.regression)
+        if self.keep_data:
+            self.paired_data.extend(other.paired_data)
+        return self
 
     def add_paired_data(self, x, y):
-        """ Adds a new paired data point (x, y). """
-        self.paired_data.append((x, y))
+        """ Adds a new paired data point (x, y) in O(1). """
+        self.regression.add(x, y)
+        if self.keep_data:
+            self.paired_data.append((x, y))
+
+    def extend_paired_data(self, x, y):
+        """
+        Adds many paired data points at once from two equal-length arrays.
+
+        Args:
+            x (array-like): The x values.
+            y (array-like): The y values.
+
+        Returns:
+            Statistics_1: This object, updated in place.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        self.regression.extend(x, y)
+        if self.keep_data:
+            self.paired_data.extend(zip(x.tolist(), y.tolist()))
+        return self
 
     def mean(self):
-        """ Returns the mean of the data. """
-        if not self.data:
-            return None
-        return sum(self.data) / len(self.data)
+        """ Returns the mean of the data in O(1). """
+        return self._numeric_running("mean").mean()
 
     def median(self):
-        """ Returns the median of the data. """
-        if not self.data:
+        """
+        Returns the median of the data.
+
+        In NumPy mode the cached sorted view is used if present; otherwise the
+        middle values are found with `np.partition` in linear time.
+        """
+        if len(self.data) == 0:
             return None
-        sorted_data = sorted(self.data)
+        if self.use_numpy and self._sorted is None:
+            n = self.data.size
+            mid = n // 2
+            part = np.partition(self.data, [mid - 1, mid] if n > 1 else [mid])
+            if n % 2 == 0:
+                return (part[mid - 1] + part[mid]) / 2
+            return part[mid]
+        sorted_data = self._sorted_data()
         n = len(sorted_data)
         mid = n // 2
         if n % 2 == 0:
@@ -60,37 +612,42 @@ class Statistics_1:
             return sorted_data[mid]
 
     def mode(self):
-        """ Returns the mode of the data. If multiple modes, returns a list of modes. """
-        if not self.data:
+        """
+        Returns the mode of the data. If multiple modes, returns a list of modes.
+
+        In NumPy mode the values are counted with `np.unique` and the modes
+        are listed in ascending order.
+        """
+        if len(self.data) == 0:
             return None
+        if self.use_numpy:
+            values, counts = np.unique(self._sorted_data(), return_counts=True)
+            return values[counts == counts.max()].tolist()
         data_counter = Counter(self.data)
         max_count = max(data_counter.values())
         return [num for num, count in data_counter.items() if count == max_count]
 
     def variance(self):
-        """ Returns the variance of the data. """
-        if not self.data:
-            return None
-        mu = self.mean()
-        return sum((x - mu) ** 2 for x in self.data) / len(self.data)
+        """ Returns the variance of the data in O(1). """
+        return self._numeric_running("variance").variance()
 
     def standard_deviation(self):
         """ Returns the standard deviation of the data. """
-        return self.variance() ** 0.5
+        return self._numeric_running("standard_deviation").standard_deviation()
 
     def quantile(self, q):
         """ Returns the q-th quantile of the data. """
-        if not self.data:
+        if len(self.data) == 0:
             return None
-        sorted_data = sorted(self.data)
+        sorted_data = self._sorted_data()
         index = int(len(sorted_data) * q)
         return sorted_data[index]
 
     def quantile_linear_interpolation(self, q):
         """ Returns the q-th quantile of the data, with linear interpolation if necessary. """
-        if not self.data:
+        if len(self.data) == 0:
             return None
-        sorted_data = sorted(self.data)
+        sorted_data = self._sorted_data()
         position = (len(sorted_data) - 1) * q
         floor_index = int(position)
         ceil_index = floor_index + 1
@@ -102,38 +659,80 @@ class Statistics_1:
             upper_value = sorted_data[ceil_index]
             return lower_value + (upper_value - lower_value) * (position - floor_index)
 
-    def simple_linear_regression(self):
-        """ Returns the slope and intercept for simple linear regression of paired data. """
-        if not self.paired_data:
-            return None, None
-        n = len(self.paired_data)
-        sum_x = sum(x for x, y in self.paired_data)
-        sum_y = sum(y for x, y in self.paired_data)
-        sum_xy = sum(x * y for x, y in self.paired_data)
-        sum_x2 = sum(x ** 2 for x, y in self.paired_data)
+    def quantiles(self, qs, interpolate=False):
+        """
+        Returns several quantiles of the data from a single sort.
 
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
-        intercept = (sum_y - slope * sum_x) / n
-        return slope, intercept
+        Args:
+            qs (iterable of float): The quantiles to compute, each in [0, 1).
+            interpolate (bool, optional): Interpolate linearly between values,
+              as `quantile_linear_interpolation` does. Defaults to False,
+              which matches `quantile`.
 
+        Returns:
+            list: The requested quantiles, or None if there is no data.
+        """
+        if len(self.data) == 0:
+            return None
+        if not self.use_numpy:
+            method = self.quantile_linear_interpolation if interpolate else self.quantile
+            return [method(q) for q in qs]
+        sorted_data = self._sorted_data()
+        n = sorted_data.size
+        qs = np.asarray(qs, dtype=float)
+        if not interpolate:
+            return sorted_data[(n * qs).astype(np.intp)].tolist()
+        position = (n - 1) * qs
+        floor_index = position.astype(np.intp)
+        ceil_index = np.minimum(floor_index + 1, n - 1)
+        lower_value = sorted_data[floor_index]
+        upper_value = sorted_data[ceil_index]
+        return (lower_value + (upper_value - lower_value) * (position - floor_index)).tolist()
 
-# Usage
-stats = Statistics_1([1, 2, 3, 4, 5, 5, 2])
-stats.add_paired_data(1, 2)
-stats.add_paired_data(2, 3)
-stats.add_paired_data(3, 6)
-stats.add_paired_data(4, 8)
-print(
-    f"Mean: {stats.mean()}\n",
-    f"Median: {stats.median()}\n",
-    f"Mode: {stats.mode()}\n",
-    f"Variance: {stats.variance()}\n",
-    f"Standard Deviation: {stats.standard_deviation()}\n",
-    f"Quantile (0.25): {stats.quantile(0.25)}\n",
-    f"Quantile (0.50): {stats.quantile(0.50)}\n",
-    f"Quantile (0.75): {stats.quantile(0.75)}\n",
-    f"Quantile (0.25): {stats.quantile_linear_interpolation(0.25):.4f}\n",
-    f"Quantile (0.50): {stats.quantile_linear_interpolation(0.50):.4f}\n",
-    f"Quantile (0.75): {stats.quantile_linear_interpolation(0.75):.4f}\n",
-    f"Linear Regression (Slope, Intercept): {stats.simple_linear_regression()}\n",
-)
+    def approximate_quantile(self, q):
+        """
+        Returns an approximate q-th quantile from the KLL sketch.
+
+        Requires `sketch_k` to have been given. Unlike `quantile`, it does not
+        need the values to be kept in memory.
+
+        Raises:
+            ValueError: If the statistics were created without a sketch.
+        """
+        if self.sketch is None:
+            raise ValueError("approximate_quantile requires sketch_k to be set.")
+        return self.sketch.quantile(q)
+
+    def simple_linear_regression(self):
+        """
+        Returns the slope and intercept for simple linear regression of paired
+        data, in O(1) from the running sufficient statistics. Use
+        `self.regression` for r-squared and standard errors.
+        """
+        if not self.regression.count:
+            return None, None
+        if self.regression.slope() is None:
+            raise ZeroDivisionError("All x values are equal; the slope is undefined.")
+        return self.regression.slope(), self.regression.intercept()
+
+if __name__ == "__main__":
+    # Usage
+    stats = Statistics_1([1, 2, 3, 4, 5, 5, 2])
+    stats.add_paired_data(1, 2)
+    stats.add_paired_data(2, 3)
+    stats.add_paired_data(3, 6)
+    stats.add_paired_data(4, 8)
+    print(
+        f"Mean: {stats.mean()}\n",
+        f"Median: {stats.median()}\n",
+        f"Mode: {stats.mode()}\n",
+        f"Variance: {stats.variance()}\n",
+        f"Standard Deviation: {stats.standard_deviation()}\n",
+        f"Quantile (0.25): {stats.quantile(0.25)}\n",
+        f"Quantile (0.50): {stats.quantile(0.50)}\n",
+        f"Quantile (0.75): {stats.quantile(0.75)}\n",
+        f"Quantile (0.25): {stats.quantile_linear_interpolation(0.25):.4f}\n",
+        f"Quantile (0.50): {stats.quantile_linear_interpolation(0.50):.4f}\n",
+        f"Quantile (0.75): {stats.quantile_linear_interpolation(0.75):.4f}\n",
+        f"Linear Regression (Slope, Intercept): {stats.simple_linear_regression()}\n",
+    )
@@ -0,0 +1,11 @@
+# utils/__init__.py
+
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "ColumnExecutor": ".parallel",
+    },
+)
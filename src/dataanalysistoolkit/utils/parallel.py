@@ -0,0 +1,177 @@
+"""utils/parallel.py
+
+This module provides ColumnExecutor, which fans column-wise work out over a
+thread or process pool. The columns of a DataFrame are split into batches,
+each batch is handed to a worker as its own narrow DataFrame, and the
+results come back in column order for the caller to combine.
+
+NumPy and pandas release the GIL in most numeric kernels, so the thread
+backend scales well for vectorized statistics and needs no copying. The
+process backend suits work that holds the GIL, such as operations on object
+columns, at the cost of pickling each batch.
+
+Vectorized kernels may themselves call a multithreaded BLAS or OpenMP
+library. Running one such kernel per core would start cores² threads, so the
+executor caps those libraries at `blas_threads` threads per worker with
+threadpoolctl while it runs.
+
+Example usage:
+executor = ColumnExecutor(max_workers=64)
+masks = executor.map_columns(detect_outliers, df, columns, method='iqr')
+mask = pd.concat(masks, axis=1)
+
+with ColumnExecutor(backend='process') as executor:  # reuse one pool
+    first = executor.map_columns(func, df, columns)
+    second = executor.map_columns(other_func, df, columns)
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from threadpoolctl import threadpool_limits
+
+_BACKENDS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+class ColumnExecutor:
+    """
+    Run a function over batches of columns on a thread or process pool.
+
+    Attributes:
+        max_workers (int): Number of workers.
+        backend (str): 'thread' or 'process'.
+        batch_size (int): Columns per batch, or None to size batches
+          automatically.
+        blas_threads (int): Threads each worker may use in BLAS and OpenMP
+          libraries, or None for no limit.
+    """
+
+    # Automatic batching aims for this many batches per worker, so that a few
+    # slow columns do not leave the other workers idle.
+    _BATCHES_PER_WORKER = 4
+
+    def __init__(self, max_workers=None, backend="thread", batch_size=None,
+                 blas_threads=1):
+        """
+        Initialize the executor. The pool is created when it is first used.
+
+        Args:
+            max_workers (int, optional): Number of workers. Defaults to the
+              number of CPUs.
+            backend (str, optional): 'thread' or 'process'. Defaults to
+              'thread'.
+            batch_size (int, optional): Columns per batch. Defaults to None,
+              which makes about four batches per worker.
+            blas_threads (int, optional): Thread limit for BLAS and OpenMP
+              libraries in each worker. Defaults to 1.
+
+        Raises:
+            ValueError: If `backend` is not supported.
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unknown backend: '{backend}'. Available backends are {sorted(_BACKENDS)}."
+            )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backend = backend
+        self.batch_size = batch_size
+        self.blas_threads = blas_threads
+        self._pool = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnExecutor(max_workers={self.max_workers}, backend={self.backend}, "
+            f"batch_size={self.batch_size}, blas_threads={self.blas_threads})"
+        )
+
+    def __enter__(self):
+        self._pool = self._create_pool()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Shut down the pool kept open by a `with` block, if any.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def batches(self, columns):
+        """
+        Split `columns` into consecutive batches.
+
+        Args:
+            columns (list): The columns to split.
+
+        Returns:
+            list of list: The batches, in order.
+        """
+        columns = list(columns)
+        size = self.batch_size
+        if size is None:
+            target = self.max_workers * self._BATCHES_PER_WORKER
+            size = max(1, math.ceil(len(columns) / target))
+        return [columns[start:start + size] for start in range(0, len(columns), size)]
+
+    def map_columns(self, func, data, columns, **kwargs):
+        """
+        Call `func(data[batch], columns=batch, **kwargs)` for every batch of
+        columns.
+
+        A single batch, or a single worker, runs inline without a pool. With
+        the process backend `func` must be picklable, i.e. defined at module
+        level.
+
+        Args:
+            func (callable): The function to run on each batch.
+            data (DataFrame): The data.
+            columns (list of str): The columns to process.
+            **kwargs: Passed to `func`.
+
+        Returns:
+            list: The result for each batch, in column order.
+        """
+        batches = self.batches(columns)
+        if len(batches) <= 1 or self.max_workers == 1:
+            with self._limit_blas():
+                return [func(data[batch], columns=batch, **kwargs) for batch in batches]
+
+        pool = self._pool or self._create_pool()
+        try:
+            with self._limit_blas():
+                futures = [
+                    pool.submit(func, data[batch], columns=batch, **kwargs)
+                    for batch in batches
+                ]
+                return [future.result() for future in futures]
+        finally:
+            if pool is not self._pool:
+                pool.shutdown()
+
+    def _create_pool(self):
+        """
+        Create a pool of the configured backend.
+        """
+        if self.backend == "process" and self.blas_threads is not None:
+            return ProcessPoolExecutor(
+                self.max_workers, initializer=_limit_worker_blas,
+                initargs=(self.blas_threads,),
+            )
+        return _BACKENDS[self.backend](self.max_workers)
+
+    def _limit_blas(self):
+        """
+        Limit BLAS and OpenMP threads in this process while threads run.
+        """
+        return threadpool_limits(limits=self.blas_threads)
+
+
+def _limit_worker_blas(blas_threads):
+    """
+    Limit BLAS and OpenMP threads for the lifetime of a worker process.
+    """
+    threadpool_limits(limits=blas_threads)
@@ -1,2 +1,11 @@
 # visualizer/__init__.py
-from .data_visualizer import DataVisualizer
+
+from .._lazy import attach
+
+# Submodules are imported on first attribute access; see _lazy.py.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "DataVisualizer": ".data_visualizer",
+    },
+)
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.integrators.concatenated_view import ConcatenatedView
+
+
+@pytest.fixture
+def frames():
+    return [
+        pd.DataFrame({
+            'id': np.array([1, 2], dtype=np.int32),
+            'price': np.array([1.5, 2.5], dtype=np.float32),
+            'city': pd.Categorical(['a', 'b']),
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02']),
+        }),
+        pd.DataFrame({
+            'id': np.array([3, 4, 5], dtype=np.int64),
+            'price': [3.0, np.nan, 5.0],
+            'city': ['c', 'a', None],
+        }, index=[10, 11, 12]),
+        pd.DataFrame({'id': [6], 'price': [6.0], 'city': pd.Categorical(['d']), 'label': ['x']}),
+    ]
+
+
+def test_schema_is_unified(frames):
+    view = ConcatenatedView(frames)
+    assert list(view.columns) == ['id', 'price', 'city', 'when', 'label']
+    assert view.dtypes['id'] == np.int64
+    assert view.dtypes['price'] == np.float64
+    assert list(view.dtypes['city'].categories) == ['a', 'b', 'c', 'd']
+    assert view.dtypes['label'] == object
+    assert len(view) == 6
+
+
+def test_extension_types_are_unified():
+    frames = [
+        pd.DataFrame({
+            'n': pd.array([1, None], dtype='Int64'),
+            'x': pd.array([1, None], dtype='Int64'),
+            'flag': pd.array([True, None], dtype='boolean'),
+        }),
+        pd.DataFrame({'n': np.array([3], dtype=np.int64), 'x': [2.5],
+                      'flag': np.array([False])}),
+    ]
+    view = ConcatenatedView(frames)
+    assert view.dtypes.astype(str).to_dict() == {'n': 'Int64', 'x': 'Float64', 'flag': 'boolean'}
+    result = view.to_frame()
+    assert result['n'].tolist() == [1, pd.NA, 3]
+    assert result['x'].tolist() == [1.0, pd.NA, 2.5]
+    assert result['flag'].tolist() == [True, pd.NA, False]
+    pd.testing.assert_frame_equal(pd.concat(view.iter_chunks()), result)
+
+
+def test_empty_inputs():
+    ints = pd.DataFrame({'n': np.array([1, 2], dtype=np.int8)})
+    result = ConcatenatedView([pd.DataFrame(), ints]).to_frame()
+    pd.testing.assert_frame_equal(result, ints)
+    result = ConcatenatedView([ints, pd.DataFrame()]).to_frame()
+    pd.testing.assert_frame_equal(result, ints)
+
+
+def test_chunks_have_the_unified_types():
+    stamps = pd.DataFrame({
+        't': pd.to_datetime(['2024-01-01', '2024-01-02']),
+        'n': np.array([1, 2], dtype=np.int8),
+        'c': pd.Categorical(['a', 'b']),
+    })
+    frames = [
+        pd.DataFrame({'t': pd.Series([], dtype=object), 'n': pd.Series([], dtype=float),
+                      'c': pd.Series([], dtype=object)}),
+        stamps,
+        pd.DataFrame({'n': np.array([3], dtype=np.int32), 'c': ['c']}),
+        pd.DataFrame(),
+    ]
+    view = ConcatenatedView(frames)
+    assert view.dtypes.astype(str).to_dict() == {'t': 'datetime64[ns]', 'n': 'int32',
+                                                 'c': 'category'}
+    chunks = list(view.iter_chunks())
+    assert len(chunks) == 4
+    for chunk in chunks:
+        pd.testing.assert_series_equal(chunk.dtypes, view.dtypes.astype(object))
+    pd.testing.assert_frame_equal(pd.concat(chunks), view.to_frame())
+
+
+def test_to_frame_matches_concat_with_unified_types(frames):
+    result = ConcatenatedView(frames).to_frame()
+    expected = pd.concat(frames, ignore_index=True).astype(
+        {'id': np.int64, 'city': pd.CategoricalDtype(['a', 'b', 'c', 'd'])}
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    chunks = list(ConcatenatedView(frames).iter_chunks(chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_release_drops_inputs(frames):
+    view = ConcatenatedView(frames, release=True)
+    del frames[:]
+    assert len(view.to_frame()) == 6
+    assert view._frames == [None, None, None]
+    with pytest.raises(ValueError):
+        view.to_frame()
+
+
+def test_write(frames, tmp_path):
+    path = tmp_path / 'combined.csv'
+    ConcatenatedView(frames).write(str(path))
+    result = pd.read_csv(path)
+    assert result['id'].tolist() == [1, 2, 3, 4, 5, 6]
+    assert result['city'].fillna('-').tolist() == ['a', 'b', 'c', 'a', '-', 'd']
@@ -1,6 +1,11 @@
+import functools
+import time
+
+import numpy as np
 import pytest
 import pandas as pd
-from src.integrators.data_integrator import DataIntegrator
+from dataanalysistoolkit.integrators.data_integrator import DataIntegrator, _join_order
+from dataanalysistoolkit.integrators.partitioning import partition_ids
 
 @pytest.fixture
 def sample_dataframes():
@@ -30,4 +35,238 @@ def test_merge_data(sample_dataframes):
     assert list(result.columns) == ['key', 'value1', 'value2']
     assert all(result['key'] == df1['key'])
 
-# Additional tests for other methods or scenarios can be added here
+def fold_merge(frames, on):
+    merged = frames[0]
+    for df in frames[1:]:
+        merged = pd.merge(merged, df, on=on)
+    return merged
+
+@pytest.fixture
+def star_schema():
+    rng = np.random.default_rng(0)
+    fact = pd.DataFrame({
+        'key': rng.integers(0, 1000, size=20_000),
+        'region': rng.choice(['north', 'south', np.nan], size=20_000),
+        'amount': rng.normal(size=20_000),
+    })
+    dims = [
+        pd.DataFrame({
+            'key': rng.permutation(1000)[:size],
+            'region': rng.choice(['north', 'south'], size=size),
+            f'attr{i}': rng.integers(0, 10, size=size),
+        })
+        for i, size in enumerate([900, 50, 400])
+    ]
+    # Duplicate keys in one dimension multiply rows.
+    dims[0] = pd.concat([dims[0], dims[0].iloc[:100]], ignore_index=True)
+    return [fact] + dims
+
+def make_integrator(frames):
+    integrator = DataIntegrator()
+    for df in frames:
+        integrator.add_data(df)
+    return integrator
+
+def test_planned_merge_matches_left_to_right(star_schema):
+    on_key = [star_schema[0]] + [df.drop(columns='region') for df in star_schema[1:]]
+    expected = fold_merge(on_key, 'key')
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(
+        sort_rows(make_integrator(on_key).merge_data(on='key')), sort_rows(expected)
+    )
+    pd.testing.assert_frame_equal(
+        make_integrator(on_key).merge_data(on='key', optimize=False), expected
+    )
+
+    pd.testing.assert_frame_equal(
+        sort_rows(make_integrator(star_schema).join_on_multiple_columns(['key', 'region'])),
+        sort_rows(fold_merge(star_schema, ['key', 'region'])),
+    )
+
+@pytest.mark.parametrize('on', [['a'], ['a', 'b']])
+def test_planned_merge_orders_rows_by_input_position(on):
+    rng = np.random.default_rng(1)
+    frames = [
+        pd.DataFrame({'a': rng.integers(0, 4, size=n), 'b': rng.integers(0, 2, size=n),
+                      f'row{i}': np.arange(n)}).drop(columns=[] if 'b' in on else ['b'])
+        for i, n in enumerate([40, 12, 9])
+    ]
+    positions = ['row0', 'row1', 'row2']
+    expected = functools.reduce(lambda left, right: pd.merge(left, right, on=on), frames)
+    expected = expected.sort_values(positions, ignore_index=True)
+    assert expected['a'].duplicated().any()
+    result = make_integrator(frames).merge_data(on=on)
+    pd.testing.assert_frame_equal(result, expected, check_like=False)
+
+def test_merge_with_mismatched_key_types_follows_pandas():
+    ints = pd.DataFrame({'key': [3, 1, 2, 1], 'x': range(4)})
+    floats = pd.DataFrame({'key': [1.0, 3.0, 1.0], 'y': range(3)})
+    pd.testing.assert_frame_equal(
+        make_integrator([ints, floats]).merge_data(on='key'), pd.merge(ints, floats, on='key')
+    )
+    strings = pd.DataFrame({'key': ['1', '2'], 'z': range(2)})
+    with pytest.raises(ValueError):
+        make_integrator([ints, strings]).merge_data(on='key')
+
+def test_overlapping_columns_merge_left_to_right(star_schema):
+    frames = star_schema[:2]
+    result = make_integrator(frames).merge_data(on='key')
+    assert {'region_x', 'region_y'} <= set(result.columns)
+    pd.testing.assert_frame_equal(result, fold_merge(frames, 'key'))
+
+def test_join_order_starts_with_most_selective_frames():
+    counts = [
+        np.array([100.0, 100.0, 100.0, 100.0]),  # wide fact table
+        np.array([1.0, 1.0, 1.0, 1.0]),
+        np.array([1.0, 0.0, 0.0, 0.0]),          # very selective filter
+    ]
+    assert _join_order(counts) == [1, 2, 0]
+
+def sort_rows(df):
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+@pytest.mark.parametrize('how', ['inner', 'outer'])
+def test_merge_partitioned_matches_merge_data(star_schema, how):
+    frames = [star_schema[0]] + [df.drop(columns='region') for df in star_schema[1:]]
+    integrator = make_integrator(frames)
+    expected = integrator.merge_data(on='key', how=how)
+    result = integrator.merge_partitioned(
+        on='key', how=how, n_partitions=5, max_workers=2, memory_budget=100_000
+    )
+    pd.testing.assert_frame_equal(sort_rows(result), sort_rows(expected))
+
+def test_merge_partitioned_writes_output(star_schema, tmp_path):
+    frames = [star_schema[0]] + [df.drop(columns='region') for df in star_schema[1:]]
+    integrator = make_integrator(frames)
+    output = tmp_path / 'joined.csv'
+    assert integrator.merge_partitioned(on='key', max_workers=1, output=str(output)) is None
+    expected = tmp_path / 'expected.csv'
+    integrator.merge_data(on='key').to_csv(expected, index=False)
+    pd.testing.assert_frame_equal(sort_rows(pd.read_csv(output)), sort_rows(pd.read_csv(expected)))
+
+@pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+def test_merge_partitioned_left_join_to_columnar_output(tmp_path, file_format):
+    pytest.importorskip('pyarrow')
+    left = pd.DataFrame({'key': np.arange(200), 'a': np.arange(200) * 2})
+    # Keys of odd buckets have no match, so 'b' is float64 only in those.
+    matched = partition_ids(left, ['key'], 8) % 2 == 0
+    right = pd.DataFrame({'key': left['key'][matched], 'b': left['key'][matched]})
+    integrator = make_integrator([left, right])
+    output = tmp_path / f'joined.{file_format}'
+    integrator.merge_partitioned(
+        on='key', how='left', n_partitions=8, max_workers=1, output=str(output)
+    )
+    reader = pd.read_parquet if file_format == 'parquet' else pd.read_feather
+    pd.testing.assert_frame_equal(
+        sort_rows(reader(output)), sort_rows(left.merge(right, on='key', how='left'))
+    )
+
+@pytest.fixture
+def sensor_feeds():
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2024-01-01')
+    feeds = []
+    for i in range(4):
+        size = 2_000
+        feeds.append(pd.DataFrame({
+            'time': start + pd.to_timedelta(np.sort(rng.integers(0, 10_000, size=size)), unit='ms'),
+            'sensor': rng.choice(['a', 'b', 'c'], size=size),
+            f'reading{i}': rng.integers(0, 100, size=size),
+        }))
+    return feeds
+
+def fold_asof(frames, **kwargs):
+    merged = frames[0]
+    for df in frames[1:]:
+        merged = pd.merge_asof(merged, df, on='time', **kwargs)
+    return merged
+
+@pytest.mark.parametrize('method', ['backward', 'forward', 'nearest'])
+@pytest.mark.parametrize('by, tolerance', [
+    (None, None), ('sensor', None), ('sensor', pd.Timedelta('3ms')),
+])
+def test_integrate_time_series_matches_merge_asof(sensor_feeds, method, by, tolerance):
+    frames = sensor_feeds if by else [df.drop(columns='sensor') for df in sensor_feeds]
+    result = make_integrator(frames).integrate_time_series(
+        'time', method=method, by=by, tolerance=tolerance
+    )
+    expected = fold_asof(frames, direction=method, by=by, tolerance=tolerance)
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_integrate_time_series_accepts_unsorted_inputs(sensor_feeds):
+    # Rows with equal times have no order once shuffled, so keep one of each.
+    frames = [df.drop(columns='sensor').drop_duplicates('time') for df in sensor_feeds]
+    shuffled = [df.sample(frac=1, random_state=0) for df in frames]
+    result = make_integrator([frames[0]] + shuffled[1:]).integrate_time_series(
+        'time', method='backward'
+    )
+    pd.testing.assert_frame_equal(result, fold_asof(frames, direction='backward'))
+
+    with pytest.raises(ValueError):
+        make_integrator(frames).integrate_time_series('time', method='pad')
+
+def test_integrate_time_series_keeps_first_frame_order(sensor_feeds):
+    # Both frames have a 'sensor' column, so they are merged pairwise.
+    frames = [df.drop_duplicates('time') for df in sensor_feeds[:2]]
+    first = frames[0].sample(frac=1, random_state=0)
+    result = make_integrator([first, frames[1]]).integrate_time_series('time')
+    expected = fold_asof([frames[0], frames[1]], direction='nearest')
+    pd.testing.assert_frame_equal(
+        result, expected.set_index(frames[0].index).loc[first.index].reset_index(drop=True)
+    )
+
+    single = make_integrator([first]).integrate_time_series('time')
+    pd.testing.assert_frame_equal(single, first.reset_index(drop=True))
+
+def test_concatenate_data_releases_inputs():
+    integrator = make_integrator([
+        pd.DataFrame({'A': np.array([1, 2], dtype=np.int8), 'B': ['x', 'y']}),
+        pd.DataFrame({'A': [3.5], 'B': pd.Categorical(['y'])}),
+    ])
+    view = integrator.concatenated_view()
+    assert view.dtypes['A'] == np.float64
+    result = integrator.concatenate_data(release=True)
+    assert integrator.data_frames == []
+    assert result['A'].tolist() == [1.0, 2.0, 3.5]
+    assert list(result['B'].cat.categories) == ['x', 'y']
+
+def test_concatenate_data_with_empty_frame():
+    ints = pd.DataFrame({'A': np.array([1, 2], dtype=np.int8)})
+    result = make_integrator([pd.DataFrame(), ints]).concatenate_data()
+    pd.testing.assert_frame_equal(result, ints)
+
+def test_integrate_from_different_sources_loads_concurrently():
+    def slow(df, delay):
+        def load():
+            time.sleep(delay)
+            return df
+        return load
+
+    source_data = {
+        'sql': slow(pd.DataFrame({'key': [1, 2, 3], 'a': [1, 2, 3]}), 0.3),
+        'excel': slow(pd.DataFrame({'key': [3, 2], 'b': ['x', 'y']}), 0.2),
+        'api': pd.DataFrame({'key': [2, 3, 4], 'c': [0.1, 0.2, 0.3]}),
+    }
+    integrator = DataIntegrator()
+    start = time.monotonic()
+    merged = integrator.integrate_from_different_sources(source_data, 'merge', on='key')
+    assert time.monotonic() - start < 0.45
+    assert list(merged.columns) == ['key', 'a', 'b', 'c']
+    pd.testing.assert_frame_equal(
+        merged.sort_values('key', ignore_index=True),
+        fold_merge(list(integrator.data_frames), 'key').sort_values('key', ignore_index=True),
+    )
+
+    concatenated = integrator.integrate_from_different_sources(source_data)
+    assert concatenated['key'].tolist() == [1, 2, 3, 3, 2, 2, 3, 4]
+
+def test_integrate_from_different_sources_errors():
+    source_data = {'good': pd.DataFrame({'key': [1]}), 'bad': lambda: 1 / 0}
+    integrator = DataIntegrator()
+    with pytest.raises(ZeroDivisionError):
+        integrator.integrate_from_different_sources(source_data)
+    result = integrator.integrate_from_different_sources(source_data, on_error='skip')
+    assert result['key'].tolist() == [1]
+    assert list(integrator.source_errors) == ['bad']
+    with pytest.raises(ValueError):
+        integrator.integrate_from_different_sources(source_data, 'union')
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.integrators.partitioning import HashPartitioner, partition_ids
+
+
+def test_equal_keys_share_a_partition():
+    ints = pd.DataFrame({'key': [1, 2, 3, 4], 'name': list('abcd')})
+    floats = pd.DataFrame({'key': [4.0, 3.0, 2.0, np.nan], 'name': list('dcba')})
+    buckets_int = dict(zip(ints['key'], partition_ids(ints, ['key'], 7)))
+    buckets_float = dict(zip(floats['key'], partition_ids(floats, ['key'], 7)))
+    for key in [2, 3, 4]:
+        assert buckets_int[key] == buckets_float[float(key)]
+
+
+def test_partitions_spill_and_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'key': rng.integers(0, 100, size=10_000), 'value': rng.normal(size=10_000)})
+    with HashPartitioner('key', 4, memory_budget=50_000, spill_dir=tmp_path) as partitioner:
+        partitioner.add('df', df, chunksize=1_000)
+        assert partitioner.spilled_bytes > 0
+        assert any(isinstance(p, str) for i in range(4) for p in partitioner.pieces('df', i))
+        parts = [partitioner.partition('df', i) for i in range(4)]
+        for i, part in enumerate(parts):
+            assert (partition_ids(part, ['key'], 4) == i).all()
+            assert part.index.is_monotonic_increasing
+        pd.testing.assert_frame_equal(pd.concat(parts).sort_index(), df)
+        spill_dir = partitioner.spill_dir
+    assert not (tmp_path / spill_dir).exists()
+
+
+def test_missing_key_raises():
+    with HashPartitioner(['key'], 2) as partitioner:
+        with pytest.raises(ValueError):
+            partitioner.add('df', pd.DataFrame({'other': [1]}))
+        with pytest.raises(ValueError):
+            HashPartitioner(['key'], 0)
@@ -0,0 +1,51 @@
+import time
+
+import pandas as pd
+import pytest
+from dataanalysistoolkit.integrators.source_loader import DataSource, load_sources
+
+
+class SlowConnector:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def query_data(self, query):
+        time.sleep(self.delay)
+        return pd.DataFrame({'query': [query]})
+
+
+class FakeResponse:
+    def json(self):
+        return {'data': [{'id': 1, 'rate': 0.5}, {'id': 2, 'rate': 0.7}]}
+
+
+class FakeAPI:
+    def get(self, endpoint, params=None):
+        return FakeResponse()
+
+
+def test_sources_load_concurrently_in_completion_order():
+    sources = {
+        'slow': DataSource(SlowConnector(0.3), 'SELECT 1'),
+        'fast': DataSource(SlowConnector(0.05), 'SELECT 2'),
+        'ready': pd.DataFrame({'query': ['cached']}),
+    }
+    start = time.monotonic()
+    results = list(load_sources(sources))
+    assert time.monotonic() - start < 0.5
+    assert [name for name, _ in results] == ['ready', 'fast', 'slow']
+    assert results[2][1]['query'].tolist() == ['SELECT 1']
+
+
+def test_api_source_and_timeouts():
+    sources = {
+        'api': DataSource(FakeAPI(), 'rates', record_path='data'),
+        'stuck': DataSource(SlowConnector(1.0), 'SELECT 1', timeout=0.1),
+        'broken': lambda: 1 / 0,
+    }
+    results = dict(load_sources(sources, timeout=5))
+    assert results['api']['rate'].tolist() == [0.5, 0.7]
+    assert isinstance(results['stuck'], TimeoutError)
+    assert isinstance(results['broken'], ZeroDivisionError)
+    with pytest.raises(ValueError):
+        DataSource(object(), 'SELECT 1')
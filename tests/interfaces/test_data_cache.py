@@ -0,0 +1,76 @@
+import os
+import time
+
+import pytest
+import pandas as pd
+from dataanalysistoolkit.interfaces.data_cache import DataCache
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({'A': [1, 2, 3], 'B': ['x', 'y', 'z']}).to_csv(file_path, index=False)
+    return file_path
+
+
+@pytest.mark.parametrize("file_format", ["feather", "parquet"])
+def test_load_uses_cache_on_second_call(tmp_path, sample_csv, file_format):
+    cache = DataCache(str(tmp_path / "cache"), file_format=file_format)
+    calls = []
+
+    def loader(filename):
+        calls.append(filename)
+        return pd.read_csv(filename)
+
+    first = cache.load(str(sample_csv), loader=loader)
+    second = cache.load(str(sample_csv), loader=loader)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert os.path.exists(cache.cache_path(str(sample_csv)))
+
+
+def test_modified_file_is_parsed_again(tmp_path, sample_csv):
+    cache = DataCache(str(tmp_path / "cache"))
+    cache.load(str(sample_csv))
+
+    pd.DataFrame({'A': [4, 5], 'B': ['u', 'v']}).to_csv(sample_csv, index=False)
+    data = cache.load(str(sample_csv))
+
+    assert list(data['A']) == [4, 5]
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = DataCache(str(tmp_path / "cache"))
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"sample_{i}.csv"
+        pd.DataFrame({'A': range(100 * (i + 1))}).to_csv(file_path, index=False)
+        cache.load(str(file_path))
+        entry = cache.cache_path(str(file_path))
+        os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+        paths.append(entry)
+
+    cache.max_bytes = os.path.getsize(paths[1]) + os.path.getsize(paths[2])
+    removed = cache.evict()
+
+    assert removed == [paths[0]]
+    assert os.path.exists(paths[1]) and os.path.exists(paths[2])
+
+
+@pytest.mark.parametrize("file_format", ["feather", "parquet"])
+def test_unwritable_frame_is_returned_uncached(tmp_path, sample_csv, file_format):
+    cache = DataCache(str(tmp_path / "cache"), file_format=file_format)
+    mixed = pd.DataFrame({'A': [1, 'x', 2.5]})
+
+    data = cache.load(str(sample_csv), loader=lambda filename: mixed)
+
+    assert data is mixed
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_unknown_format_raises(tmp_path):
+    with pytest.raises(ValueError):
+        DataCache(str(tmp_path / "cache"), file_format="pickle")
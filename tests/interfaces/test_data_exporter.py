@@ -0,0 +1,137 @@
+import gzip
+import io
+import os
+import stat
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.interfaces.data_exporter import DataExporter
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'day': rng.choice(['mon', 'tue', 'wed'], 1_000),
+        'value': rng.normal(size=1_000),
+        'count': rng.integers(0, 100, 1_000),
+    })
+
+
+def chunks_of(frame, size=150):
+    return [frame.iloc[start:start + size] for start in range(0, len(frame), size)]
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compressed_csv_round_trips(tmp_path, frame, compression):
+    path = str(tmp_path / "out.csv")
+    exporter = DataExporter(compression=compression, workers=4, block_rows=100)
+    exporter.write(chunks_of(frame), path)
+    pd.testing.assert_frame_equal(pd.read_csv(path, compression=compression), frame)
+
+
+def test_for_path_infers_format(tmp_path, frame):
+    path = str(tmp_path / "out.csv.gz")
+    exporter = DataExporter.for_path(path, block_rows=300)
+    assert (exporter.file_format, exporter.compression) == ("csv", "gzip")
+    exporter.write([frame], path)
+    with gzip.open(path, 'rt') as file:
+        assert file.readline().strip() == "day,value,count"
+    assert DataExporter.for_path("x.parquet").file_format == "parquet"
+    assert DataExporter.for_path("x.txt").compression is None
+    with pytest.raises(ValueError):
+        DataExporter(file_format="csv", compression="snappy")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_columnar_formats_round_trip(tmp_path, frame, file_format):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"out.{file_format}")
+    DataExporter(file_format=file_format, block_rows=200).write(chunks_of(frame), path)
+    read = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    pd.testing.assert_frame_equal(read(path), frame)
+
+
+def test_partitioned_parquet(tmp_path, frame):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "dataset")
+    exporter = DataExporter(file_format="parquet", partition_cols=["day"])
+    exporter.write(chunks_of(frame), path)
+
+    assert sorted(os.listdir(path)) == ["day=mon", "day=tue", "day=wed"]
+    result = pd.read_parquet(path)
+    assert len(result) == len(frame)
+    assert result.groupby("day", observed=True)["count"].sum().to_dict() == \
+        frame.groupby("day")["count"].sum().to_dict()
+
+    # Exporting again replaces the previous directory.
+    exporter.write([frame[frame["day"] == "mon"]], path)
+    assert os.listdir(path) == ["day=mon"]
+
+
+def test_path_like_and_buffer_targets(tmp_path, frame):
+    path = tmp_path / "out.csv.gz"
+    exporter = DataExporter.for_path(path)
+    assert exporter.compression == "gzip"
+    assert exporter.write(chunks_of(frame), path) == str(path)
+    pd.testing.assert_frame_equal(pd.read_csv(path), frame)
+
+    buffer = io.StringIO()
+    DataExporter.for_path(buffer).write(chunks_of(frame), buffer)
+    buffer.seek(0)
+    pd.testing.assert_frame_equal(pd.read_csv(buffer), frame)
+    with pytest.raises(ValueError):
+        DataExporter(compression="gzip").write([frame], io.StringIO())
+
+
+def test_failed_export_leaves_target_untouched(tmp_path, frame):
+    path = tmp_path / "out.csv"
+    path.write_text("old")
+
+    def broken_chunks():
+        yield frame
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError):
+        DataExporter().write(broken_chunks(), str(path))
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.csv"]
+
+
+def test_exported_files_follow_the_umask(tmp_path, frame):
+    old = os.umask(0o027)
+    try:
+        path = tmp_path / "out.csv"
+        DataExporter().write([frame], str(path))
+        directory = tmp_path / "dataset"
+        DataExporter(partition_cols=["day"]).write([frame], str(directory))
+    finally:
+        os.umask(old)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o750
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_columnar_formats_widen_changing_types(tmp_path, file_format):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"out.{file_format}")
+    chunks = [
+        pd.DataFrame({"n": [1, 2], "s": [None, None]}),
+        pd.DataFrame({"n": [3, 4], "s": ["a", None]}),
+        pd.DataFrame({"n": [1.5, np.nan], "s": ["b", "c"]}),
+    ]
+    DataExporter(file_format=file_format, block_rows=1).write(chunks, path)
+    reader = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    pd.testing.assert_frame_equal(
+        reader(path), pd.concat(chunks, ignore_index=True).astype({"s": object})
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_columnar_formats_without_chunks(tmp_path, file_format):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"out.{file_format}")
+    DataExporter(file_format=file_format).write([], path)
+    reader = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    assert reader(path).empty
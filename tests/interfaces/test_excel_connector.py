@@ -32,3 +32,11 @@ def test_load_data_with_specific_sheet(create_sample_excel):
     assert list(data.columns) == ['A', 'B']
 
 # Additional tests for other methods or functionalities can be added here
+
+def test_load_data_optimized(create_sample_excel):
+    connector = ExcelConnector(str(create_sample_excel))
+    data = connector.load_data(optimize=True)
+
+    assert data['A'].dtype == 'int8'
+    assert (data['B'] == ['x', 'y', 'z']).all()
+    assert connector.memory_report.loc['A', 'dtype_after'] == 'int8'
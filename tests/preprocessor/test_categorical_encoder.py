@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.preprocessor.categorical_encoder import CategoricalEncoder
+from sklearn.preprocessing import LabelEncoder
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'city': ['Paris', 'Oslo', 'Lima', 'Oslo', None],
+        'size': pd.Categorical(['S', 'L', 'M', 'S', 'L'], categories=['S', 'M', 'L']),
+        'value': [1, 2, 3, 4, 5],
+    })
+
+
+def test_fit_transform_uses_smallest_codes(frame):
+    encoded = CategoricalEncoder().fit_transform(frame)
+
+    assert encoded['city'].dtype == np.int8
+    assert encoded['city'].tolist() == [2, 1, 0, 1, -1]
+    # Existing category dtypes keep their own order.
+    assert encoded['size'].tolist() == [0, 2, 1, 0, 2]
+    assert encoded['value'].equals(frame['value'])
+    assert frame['city'].dtype == object
+
+
+def test_matches_label_encoder_without_missing_values():
+    values = pd.Series(np.random.default_rng(0).choice(list('abcdefghij'), 1000))
+    expected = LabelEncoder().fit_transform(values)
+    encoded = CategoricalEncoder().fit_transform(values.to_frame('x'))
+    assert (encoded['x'].to_numpy() == expected).all()
+
+
+def test_new_batches_keep_existing_codes(frame):
+    encoder = CategoricalEncoder()
+    first = encoder.fit_transform(frame, ['city'])
+    batch = pd.DataFrame({'city': ['Rome', 'Paris', 'Athens']})
+    second = encoder.transform(batch)
+
+    # New categories are sorted among themselves and appended.
+    assert second['city'].tolist() == [4, first['city'][0], 3]
+    assert encoder.inverse_transform(second)['city'].tolist() == batch['city'].tolist()
+
+
+def test_integer_column_names():
+    frame = pd.DataFrame({0: ['b', 'a', 'b'], 1: [1, 2, 3]})
+    encoder = CategoricalEncoder()
+    encoded = encoder.fit_transform(frame)
+    assert encoded[0].tolist() == [1, 0, 1]
+    assert encoder.inverse_transform(encoded)[0].tolist() == ['b', 'a', 'b']
+
+
+def test_int16_codes_for_high_cardinality():
+    frame = pd.DataFrame({'id': [f'user{i}' for i in range(1000)]})
+    assert CategoricalEncoder().fit_transform(frame)['id'].dtype == np.int16
+
+
+def test_unknown_policies_and_persistence(frame):
+    encoder = CategoricalEncoder(handle_unknown='error').fit(frame, ['city'])
+    restored = CategoricalEncoder.from_dict(json.loads(json.dumps(encoder.to_dict())))
+    assert restored.vocabularies['city'].tolist() == ['Lima', 'Oslo', 'Paris']
+
+    with pytest.raises(ValueError):
+        restored.transform(pd.DataFrame({'city': ['Rome']}))
+    restored.handle_unknown = 'missing'
+    assert restored.transform(pd.DataFrame({'city': ['Rome', 'Lima']}))['city'].tolist() == [-1, 0]
+    with pytest.raises(ValueError):
+        CategoricalEncoder(handle_unknown='ignore')
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.preprocessor.memory_optimizer import REPORT_COLUMNS, optimize_memory
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    return pd.DataFrame({
+        'small': rng.integers(0, 100, n),
+        'large': rng.integers(0, 2 ** 40, n),
+        'halves': rng.integers(0, 8, n) / 2,
+        'noisy': rng.normal(size=n),
+        'city': rng.choice(['Paris', 'Oslo', 'Lima', None], n),
+        'email': [f'user{i}@example.com' for i in range(n)],
+        'mixed': [1, 'a'] * (n // 2),
+        'flag': rng.integers(0, 2, n).astype(bool),
+    })
+
+
+def test_types_are_narrowed_without_changing_values(frame):
+    optimized, report = optimize_memory(frame)
+
+    assert optimized['small'].dtype == np.int8
+    assert optimized['large'].dtype == np.int64
+    assert optimized['halves'].dtype == np.float32
+    assert optimized['noisy'].dtype == np.float64
+    assert isinstance(optimized['city'].dtype, pd.CategoricalDtype)
+    assert optimized['mixed'].dtype == object
+    assert optimized['flag'].dtype == bool
+    for col in frame.columns:
+        assert frame[col].astype(object).equals(optimized[col].astype(object)) or \
+            (frame[col].astype(float) == optimized[col].astype(float)).all()
+
+    assert list(report.columns) == REPORT_COLUMNS
+    assert (report['bytes_saved'] == report['bytes_before'] - report['bytes_after']).all()
+    assert report['bytes_saved'].sum() > 0.5 * report['bytes_before'].sum()
+
+
+def test_arrow_strings_for_high_cardinality(frame):
+    pytest.importorskip("pyarrow")
+    optimized, _ = optimize_memory(frame)
+    assert optimized['email'].dtype == pd.StringDtype("pyarrow")
+
+    kept, _ = optimize_memory(frame, arrow_strings=False)
+    assert kept['email'].dtype == object
+
+
+def test_integer_column_names():
+    frame = pd.DataFrame({0: np.arange(100), 1: ['a', 'b'] * 50})
+    optimized, report = optimize_memory(frame)
+    assert optimized[0].dtype == np.int8
+    assert isinstance(optimized[1].dtype, pd.CategoricalDtype)
+    assert list(report.index) == [0, 1]
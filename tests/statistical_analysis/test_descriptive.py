@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import trim_mean
+from dataanalysistoolkit.statistical_analysis.descriptive import budget_statistics, central_tendency
+
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'floats': rng.normal(50, 10, 1001),
+        'ints': rng.integers(0, 20, 1001),
+        'wide_ints': rng.integers(-10**9, 10**9, 1001),
+        'label': ['x'] * 1001,
+    })
+    df.loc[::50, 'floats'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("proportiontocut", [0.0, 0.1, 0.2, 0.49])
+def test_matches_pandas_and_scipy(sample_data, proportiontocut):
+    stats = budget_statistics(sample_data, proportiontocut=proportiontocut)
+
+    assert list(stats.index) == ['floats', 'ints', 'wide_ints']
+    assert list(stats.columns) == ['mean', 'median', 'mode', 'trimmed_mean']
+    for column in stats.index:
+        series = sample_data[column].dropna()
+        assert stats.loc[column, 'mean'] == pytest.approx(series.mean())
+        assert stats.loc[column, 'median'] == pytest.approx(series.median())
+        assert stats.loc[column, 'mode'] == series.mode()[0]
+        assert stats.loc[column, 'trimmed_mean'] == pytest.approx(
+            trim_mean(series, proportiontocut=proportiontocut)
+        )
+
+
+def test_even_length_and_all_nan_columns():
+    values = np.array([[1.0, np.nan], [2.0, np.nan], [2.0, np.nan], [9.0, np.nan]])
+    result = central_tendency(values, proportiontocut=0.25)
+
+    assert result[0].tolist() == [3.5, 2.0, 2.0, 2.0]
+    assert np.isnan(result[1]).all()
+
+
+def test_proportion_too_big_raises():
+    with pytest.raises(ValueError):
+        central_tendency(np.arange(10.0), proportiontocut=0.5)
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import zscore
+from dataanalysistoolkit.statistical_analysis.outliers import detect_outliers, outlier_mask
+
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'a': rng.normal(0, 1, 500),
+        'b': rng.normal(100, 5, 500),
+        'c': rng.integers(0, 10, 500),
+        'label': ['x'] * 500,
+    })
+    df.loc[10, 'a'] = 25.0
+    df.loc[20, 'b'] = -300.0
+    df.loc[30, 'a'] = np.nan
+    return df
+
+
+def test_zscore_matches_scipy_without_nans():
+    values = np.array([1.0, 2.0, 3.0, 2.0, 1.0, 50.0])
+    expected = np.abs(zscore(values)) > 2
+    assert (outlier_mask(values, method='zscore', threshold=2) == expected).all()
+
+
+@pytest.mark.parametrize("method", ["zscore", "iqr", "mad"])
+def test_methods_flag_injected_outliers(sample_data, method):
+    mask = detect_outliers(sample_data, method=method)
+
+    assert list(mask.columns) == ['a', 'b', 'c']
+    assert mask.dtypes.eq(bool).all()
+    assert mask.loc[10, 'a']
+    assert mask.loc[20, 'b']
+    # Missing values are ignored rather than poisoning the whole column.
+    assert not mask.loc[30, 'a']
+    assert mask['a'].sum() < 20
+
+
+def test_isolation_method(sample_data):
+    pytest.importorskip("sklearn")
+    mask = detect_outliers(
+        sample_data, columns=['a'], method='isolation', random_state=0
+    )
+    assert mask.loc[10, 'a']
+    assert not mask.loc[30, 'a']
+
+
+def test_constant_and_empty_columns_have_no_outliers():
+    values = np.column_stack([np.ones(5), np.full(5, np.nan)])
+    for method in ("zscore", "iqr", "mad"):
+        assert not outlier_mask(values, method=method).any()
+
+
+def test_mad_falls_back_to_mean_absolute_deviation():
+    # More than half the values equal the median, so the MAD is 0.
+    values = np.array([5.0] * 20 + [6.0, 50.0, np.nan])
+    mask = outlier_mask(values, method='mad')
+    assert mask.tolist() == [False] * 21 + [True, False]
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        outlier_mask(np.arange(5.0), method='unknown')
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.statistical_analysis.profiler import (
+    DatasetProfiler,
+    HyperLogLog,
+    SpaceSaving,
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(50_000),
+            "price": rng.normal(100, 15, size=50_000),
+            # Zipf-like frequencies: 'c0' is the most common value.
+            "city": rng.choice([f"c{i}" for i in range(500)], size=50_000,
+                               p=1 / np.arange(1, 501) / np.sum(1 / np.arange(1, 501))),
+        }
+    )
+    df.loc[::10, "price"] = np.nan
+    return df
+
+
+def test_hyperloglog_estimate_and_merge():
+    values = pd.Series(np.arange(200_000))
+    left = HyperLogLog().update(values[:120_000])
+    right = HyperLogLog().update(values[80_000:])
+    assert left.estimate() == pytest.approx(120_000, rel=0.03)
+    assert left.merge(right).estimate() == pytest.approx(200_000, rel=0.03)
+    assert HyperLogLog().update(pd.Series([1, 2, 2, 3, None])).estimate() == pytest.approx(3, abs=0.1)
+    # Equal numbers hash equally whatever their type.
+    ints = HyperLogLog(p=10).update(pd.Series([1, 2, 3]))
+    floats = HyperLogLog(p=10).update(pd.Series([1.0, 2.0, 3.0]))
+    assert np.array_equal(ints.registers, floats.registers)
+    with pytest.raises(ValueError):
+        HyperLogLog(p=10).merge(HyperLogLog(p=12))
+
+
+def test_space_saving_finds_heavy_hitters(frame):
+    summary = SpaceSaving(capacity=50)
+    for start in range(0, len(frame), 5_000):
+        summary.update(frame["city"].iloc[start:start + 5_000])
+    exact = frame["city"].value_counts()
+    top = summary.top(3)
+    assert [value for value, _, _ in top] == exact.index[:3].tolist()
+    for value, count, error in top:
+        assert count - error <= exact[value] <= count
+
+
+def test_profile_matches_pandas(frame):
+    profile = DatasetProfiler(top_k=3).update(frame).profile()
+    assert profile.loc["price", "missing"] == frame["price"].isna().sum()
+    assert profile.loc["price", "count"] == frame["price"].count()
+    assert profile.loc["price", "mean"] == pytest.approx(frame["price"].mean())
+    assert profile.loc["price", "std"] == pytest.approx(frame["price"].std())
+    assert profile.loc["id", "max"] == 49_999
+    assert profile.loc["id", "distinct"] == pytest.approx(50_000, rel=0.03)
+    assert profile.loc["city", "distinct"] == pytest.approx(500, rel=0.03)
+    assert np.isnan(profile.loc["city", "mean"])
+    assert profile.loc["city", "top_values"][0] == ("c0", frame["city"].value_counts()["c0"])
+
+
+def test_chunked_and_merged_profiles_agree(frame):
+    whole = DatasetProfiler().update(frame).profile()
+    chunks = [frame.iloc[start:start + 7_000] for start in range(0, len(frame), 7_000)]
+    streamed = DatasetProfiler.from_chunks(chunks).profile()
+    merged = DatasetProfiler.from_chunks(chunks[:3]).merge(
+        DatasetProfiler.from_chunks(chunks[3:])
+    ).profile()
+    exact = ["count", "missing", "missing_fraction", "min", "max", "distinct"]
+    pd.testing.assert_frame_equal(streamed[exact], whole[exact])
+    pd.testing.assert_frame_equal(merged[exact], whole[exact])
+    assert merged.loc["price", "mean"] == pytest.approx(whole.loc["price", "mean"])
@@ -0,0 +1,69 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.statistical_analysis.quantile_sketch import KLLSketch
+
+
+def rank_error(values, qs, estimates):
+    """Largest distance between the requested and the achieved rank."""
+    sorted_values = np.sort(values)
+    ranks = np.searchsorted(sorted_values, estimates, side="right") / values.size
+    return np.max(np.abs(ranks - np.asarray(qs)))
+
+
+QS = [0.01, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+
+def test_small_input_is_exact():
+    sketch = KLLSketch(k=200, seed=0).update_batch([5, 1, 4, 2, 3, np.nan])
+    assert sketch.count == 5
+    assert sketch.quantiles([0, 0.5, 1]) == [1, 3, 5]
+    assert sketch.rank(3) == pytest.approx(0.6)
+
+
+def test_memory_is_bounded_and_error_small():
+    values = np.random.default_rng(0).lognormal(size=500_000)
+    sketch = KLLSketch(k=200, seed=0)
+    for chunk in np.array_split(values, 50):
+        sketch.update_batch(chunk)
+
+    assert sketch.count == values.size
+    assert sketch.retained < 2_000
+    assert rank_error(values, QS, sketch.quantiles(QS)) < 0.02
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_merged_partitions_and_serialization():
+    values = np.random.default_rng(1).normal(size=200_000)
+    partitions = [
+        KLLSketch.from_dict(json.loads(json.dumps(
+            KLLSketch(seed=i).update_batch(part).to_dict()
+        )))
+        for i, part in enumerate(np.array_split(values, 8))
+    ]
+    merged = KLLSketch(seed=0)
+    for partition in partitions:
+        merged.merge(partition)
+
+    assert merged.count == values.size
+    assert rank_error(values, QS, merged.quantiles(QS)) < 0.02
+    assert (partitions[0] + partitions[1]).count == partitions[0].count + partitions[1].count
+
+
+def test_from_chunks_reads_column():
+    chunks = [pd.DataFrame({'a': np.arange(i, i + 100)}) for i in range(0, 1000, 100)]
+    sketch = KLLSketch.from_chunks(chunks, column='a', seed=0)
+    assert sketch.count == 1000
+    assert abs(sketch.quantile(0.5) - 500) < 20
+
+
+def test_empty_and_invalid():
+    sketch = KLLSketch()
+    assert sketch.quantile(0.5) is None
+    with pytest.raises(ValueError):
+        KLLSketch(k=2)
+    with pytest.raises(ValueError):
+        KLLSketch().update_batch([1.0]).quantile(1.5)
@@ -0,0 +1,191 @@
+import pickle
+
+import numpy as np
+import pytest
+from dataanalysistoolkit.statistical_analysis.statistics_1 import (
+    RunningRegression,
+    RunningStatistics,
+    Statistics_1,
+)
+
+
+def test_running_statistics_match_numpy():
+    values = np.random.default_rng(1).normal(1e6, 3, 10_000)
+    running = RunningStatistics()
+    for value in values:
+        running.add_data(value)
+
+    assert running.count == values.size
+    assert running.mean() == pytest.approx(values.mean())
+    assert running.variance() == pytest.approx(values.var())
+    assert running.variance(ddof=1) == pytest.approx(values.var(ddof=1))
+    assert running.min == values.min()
+    assert running.max == values.max()
+
+
+def test_merge_equals_single_pass():
+    values = np.random.default_rng(2).exponential(5, 1_001)
+    parts = [RunningStatistics(chunk) for chunk in np.array_split(values, 7)]
+    merged = RunningStatistics()
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.count == values.size
+    assert merged.mean() == pytest.approx(values.mean())
+    assert merged.variance() == pytest.approx(values.var())
+    assert (parts[0] + parts[1]).count == parts[0].count + parts[1].count
+
+
+def test_state_round_trips_between_processes():
+    running = RunningStatistics([1, 2, 3, 4])
+    restored = RunningStatistics.from_dict(running.to_dict())
+    assert restored.variance() == running.variance()
+    assert pickle.loads(pickle.dumps(running)).mean() == running.mean()
+
+
+def test_empty_accumulator():
+    running = RunningStatistics()
+    assert running.mean() is None
+    assert running.variance() is None
+    assert running.merge(RunningStatistics()).count == 0
+
+
+def test_statistics_1_uses_running_statistics():
+    stats = Statistics_1([1, 2, 3, 4, 5, 5, 2])
+    stats.add_data(6)
+    values = [1, 2, 3, 4, 5, 5, 2, 6]
+
+    assert stats.mean() == pytest.approx(np.mean(values))
+    assert stats.variance() == pytest.approx(np.var(values))
+    assert stats.median() == np.median(values)
+
+
+def test_statistics_1_without_data_and_merge():
+    left = Statistics_1(keep_data=False)
+    right = Statistics_1(keep_data=False)
+    for value in range(10):
+        left.add_data(value)
+    for value in range(10, 15):
+        right.add_data(value)
+
+    merged = left.merge(right)
+    assert merged.data == []
+    assert merged.mean() == pytest.approx(7.0)
+    assert merged.standard_deviation() == pytest.approx(np.std(range(15)))
+
+
+@pytest.mark.parametrize("values", [[3.0], [4.0, 1.0], [5, 1, 4, 1, 5, 9, 2, 6, 5, 3]])
+def test_numpy_mode_matches_list_mode(values):
+    as_list = Statistics_1(list(values))
+    as_numpy = Statistics_1(use_numpy=True)
+    as_numpy.extend(values[:1])
+    for value in values[1:]:
+        as_numpy.add_data(value)
+
+    assert as_numpy.median() == as_list.median()
+    assert sorted(as_numpy.mode()) == sorted(as_list.mode())
+    assert as_numpy.mean() == pytest.approx(as_list.mean())
+    for q in (0.0, 0.25, 0.5, 0.9):
+        assert as_numpy.quantile(q) == as_list.quantile(q)
+        assert as_numpy.quantile_linear_interpolation(q) == pytest.approx(
+            as_list.quantile_linear_interpolation(q)
+        )
+    # Once sorted, the median comes from the cached view.
+    assert as_numpy.median() == as_list.median()
+
+
+def test_numpy_mode_caches_sorted_view_until_new_data():
+    stats = Statistics_1(use_numpy=True)
+    stats.extend(np.random.default_rng(3).normal(size=100_000))
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+    first = stats.quantiles(qs, interpolate=True)
+    cached = stats._sorted
+    assert stats.quantiles(qs, interpolate=True) == first
+    assert stats._sorted is cached
+    assert first == pytest.approx(np.quantile(stats.data, qs).tolist())
+
+    stats.extend([1e9])
+    assert stats._sorted is None
+    assert stats.quantile_linear_interpolation(1.0) == 1e9
+    assert stats.data.size == 100_001
+
+
+def test_approximate_quantile_without_keeping_data():
+    stats = Statistics_1(keep_data=False, sketch_k=200)
+    values = np.random.default_rng(4).uniform(size=50_000)
+    stats.extend(values[:10])
+    for value in values[10:1000]:
+        stats.add_data(value)
+    stats.extend(values[1000:])
+
+    assert stats.data == []
+    assert stats.approximate_quantile(0.5) == pytest.approx(0.5, abs=0.02)
+    with pytest.raises(ValueError):
+        Statistics_1([1, 2]).approximate_quantile(0.5)
+
+
+def test_merge_feeds_kept_values_into_the_sketch():
+    left = Statistics_1(keep_data=False, sketch_k=200)
+    left.extend(range(100))
+    left.merge(Statistics_1(list(range(100, 200))))
+    assert left.sketch.count == 200
+    assert left.approximate_quantile(0.5) == pytest.approx(100, abs=5)
+
+    with pytest.raises(ValueError):
+        left.merge(Statistics_1([1, 2], keep_data=False))
+    assert left.running.count == 200
+
+
+def test_assigning_data_resets_running_statistics():
+    stats = Statistics_1([1, 2, 3], sketch_k=200)
+    stats.data = [10, 20]
+    assert stats.mean() == 15
+    assert stats.running.count == 2
+    assert stats.sketch.count == 2
+    assert stats.median() == 15
+
+
+def test_non_numeric_data_keeps_order_statistics():
+    stats = Statistics_1(['b', 'a', 'b', 'b'])
+    stats.add_data('c')
+    assert stats.mode() == ['b']
+    assert stats.median() == 'b'
+    with pytest.raises(TypeError):
+        stats.mean()
+
+
+def test_running_regression_matches_least_squares():
+    rng = np.random.default_rng(5)
+    x = rng.uniform(1e6, 1e6 + 10, 2_000)
+    y = 3.0 * x - 2e6 + rng.normal(0, 0.5, x.size)
+    slope, intercept = np.polyfit(x, y, 1)
+    residuals = y - (slope * x + intercept)
+    residual_variance = residuals @ residuals / (x.size - 2)
+    sxx = ((x - x.mean()) ** 2).sum()
+
+    regression = RunningRegression(x[:500], y[:500])
+    for xi, yi in zip(x[500:1000], y[500:1000]):
+        regression.add(xi, yi)
+    regression.merge(RunningRegression.from_dict(RunningRegression(x[1000:], y[1000:]).to_dict()))
+
+    assert regression.count == x.size
+    assert regression.slope() == pytest.approx(slope, rel=1e-9)
+    assert regression.intercept() == pytest.approx(intercept, rel=1e-6)
+    assert regression.r_squared() == pytest.approx(np.corrcoef(x, y)[0, 1] ** 2)
+    slope_error, _ = regression.standard_errors()
+    assert slope_error == pytest.approx((residual_variance / sxx) ** 0.5)
+
+
+def test_simple_linear_regression_is_incremental():
+    stats = Statistics_1(keep_data=False)
+    assert stats.simple_linear_regression() == (None, None)
+    stats.add_paired_data(1, 2)
+    stats.extend_paired_data([2, 3, 4], [3, 6, 8])
+
+    assert stats.paired_data == []
+    assert stats.simple_linear_regression() == pytest.approx((2.1, -0.5))
+    constant = Statistics_1()
+    constant.extend_paired_data([1, 1], [2, 3])
+    with pytest.raises(ZeroDivisionError):
+        constant.simple_linear_regression()
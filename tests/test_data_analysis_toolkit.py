@@ -21,9 +21,13 @@ Raises:
     indicating which test failed and why.
 """
 
+import io
+import numpy as np
 import pytest
 import pandas as pd
 from dataanalysistoolkit import DataAnalysisToolkit
+from dataanalysistoolkit.data_analysis_toolkit import DROP
+from dataanalysistoolkit.interfaces import DataCache
 
 
 @pytest.fixture
@@ -94,3 +98,409 @@ def test_split_data(analyzer):
     X_train, X_test, y_train, y_test = analyzer.split_data("target_column")
     assert len(X_train) + len(X_test) == len(analyzer.data)
     assert len(y_train) + len(y_test) == len(analyzer.data)
+
+
+@pytest.fixture
+def large_csv(tmp_path):
+    """
+    Write a CSV file with numeric and categorical columns for streaming tests.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "A": rng.normal(10, 2, size=1000),
+            "B": rng.integers(0, 5, size=1000),
+            "C": rng.choice(["x", "y", "z"], size=1000),
+        }
+    )
+    df.loc[::97, "A"] = np.nan
+    df.loc[500, "A"] = 100.0
+    path = tmp_path / "large.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+def test_streaming_summary_statistics(large_csv):
+    """
+    Test that streaming summary statistics match the in-memory describe().
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    summary = streamer.get_summary_statistics()
+    expected = df.describe()
+    exact = ["count", "mean", "std", "min", "max"]
+    assert list(summary.index) == list(expected.index)
+    pd.testing.assert_frame_equal(summary.loc[exact], expected.loc[exact])
+    # Quartiles come from a quantile sketch; on 1000 rows it keeps every value.
+    pd.testing.assert_frame_equal(
+        summary.loc[["25%", "50%", "75%"], ["B"]],
+        expected.loc[["25%", "50%", "75%"], ["B"]],
+    )
+
+
+def test_streaming_detect_outliers(large_csv):
+    """
+    Test that streaming z-score outlier detection flags the injected outlier.
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    outliers = streamer.detect_outliers("A")
+    assert isinstance(outliers, pd.Series)
+    assert len(outliers) == len(df)
+    assert outliers[500]
+    assert outliers.sum() == 1
+
+
+def test_streaming_detect_outliers_with_text_columns(large_csv):
+    """
+    Test that streaming z-scores skip text columns by default and match the
+    in-memory result.
+    """
+    path, _ = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    outliers = streamer.detect_outliers()
+    assert list(outliers.columns) == ["A", "B"]
+    expected = DataAnalysisToolkit(str(path)).detect_outliers()
+    pd.testing.assert_frame_equal(outliers, expected)
+    with pytest.raises(ValueError):
+        streamer.detect_outliers("C")
+
+
+def test_streaming_budget_statistics(large_csv):
+    """
+    Test that streaming budget statistics match those of the full column.
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    statistics = streamer.calculate_budget_statistics("B")
+    assert statistics["mean"] == pytest.approx(df["B"].mean())
+    assert statistics["median"] == df["B"].median()
+    assert statistics["mode"] == df["B"].mode()[0]
+    with pytest.raises(ValueError):
+        streamer.calculate_budget_statistics("missing")
+
+
+def test_streaming_export_data(large_csv, tmp_path):
+    """
+    Test that streaming export writes every chunk with a single header.
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    out = tmp_path / "out.csv"
+    streamer.export_data(str(out))
+    pd.testing.assert_frame_equal(pd.read_csv(out), pd.read_csv(path))
+
+
+def test_export_data_to_path_and_buffer(large_csv, tmp_path):
+    """
+    Test that export_data accepts a pathlib.Path and an open text buffer.
+    """
+    path, _ = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    out = tmp_path / "out.csv"
+    streamer.export_data(out)
+    pd.testing.assert_frame_equal(pd.read_csv(out), pd.read_csv(path))
+
+    buffer = io.StringIO()
+    streamer.export_data(buffer)
+    buffer.seek(0)
+    pd.testing.assert_frame_equal(pd.read_csv(buffer), pd.read_csv(path))
+
+
+def test_load_data_with_cache(large_csv, tmp_path):
+    """
+    Test that load_data returns the same frame from the cache as from the CSV.
+    """
+    pytest.importorskip("pyarrow")
+    path, _ = large_csv
+    cache = DataCache(str(tmp_path / "cache"))
+    parsed = DataAnalysisToolkit.load_data(str(path), cache=cache)
+    cached = DataAnalysisToolkit.load_data(str(path), cache=cache)
+    pd.testing.assert_frame_equal(parsed, cached)
+    with pytest.raises(ValueError):
+        DataAnalysisToolkit.load_data(str(tmp_path / "missing.csv"), cache=cache)
+
+
+def test_helpers_are_created_lazily(large_csv):
+    """
+    Test that helper objects are only built on first access and rebuilt
+    after the data is replaced.
+    """
+    path, _ = large_csv
+    analyzer = DataAnalysisToolkit(str(path))
+    assert analyzer._imputer is None
+    assert analyzer._visualizer is None
+
+    imputer = analyzer.imputer
+    assert imputer is analyzer.imputer
+    assert imputer.data is analyzer.data
+
+    analyzer.data = analyzer.data.head(10)
+    assert analyzer.imputer is not imputer
+    assert analyzer.imputer.data is analyzer.data
+    assert analyzer.evaluator is None
+
+
+def test_column_metadata_is_cached_and_invalidated(large_csv):
+    """
+    Test that column metadata is computed once and refreshed by mutators and
+    by the data setter.
+    """
+    path, _ = large_csv
+    analyzer = DataAnalysisToolkit(str(path))
+    assert analyzer.missing_values is analyzer.missing_values
+    assert analyzer.missing_values["A"] > 0
+    assert analyzer.categorical_columns == ["C"]
+
+    analyzer.handle_missing_values("A", strategy="fill", fill_value=0)
+    assert analyzer.missing_values["A"] == 0
+
+    analyzer.encode_categorical_features()
+    assert analyzer.categorical_columns == []
+    assert "C" in analyzer.numerical_columns
+
+    analyzer.data = pd.DataFrame({"X": ["a", None]})
+    assert analyzer.categorical_columns == ["X"]
+    assert analyzer.missing_values["X"] == 1
+
+
+def test_detect_outliers_many_columns(large_csv):
+    """
+    Test that detect_outliers scores several columns at once and ignores
+    missing values, both in memory and in streaming mode.
+    """
+    path, _ = large_csv
+    in_memory = DataAnalysisToolkit(str(path)).detect_outliers(method="mad")
+    streamed = DataAnalysisToolkit(str(path), chunksize=64).detect_outliers(
+        ["A", "B"], method="mad"
+    )
+    assert list(in_memory.columns) == ["A", "B"]
+    assert in_memory.loc[500, "A"]
+    assert not in_memory.loc[0, "A"]
+    pd.testing.assert_frame_equal(in_memory, streamed)
+
+    zscores = DataAnalysisToolkit(str(path), chunksize=64).detect_outliers()
+    assert zscores["A"].sum() == 1
+
+
+def test_batch_budget_statistics(large_csv):
+    """
+    Test that calculate_budget_statistics returns a tidy frame for several
+    columns that agrees with the single-column results.
+    """
+    path, _ = large_csv
+    analyzer = DataAnalysisToolkit(str(path))
+    statistics = analyzer.calculate_budget_statistics()
+    assert list(statistics.index) == ["A", "B"]
+    single = analyzer.calculate_budget_statistics("B")
+    for name, value in single.items():
+        assert statistics.loc["B", name] == pytest.approx(value)
+
+    streamed = DataAnalysisToolkit(str(path), chunksize=64)
+    pd.testing.assert_frame_equal(
+        streamed.calculate_budget_statistics(["A", "B"]), statistics
+    )
+
+
+def test_approximate_quantiles(large_csv):
+    """
+    Test that approximate quantiles are close to the exact ones, in memory
+    and in streaming mode.
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    quantiles = streamer.approximate_quantiles("A", qs=[0.5, 0.95])
+    exact = df["A"].quantile([0.5, 0.95])
+    assert quantiles.tolist() == pytest.approx(exact.tolist(), rel=0.05)
+
+    both = DataAnalysisToolkit(str(path)).approximate_quantiles(["A", "B"])
+    assert list(both.columns) == ["A", "B"]
+    assert list(both.index) == [0.5, 0.95, 0.99]
+
+
+def test_encode_categorical_features_keeps_vocabulary(tmp_path):
+    """
+    Test that encoding produces compact codes and that a second file is
+    encoded with the vocabulary learned from the first.
+    """
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    pd.DataFrame({"city": ["b", "a", "b"], "n": [1, 2, 3]}).to_csv(first, index=False)
+    pd.DataFrame({"city": ["c", "b"], "n": [4, 5]}).to_csv(second, index=False)
+
+    toolkit = DataAnalysisToolkit(str(first))
+    encoder = toolkit.encode_categorical_features()
+    assert toolkit.data["city"].tolist() == [1, 0, 1]
+    assert toolkit.data["city"].dtype == np.int8
+    assert toolkit.categorical_columns == []
+
+    other = DataAnalysisToolkit(str(second))
+    other.encode_categorical_features(encoder=encoder)
+    assert other.data["city"].tolist() == [2, 1]
+
+
+def test_split_data_by_index(large_csv):
+    """
+    Test that the index-based split matches train_test_split on the full
+    frame, and that stratified and hash-based splits behave as documented.
+    """
+    from sklearn.model_selection import train_test_split
+
+    path, df = large_csv
+    analyzer = DataAnalysisToolkit(str(path))
+    X_train, X_test, y_train, y_test = analyzer.split_data("C", random_state=1)
+    expected = train_test_split(df.drop("C", axis=1), df["C"], test_size=0.2, random_state=1)
+    for actual, wanted in zip((X_train, X_test, y_train, y_test), expected):
+        pd.testing.assert_frame_equal(pd.DataFrame(actual), pd.DataFrame(wanted))
+
+    train_idx, test_idx = analyzer.split_data("C", stratify=True, random_state=0, return_indices=True)
+    assert len(train_idx) + len(test_idx) == len(df)
+    proportions = df["C"].iloc[test_idx].value_counts(normalize=True)
+    assert proportions.sub(df["C"].value_counts(normalize=True)).abs().max() < 0.02
+
+    train_idx, test_idx = analyzer.split_data("A", hash_column="C", return_indices=True)
+    assert set(df["C"].iloc[train_idx]).isdisjoint(df["C"].iloc[test_idx])
+    with pytest.raises(ValueError):
+        analyzer.split_data("A", stratify=True, hash_column="C")
+
+
+def test_streaming_export_to_parquet(large_csv, tmp_path):
+    """
+    Test that export_data infers the format from the file extension.
+    """
+    pytest.importorskip("pyarrow")
+    path, _ = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=256)
+    out = tmp_path / "out.parquet"
+    streamer.export_data(str(out), compression="zstd")
+    pd.testing.assert_frame_equal(pd.read_parquet(out), pd.read_csv(path))
+
+
+def test_handle_missing_values_for_many_columns(tmp_path):
+    """
+    Test that a mapping applies drops and fills to many columns at once.
+    """
+    path = tmp_path / "missing.csv"
+    pd.DataFrame({
+        "id": [1, None, 3, 4],
+        "key": ["a", "b", None, "d"],
+        "price": [None, 2.0, None, 4.0],
+        "city": ["x", None, "y", None],
+    }).to_csv(path, index=False)
+    analyzer = DataAnalysisToolkit(str(path))
+
+    analyzer.handle_missing_values({"id": DROP, "key": DROP, "price": 0, "city": "unknown"})
+    assert analyzer.data["id"].tolist() == [1, 4]
+    assert analyzer.data["price"].tolist() == [0, 4.0]
+    assert analyzer.data["city"].tolist() == ["x", "unknown"]
+    assert analyzer.missing_values.sum() == 0
+
+    # The string 'drop' is an ordinary fill value.
+    analyzer = DataAnalysisToolkit(str(path))
+    analyzer.handle_missing_values({"key": "drop", "city": DataAnalysisToolkit.DROP})
+    assert analyzer.data["key"].tolist() == ["a", "drop"]
+
+    with pytest.raises(ValueError):
+        analyzer.handle_missing_values({"missing_column": 0})
+    with pytest.raises(ValueError):
+        analyzer.handle_missing_values(["price"], strategy="fill")
+
+
+def test_drop_duplicates_by_hash_and_streaming(tmp_path):
+    """
+    Test hash-based deduplication in memory and across chunks of a file.
+    """
+    path = tmp_path / "dupes.csv"
+    df = pd.DataFrame({"id": [1, 2, 1, 3, 2, 4] * 50, "v": ["a", "b", "a", "c", "x", "d"] * 50})
+    df.to_csv(path, index=False)
+
+    analyzer = DataAnalysisToolkit(str(path))
+    analyzer.drop_duplicates(method="hash")
+    pd.testing.assert_frame_equal(analyzer.data, df.drop_duplicates())
+
+    out = tmp_path / "unique.csv"
+    DataAnalysisToolkit(str(path), chunksize=7).drop_duplicates(subset=["id"], output=str(out))
+    expected = df.drop_duplicates(subset=["id"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv(out), expected)
+    with pytest.raises(ValueError):
+        DataAnalysisToolkit(str(path), chunksize=7).drop_duplicates()
+
+
+def test_parallel_executor_gives_serial_results(large_csv):
+    """
+    Test that column-wise work gives the same results through an executor.
+    """
+    from dataanalysistoolkit.utils import ColumnExecutor
+
+    path, _ = large_csv
+    serial = DataAnalysisToolkit(str(path))
+    parallel = DataAnalysisToolkit(str(path), executor=ColumnExecutor(max_workers=2, batch_size=1))
+
+    pd.testing.assert_frame_equal(
+        parallel.detect_outliers(method="mad"), serial.detect_outliers(method="mad")
+    )
+    pd.testing.assert_frame_equal(
+        parallel.calculate_budget_statistics(), serial.calculate_budget_statistics()
+    )
+    parallel.encode_categorical_features()
+    serial.encode_categorical_features()
+    pd.testing.assert_frame_equal(parallel.data, serial.data)
+
+
+def test_optimize_memory_on_load(large_csv):
+    """
+    Test that the load-time option shrinks the frame and keeps the columns
+    usable by the rest of the toolkit.
+    """
+    path, df = large_csv
+    analyzer = DataAnalysisToolkit(str(path), optimize=True)
+    report = analyzer.memory_report
+
+    assert analyzer.data["B"].dtype == np.int8
+    assert report.loc["B", "bytes_saved"] > 0
+    assert report["bytes_after"].sum() < report["bytes_before"].sum()
+    assert analyzer.numerical_columns == ["A", "B"]
+    assert analyzer.categorical_columns == ["C"]
+    assert analyzer.calculate_budget_statistics("B")["mean"] == pytest.approx(df["B"].mean())
+
+
+def test_profile_data(large_csv):
+    """
+    Test that the single-pass profile agrees in memory and in streaming mode.
+    """
+    path, df = large_csv
+    profile = DataAnalysisToolkit(str(path)).profile_data(top_k=2)
+    streamed = DataAnalysisToolkit(str(path), chunksize=64).profile_data(top_k=2)
+    assert list(profile.index) == ["A", "B", "C"]
+    assert profile.loc["A", "missing"] == df["A"].isna().sum()
+    assert profile.loc["B", "distinct"] == 5
+    assert profile.loc["C", "top_values"] == list(df["C"].value_counts().head(2).items())
+    exact = ["count", "missing", "min", "max", "distinct"]
+    pd.testing.assert_frame_equal(streamed[exact], profile[exact])
+    # Frequent values are approximate across chunks, but exact for columns
+    # with fewer distinct values than the summary monitors.
+    assert streamed.loc[["B", "C"], "top_values"].equals(profile.loc[["B", "C"], "top_values"])
+
+
+def test_streaming_metadata_and_in_memory_methods(large_csv):
+    """
+    Test that the column metadata is computed chunk by chunk in streaming
+    mode, and that the methods that need the data in memory say so.
+    """
+    path, df = large_csv
+    streamer = DataAnalysisToolkit(str(path), chunksize=64)
+    assert streamer.shape == df.shape
+    assert streamer.column_names == ["A", "B", "C"]
+    pd.testing.assert_series_equal(streamer.dtypes, df.dtypes, check_dtype=False)
+    pd.testing.assert_series_equal(streamer.missing_values, df.isnull().sum())
+    assert streamer.numerical_columns == ["A", "B"]
+    assert streamer.categorical_columns == ["C"]
+    assert list(streamer.calculate_budget_statistics().index) == ["A", "B"]
+
+    for call in (
+        streamer.optimize_memory,
+        lambda: streamer.handle_missing_values("A"),
+        streamer.encode_categorical_features,
+        lambda: streamer.split_data("B"),
+    ):
+        with pytest.raises(ValueError, match="in memory"):
+            call()
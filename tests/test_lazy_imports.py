@@ -0,0 +1,46 @@
+"""test_lazy_imports.py
+
+Tests that importing the package does not eagerly import heavy optional
+dependencies, and that the lazily exported names still resolve.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import dataanalysistoolkit
+
+
+def test_import_does_not_load_heavy_modules():
+    """
+    Test that `import dataanalysistoolkit` leaves matplotlib, scikit-learn,
+    scipy, SQLAlchemy, requests and nltk unimported.
+    """
+    code = (
+        "import sys, dataanalysistoolkit; "
+        "heavy = ('matplotlib', 'seaborn', 'sklearn', 'scipy', 'sqlalchemy', "
+        "'requests', 'nltk'); "
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("name", dataanalysistoolkit.__all__)
+def test_public_names_resolve(name):
+    """
+    Test that every name in __all__ resolves to an object on first access.
+    """
+    assert getattr(dataanalysistoolkit, name).__name__ == name
+    assert name in dir(dataanalysistoolkit)
+
+
+def test_unknown_attribute_raises():
+    """
+    Test that unknown attributes still raise AttributeError.
+    """
+    with pytest.raises(AttributeError):
+        dataanalysistoolkit.NotAThing
@@ -0,0 +1,162 @@
+"""test_partitioned_toolkit.py
+
+Tests that PartitionedDataAnalysisToolkit gives the same results on a
+partitioned dataset as DataAnalysisToolkit gives on the whole file.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataanalysistoolkit.data_analysis_toolkit import DataAnalysisToolkit
+from dataanalysistoolkit.partitioned_toolkit import PartitionedDataAnalysisToolkit
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """
+    Write one CSV file and the same rows split into four CSV partitions.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "A": rng.normal(10, 2, size=800),
+        "B": rng.integers(0, 5, size=800),
+        "C": rng.choice(["x", "y", "z"], size=800),
+    })
+    df.loc[::37, "A"] = np.nan
+    df = pd.concat([df, df.iloc[:100]], ignore_index=True)
+    whole = tmp_path / "whole.csv"
+    df.to_csv(whole, index=False)
+    parts = tmp_path / "parts"
+    parts.mkdir()
+    for i, rows in enumerate(np.array_split(np.arange(len(df)), 4)):
+        df.iloc[rows].to_csv(parts / f"part-{i}.csv", index=False)
+    return whole, parts, df
+
+
+def test_statistics_match_whole_file(dataset):
+    whole, parts, df = dataset
+    toolkit = PartitionedDataAnalysisToolkit(str(parts), chunksize=64)
+    reference = DataAnalysisToolkit(str(whole))
+
+    assert len(toolkit.partitions) == 4
+    assert toolkit.shape == df.shape
+    assert toolkit.numerical_columns == ["A", "B"]
+    assert toolkit.categorical_columns == ["C"]
+    pd.testing.assert_series_equal(toolkit.missing_values, reference.missing_values)
+    summary = toolkit.get_summary_statistics()
+    exact = ["count", "mean", "std", "min", "max"]
+    pd.testing.assert_frame_equal(summary.loc[exact], reference.get_summary_statistics().loc[exact])
+    pd.testing.assert_series_equal(toolkit.detect_outliers("A"), reference.detect_outliers("A"))
+    pd.testing.assert_frame_equal(
+        toolkit.calculate_budget_statistics(["A", "B"]),
+        reference.calculate_budget_statistics(["A", "B"]),
+    )
+    with pytest.raises(ValueError):
+        toolkit.detect_outliers("missing")
+
+
+def test_cleaning_maps_over_partitions(dataset, tmp_path):
+    whole, parts, df = dataset
+    toolkit = PartitionedDataAnalysisToolkit(str(parts), workdir=str(tmp_path / "work"))
+    reference = DataAnalysisToolkit(str(whole))
+
+    for analyzer in (toolkit, reference):
+        analyzer.handle_missing_values({"A": analyzer.DROP, "C": "none"})
+        analyzer.drop_duplicates(method="hash")
+        analyzer.encode_categorical_features()
+
+    assert len(os.listdir(tmp_path / "work")) == 4
+    out = tmp_path / "clean.csv"
+    toolkit.export_data(str(out))
+    pd.testing.assert_frame_equal(
+        pd.read_csv(out), reference.data.reset_index(drop=True), check_dtype=False
+    )
+    # The source partitions are untouched.
+    assert len(pd.read_csv(parts / "part-0.csv")) == len(df) // 4
+
+
+def test_parquet_partitions_and_errors(dataset, tmp_path):
+    pytest.importorskip("pyarrow")
+    _, _, df = dataset
+    paths = []
+    for i, rows in enumerate(np.array_split(np.arange(len(df)), 3)):
+        paths.append(str(tmp_path / f"p{i}.parquet"))
+        df.iloc[rows].to_parquet(paths[-1])
+    toolkit = PartitionedDataAnalysisToolkit(paths)
+    assert toolkit.shape == df.shape
+    toolkit.encode_categorical_features()
+    assert toolkit.dtypes["C"] == np.int8
+
+    with pytest.raises(ValueError):
+        PartitionedDataAnalysisToolkit(str(tmp_path / "nothing-*.csv"))
+    workdir = toolkit.workdir
+    toolkit.cleanup()
+    assert not os.path.exists(workdir)
+
+
+def test_inherited_in_memory_methods_are_blocked(dataset):
+    _, parts, df = dataset
+    toolkit = PartitionedDataAnalysisToolkit(str(parts))
+    assert toolkit.memory_report is None
+    for call in (lambda: toolkit.data, toolkit.optimize_memory,
+                 lambda: toolkit.split_data("B", return_indices=True)):
+        with pytest.raises(ValueError, match="partitioned"):
+            call()
+
+
+def test_dtypes_are_combined_across_partitions(tmp_path):
+    pytest.importorskip("pyarrow")
+    pd.DataFrame({"n": [1, 2], "s": ["a", "b"]}).to_parquet(tmp_path / "p0.parquet")
+    pd.DataFrame({"n": [1.5, None], "s": ["c", "d"]}).to_parquet(tmp_path / "p1.parquet")
+    pd.DataFrame({"n": [3], "s": ["e"]}).to_csv(tmp_path / "p2.csv", index=False)
+    toolkit = PartitionedDataAnalysisToolkit(str(tmp_path))
+    assert toolkit.dtypes.to_dict() == {"n": np.float64, "s": object}
+    assert toolkit.numerical_columns == ["n"]
+
+
+def test_hive_partition_columns_round_trip(dataset, tmp_path):
+    pytest.importorskip("pyarrow")
+    _, parts, df = dataset
+    out = tmp_path / "by_b"
+    PartitionedDataAnalysisToolkit(str(parts)).export_data(
+        str(out), file_format="parquet", partition_cols=["B"]
+    )
+    toolkit = PartitionedDataAnalysisToolkit(str(out))
+    assert sorted(toolkit.column_names) == ["A", "B", "C"]
+    assert toolkit.dtypes["B"] == np.int64
+    result = pd.concat(toolkit.iter_chunks())
+    assert sorted(result["B"].unique().tolist()) == sorted(df["B"].unique().tolist())
+    pd.testing.assert_series_equal(
+        result.groupby("B")["A"].sum(), df.groupby("B")["A"].sum()
+    )
+    assert toolkit.calculate_budget_statistics(["B"]).loc["B", "mean"] == \
+        pytest.approx(df["B"].mean())
+
+
+@pytest.mark.parametrize("options", [
+    {"random_state": 0},
+    {"random_state": 0, "stratify": True},
+    {"hash_column": "A"},
+])
+def test_split_data_writes_partitioned_sets(dataset, options):
+    _, parts, df = dataset
+    toolkit = PartitionedDataAnalysisToolkit(str(parts))
+    train, test = toolkit.split_data("C", test_size=0.25, **options)
+
+    assert len(train.partitions) == len(test.partitions) == 4
+    assert train.shape[0] + test.shape[0] == len(df)
+    assert test.shape[0] == pytest.approx(0.25 * len(df), abs=0.05 * len(df))
+    combined = pd.concat([*train.iter_partitions(), *test.iter_partitions()])
+    pd.testing.assert_frame_equal(
+        combined.sort_values(["A", "B", "C"]).reset_index(drop=True),
+        df.sort_values(["A", "B", "C"]).reset_index(drop=True),
+    )
+    if options.get("stratify"):
+        proportions = test.profile_data().loc["C", "top_values"]
+        assert {value for value, _ in proportions} == {"x", "y", "z"}
+
+    workdir = train.workdir
+    del train
+    assert not os.path.exists(workdir)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from threadpoolctl import threadpool_info
+from dataanalysistoolkit.statistical_analysis.descriptive import budget_statistics
+from dataanalysistoolkit.statistical_analysis.outliers import detect_outliers
+from dataanalysistoolkit.utils.parallel import ColumnExecutor
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(500, 23)), columns=[f"c{i}" for i in range(23)])
+
+
+def test_batches_cover_columns_in_order():
+    executor = ColumnExecutor(max_workers=2)
+    batches = executor.batches(range(23))
+    assert [c for batch in batches for c in batch] == list(range(23))
+    assert len(batches) == 8
+    assert ColumnExecutor(batch_size=10).batches(range(23))[-1] == [20, 21, 22]
+    with pytest.raises(ValueError):
+        ColumnExecutor(backend="gpu")
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_map_columns_matches_serial(frame, backend):
+    columns = frame.columns.tolist()
+    with ColumnExecutor(max_workers=3, backend=backend) as executor:
+        stats = pd.concat(executor.map_columns(budget_statistics, frame, columns))
+        mask = pd.concat(
+            executor.map_columns(detect_outliers, frame, columns, method="iqr"), axis=1
+        )
+    pd.testing.assert_frame_equal(stats, budget_statistics(frame, columns))
+    pd.testing.assert_frame_equal(mask, detect_outliers(frame, columns, method="iqr"))
+
+
+def test_blas_threads_are_limited_while_running(frame):
+    seen = []
+
+    def record(data, columns):
+        seen.append([info["num_threads"] for info in threadpool_info()])
+        return data[columns]
+
+    ColumnExecutor(max_workers=2, blas_threads=1).map_columns(record, frame, frame.columns)
+    assert seen and all(threads == 1 for batch in seen for threads in batch)